@@ -1,14 +1,4 @@
 from splore_sdk import SploreSDK
-import multiprocessing
-
-
-def extract_data(api_key, base_id, agent_id, file_path):
-    sdk = SploreSDK(api_key=api_key, base_id=base_id)
-    extraction_agent = sdk.init_agent(agent_id=agent_id)
-    extracted_data = extraction_agent.extract(file_path=file_path)
-    print("=========================================")
-    print("File Path:", file_path)
-    print("Extracted Data:", extracted_data)
 
 
 if __name__ == "__main__":
@@ -16,12 +6,14 @@ if __name__ == "__main__":
     base_id = "YOUR_BASE_ID"
     agent_id = "YOUR_AGENT_ID"
     file_paths = ["absolute_file_path1", "absolute_file_path2"]
-    processes = []
-    for file_path in file_paths:
-        p = multiprocessing.Process(
-            target=extract_data, args=(api_key, base_id, agent_id, file_path)
-        )
-        processes.append(p)
-        p.start()
-    for p in processes:
-        p.join()
+
+    # one SDK instance shares its connection pool and uploader across the batch
+    with SploreSDK(api_key=api_key, base_id=base_id) as sdk:
+        extraction_agent = sdk.init_agent(agent_id=agent_id)
+        for result in extraction_agent.extract_many(file_paths, max_concurrency=4):
+            print("=========================================")
+            print("File Path:", result.input)
+            if result.ok:
+                print("Extracted Data:", result.result)
+            else:
+                print("Extraction Failed:", result.error)
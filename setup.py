@@ -38,6 +38,7 @@ setup(
         "pydantic>=1.10.8,<2.0.0",
         "markdown>=3.4.4",
         "tuspy>=1.1.0",
+        "aiohttp>=3.8.0",
     ],
     extras_require={
         "test": ["pytest>=7.0.0,<8.0.0", "pytest-mock>=3.0.0", "flake8>=5.0.0"],
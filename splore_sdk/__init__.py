@@ -1,4 +1,5 @@
 from .sdk import SploreSDK, AgentSDK
+from .async_sdk import AsyncSploreSDK, AsyncAgentSDK
 
 try:
     from importlib.metadata import version, PackageNotFoundError
@@ -10,4 +11,10 @@ try:
 except PackageNotFoundError:
     __version__ = "unknown"
 
-__all__ = ["SploreSDK", "AgentSDK", "__version__"]
+__all__ = [
+    "SploreSDK",
+    "AgentSDK",
+    "AsyncSploreSDK",
+    "AsyncAgentSDK",
+    "__version__",
+]
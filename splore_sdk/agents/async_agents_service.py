@@ -0,0 +1,25 @@
+from typing import Optional
+from splore_sdk.core.async_api_client import AsyncAPIClient
+from .agents_service import AgentService
+from .validations import CreateAgentInput, UpdateAgentInput
+
+
+class AsyncAgentService(AgentService):
+    """asyncio version of :class:`AgentService`."""
+
+    def __init__(self, api_client: AsyncAPIClient):
+        super().__init__(api_client)
+
+    async def create_agent(self, agent_payload: CreateAgentInput):
+        return await super().create_agent(agent_payload)
+
+    async def update_agent(self, agent_payload: UpdateAgentInput):
+        return await super().update_agent(agent_payload)
+
+    async def get_agents(
+        self, agentId: Optional[str] = None, agentName: Optional[str] = None
+    ):
+        return await super().get_agents(agentId=agentId, agentName=agentName)
+
+    async def delete_agents(self, agentId: str):
+        return await super().delete_agents(agentId)
@@ -0,0 +1,428 @@
+import time
+from typing import IO, Optional, Dict
+from splore_sdk.core.async_api_client import AsyncAPIClient
+from splore_sdk.core.cancellation import CancellationToken
+from splore_sdk.core.deadline import Deadline, resolve_deadline
+from splore_sdk.core.exceptions import CancelledError
+from splore_sdk.core.logger import sdk_logger
+from splore_sdk.extractions.async_extractions_service import AsyncExtractionService
+from splore_sdk.search.async_search_service import AsyncSearchService
+from splore_sdk.agents.async_agents_service import AsyncAgentService
+from splore_sdk.utils.file_uploader import FileUploader
+from splore_sdk.utils.decorators import async_poll_with_timeout
+from splore_sdk.utils.poll_strategy import (
+    DEFAULT_EXTRACTION_POLL_STRATEGY,
+    PollStrategy,
+)
+
+
+class AsyncBaseSDK:
+    """
+    asyncio counterpart of :class:`splore_sdk.sdk.BaseSDK`.
+
+    The API key cannot be validated from ``__init__`` without blocking, so it is
+    validated when the SDK is entered as an async context manager, or explicitly
+    through :meth:`validate_api_key`.
+
+    Example:
+        >>> async with AsyncSploreSDK(api_key="...", base_id="...") as sdk:
+        ...     agent = sdk.init_agent(agent_id="...")
+        ...     result = await agent.extract(file_path="invoice.pdf")
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_id: str,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        client: Optional[AsyncAPIClient] = None,
+    ):
+        self.logger = sdk_logger
+
+        if not api_key:
+            raise ValueError("API Key is required to initialize SDK.")
+        self.base_id = base_id
+        self.api_key = api_key
+        self.user_id = user_id
+        self.agent_id = agent_id
+        self.client = client or AsyncAPIClient(
+            api_key=self.api_key, base_id=base_id, agent_id=agent_id
+        )
+        self.file_uploader = FileUploader(
+            api_key=self.api_key, base_id=self.base_id, user_id=self.user_id
+        )
+        self.logger.info(
+            f"Async SDK initialized with base_id: {self.base_id} and agent_id: {self.agent_id}"
+        )
+
+    async def validate_api_key(self):
+        try:
+            await self.client.validate_api_key()
+        except Exception as e:
+            self.logger.debug(f"API Key validation failed: {e}")
+            raise ValueError("API Key validation failed")
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        await self.client.close()
+
+    async def __aenter__(self):
+        await self.validate_api_key()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class AsyncSploreSDK(AsyncBaseSDK):
+    def __init__(self, api_key: str, base_id: str, user_id: Optional[str] = None):
+        super().__init__(api_key, base_id, user_id)
+        self.agents = AsyncAgentService(self.client)
+
+    async def get_agents(
+        self, agentId: Optional[str] = None, agentName: Optional[str] = None
+    ):
+        """Fetch the list of agents related to the base."""
+        return await self.agents.get_agents(agentId=agentId, agentName=agentName)
+
+    def init_agent(self, agent_id: str) -> "AsyncAgentSDK":
+        """
+        Initialize and return an agent-specific instance.
+
+        The agent sends its requests through this SDK's HTTP session, which
+        stays open until this SDK is closed.
+
+        Args:
+            agent_id (str): The ID of the agent to initialize.
+
+        Returns:
+            AsyncAgentSDK: An instance of AsyncAgentSDK specific to the given agent ID.
+        """
+        if not agent_id:
+            raise ValueError("Agent ID is required to initialize an agent.")
+        self.logger.info(f"Initializing agent with ID: {agent_id}")
+        return AsyncAgentSDK(
+            api_key=self.api_key,
+            base_id=self.base_id,
+            agent_id=agent_id,
+            client=self.client.for_agent(agent_id),
+        )
+
+
+class AsyncExtractionCapability:
+    """asyncio extraction capability for agents"""
+
+    def __init__(
+        self,
+        client: AsyncAPIClient,
+        agent_id: str,
+        file_uploader: FileUploader,
+        logger=None,
+        poll_strategy: Optional[PollStrategy] = None,
+    ):
+        self.client = client
+        self.agent_id = agent_id
+        self.logger = logger or sdk_logger
+        self.service = AsyncExtractionService(client, agent_id=agent_id)
+        self.file_uploader = file_uploader
+        self.poll_strategy = poll_strategy or DEFAULT_EXTRACTION_POLL_STRATEGY
+
+    async def extract(
+        self,
+        file_path: Optional[str] = None,
+        file_stream: Optional[IO] = None,
+        max_poll_timeout: Optional[float] = 1200,  # 20 minutes
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict:
+        """
+        Run the extraction pipeline for the agent by uploading a file.
+
+        Args:
+            file_path (Optional[str], optional): Local file path.
+            file_stream (Optional[IO], optional): File object/blob.
+            max_poll_timeout (Optional[float], optional): Timeout of each polling phase.
+            deadline (Optional[Deadline], optional): End-to-end budget for the polls
+                and API calls of the extraction.
+            poll_strategy (Optional[PollStrategy], optional): Overrides the
+                capability's poll schedule for this file.
+            cancellation (Optional[CancellationToken], optional): Stops the
+                extraction, waking a sleeping poll right away.
+            timeout (Optional[float], optional): Total budget in seconds shared by
+                all phases, shorthand for ``deadline=Deadline(timeout)``.
+
+        Raises:
+            ValueError: If neither file_path nor file_stream is provided, or
+                both deadline and timeout are.
+            CancelledError: If ``cancellation`` is cancelled first, with the
+                file_id and extraction_id reached so far.
+
+        Returns:
+            Dict: Extracted response data from the file.
+        """
+        if not (file_path or file_stream):
+            raise ValueError("One of file_path or file_stream must be provided.")
+        if not self.agent_id:
+            raise ValueError("Agent ID is required for extraction flow.")
+
+        self.logger.info(f"Starting extraction task for file: {file_path or 'stream'}")
+
+        deadline = resolve_deadline(deadline, timeout)
+        poll_strategy = poll_strategy or self.poll_strategy
+        phase_durations: Dict[str, float] = {}
+        phase_started_at = time.monotonic()
+
+        def end_phase(phase: str):
+            nonlocal phase_started_at
+            now = time.monotonic()
+            phase_durations[phase] = now - phase_started_at
+            phase_started_at = now
+
+        self.service.set_agent(agent_id=self.agent_id)
+        if cancellation is not None:
+            cancellation.check("Extraction")
+        upload_res = await self.file_uploader.upload_file_async(
+            file_path=file_path, file_stream=file_stream, deadline=deadline
+        )
+        self.logger.info(f"File upload completed with file_id: {upload_res}")
+        end_phase("upload")
+
+        @async_poll_with_timeout(
+            condition=lambda resp: resp.get("fileProcessingStatus") == "INDEXED",
+            max_timeout=deadline.clamp(max_poll_timeout),
+            strategy=poll_strategy,
+            cancellation=cancellation,
+        )
+        async def check_indexing_status():
+            resp = await self.service.processing_status(
+                file_id=upload_res, deadline=deadline
+            )
+            if resp.get("fileProcessingStatus") != "INDEXED":
+                self.logger.info("File indexing not completed, waiting...")
+            return resp
+
+        try:
+            await check_indexing_status()
+            if cancellation is not None:
+                cancellation.check("Extraction")
+        except CancelledError as e:
+            raise CancelledError(str(e), file_id=upload_res) from None
+        end_phase("indexing")
+
+        extraction_resp = await self.service.start(
+            file_id=upload_res, deadline=deadline
+        )
+        if extraction_resp is None:
+            raise Exception("Extraction Failed")
+        extraction_id = extraction_resp.get("extractionId", None)
+        self.logger.info(f"File extraction started with extractionId: {extraction_id}")
+        end_phase("start")
+
+        try:
+            extracted_resp = await self._wait_for_extraction(
+                extraction_id, 1, max_poll_timeout, deadline, poll_strategy, cancellation
+            )
+        except CancelledError as e:
+            raise CancelledError(
+                str(e),
+                file_id=upload_res,
+                extraction_id=e.extraction_id,
+                version=e.version,
+            ) from None
+        end_phase("extraction")
+        self.logger.info(
+            f"Extraction took {deadline.elapsed():.1f}s ("
+            + ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in phase_durations.items())
+            + ")"
+        )
+        return extracted_resp
+
+    async def retry_extraction(
+        self,
+        extraction_id: str,
+        max_poll_timeout: Optional[float] = 1200,
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.logger.info(
+            f"Starting extraction retry task for extraction ID: {extraction_id}"
+        )
+
+        deadline = resolve_deadline(deadline, timeout)
+        if cancellation is not None:
+            cancellation.check("Extraction retry", extraction_id=extraction_id)
+        extraction_resp = await self.service.start_extraction_by_extraction_id(
+            extraction_id=extraction_id, deadline=deadline
+        )
+        if extraction_resp is None:
+            raise Exception("Extraction Failed")
+        version = extraction_resp.get("version", 1)
+        return await self._wait_for_extraction(
+            extraction_id,
+            version,
+            max_poll_timeout,
+            deadline,
+            poll_strategy or self.poll_strategy,
+            cancellation,
+        )
+
+    async def _wait_for_extraction(
+        self,
+        extraction_id: str,
+        version: int,
+        max_poll_timeout: float,
+        deadline: Deadline,
+        poll_strategy: PollStrategy,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> Dict:
+        @async_poll_with_timeout(
+            condition=lambda resp: resp.get("file", {}).get("status") == "COMPLETED",
+            max_timeout=deadline.clamp(max_poll_timeout),
+            strategy=poll_strategy,
+            cancellation=cancellation,
+        )
+        async def check_and_get_extracted_response():
+            resp = await self.service.extracted_response_by_extraction_id(
+                extraction_id=extraction_id, version=version, deadline=deadline
+            )
+            if resp.get("file", {}).get("status") != "COMPLETED":
+                self.logger.info(
+                    f"File extraction not completed, status: {resp.get('file', {}).get('status')}, waiting..."
+                )
+            return resp
+
+        try:
+            extracted_resp = await check_and_get_extracted_response()
+        except CancelledError as e:
+            raise CancelledError(
+                str(e), extraction_id=extraction_id, version=version
+            ) from None
+        self.logger.info("File extraction completed")
+        return extracted_resp
+
+
+class AsyncSearchCapability:
+    """asyncio search capability for agents"""
+
+    def __init__(self, client: AsyncAPIClient, agent_id: str, logger=None):
+        self.client = client
+        self.agent_id = agent_id
+        self.logger = logger or sdk_logger
+        self.service = AsyncSearchService(client, agent_id=agent_id)
+
+    async def search(
+        self, query: str, count: Optional[int] = 10, engine: Optional[str] = "google"
+    ) -> Dict:
+        """
+        Perform a search query using the specified parameters.
+
+        Args:
+            query (str): The search query string.
+            count (Optional[int], optional): Number of results to return. Defaults to 10.
+            engine (Optional[str], optional): Search engine to use. Defaults to "google".
+
+        Returns:
+            Dict: The search results from the API.
+        """
+        if not self.agent_id:
+            raise ValueError("Agent ID is required for search query.")
+
+        self.service.set_agent(agent_id=self.agent_id)
+        self.logger.info(
+            f"Starting search query for agent {self.agent_id}, query: {query}"
+        )
+        search_results = await self.service.search(
+            query=query, count=count, engine=engine
+        )
+        self.logger.info("Search query completed")
+        return search_results
+
+    async def get_history(
+        self, page: Optional[int] = 0, size: Optional[int] = 10
+    ) -> Dict:
+        """
+        Get search history for the current agent.
+
+        Args:
+            page (Optional[int], optional): Page number for pagination. Defaults to 0.
+            size (Optional[int], optional): Number of results per page. Defaults to 10.
+
+        Returns:
+            Dict: The search history from the API.
+        """
+        if not self.agent_id:
+            raise ValueError("Agent ID is required for search history.")
+
+        self.service.set_agent(agent_id=self.agent_id)
+        return await self.service.get_search_history(page=page, size=size)
+
+
+class AsyncAgentSDK(AsyncBaseSDK):
+    def __init__(
+        self,
+        api_key: str,
+        base_id: str,
+        agent_id: str,
+        client: Optional[AsyncAPIClient] = None,
+    ):
+        super().__init__(api_key, base_id, agent_id=agent_id, client=client)
+
+        self._extraction = AsyncExtractionCapability(
+            self.client, agent_id, self.file_uploader, self.logger
+        )
+        self._search = AsyncSearchCapability(self.client, agent_id, self.logger)
+        self.extractions = AsyncExtractionService(self.client, agent_id=agent_id)
+
+    @property
+    def extraction(self) -> AsyncExtractionCapability:
+        """Access to extraction capabilities"""
+        return self._extraction
+
+    @property
+    def search(self) -> AsyncSearchCapability:
+        """Access to search capabilities"""
+        return self._search
+
+    async def extract(
+        self,
+        file_path: Optional[str] = None,
+        file_stream: Optional[IO] = None,
+        max_poll_timeout: Optional[float] = 1200,
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict:
+        """Run the full upload and extraction flow for a single file."""
+        if file_path is None and file_stream is None:
+            raise ValueError("One of file_path or file_stream must be provided.")
+        return await self.extraction.extract(
+            file_path=file_path,
+            file_stream=file_stream,
+            max_poll_timeout=max_poll_timeout,
+            deadline=deadline,
+            poll_strategy=poll_strategy,
+            cancellation=cancellation,
+            timeout=timeout,
+        )
+
+    async def search_query(
+        self, query: str, count: Optional[int] = 10, engine: Optional[str] = "google"
+    ) -> Dict:
+        """Perform a search query with the agent."""
+        if self.agent_id is None:
+            raise ValueError("Agent ID is required for search query.")
+        return await self.search.search(query=query, count=count, engine=engine)
+
+    async def get_search_history(
+        self, page: Optional[int] = 0, size: Optional[int] = 10
+    ) -> Dict:
+        """Fetch the search history of the agent."""
+        if self.agent_id is None:
+            raise ValueError("Agent ID is required for search history.")
+        return await self.search.get_history(page=page, size=size)
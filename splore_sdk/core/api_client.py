@@ -1,13 +1,33 @@
+import copy
 import threading
-from typing import Optional
+import time
+from typing import Dict, Optional
 import requests
-from .exceptions import APIError
+from requests.adapters import HTTPAdapter
+from .exceptions import APIError, DeadlineExceededError
 from .logger import sdk_logger
-from .constants import BASE_URL
-from splore_sdk.utils.decorators.retry_with_backoff import retry_with_backoff
+from .constants import (
+    BASE_URL,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+)
+from .deadline import Deadline, Timeout
+from .retry_policy import RetryPolicy, IDEMPOTENCY_HEADER
+from .rate_limiter import RateLimiter, RateLimit
 
 
 class APIClient:
+    """
+    Blocking HTTP client for the Splore REST API.
+
+    A single ``requests.Session`` (and therefore a single urllib3 connection
+    pool) is shared by every thread using the client, so the number of open
+    sockets is bounded by ``pool_maxsize`` rather than by the number of worker
+    threads. Call :meth:`close` (or use the client as a context manager) to
+    release the pooled connections.
+    """
+
     def __init__(
         self,
         api_key: str,
@@ -15,45 +35,205 @@ class APIClient:
         agent_id: Optional[str] = None,
         base_url: Optional[str] = None,
         session: Optional[requests.Session] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        timeout: Optional[Timeout] = DEFAULT_TIMEOUT,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limits: Optional[Dict[str, RateLimit]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
+        """
+        Args:
+            api_key (str): The API key for the Splore base.
+            base_id (str): The base id of the Splore base.
+            agent_id (Optional[str]): The agent id used by agent scoped services.
+            base_url (Optional[str]): Overrides the Splore API url.
+            session (Optional[requests.Session]): A caller owned session to use
+                instead of the pooled one. It is not closed by :meth:`close`.
+            pool_connections (int): Number of host pools to cache.
+            pool_maxsize (int): Maximum number of keep-alive connections per host.
+            pool_block (bool): Whether threads should wait for a free connection
+                instead of opening a throwaway one once the pool is exhausted.
+            timeout (Optional[Timeout]): Default ``(connect, read)`` timeout in
+                seconds for every request, can be overridden per request.
+            retry_policy (Optional[RetryPolicy]): Decides which failures are retried,
+                defaults to ``RetryPolicy()``.
+            rate_limits (Optional[Dict[str, RateLimit]]): Enables client side rate
+                limiting with these per endpoint family limits, shared by every
+                client of the same ``base_id`` in the process.
+            rate_limiter (Optional[RateLimiter]): An explicit limiter to use instead.
+        """
         self.api_key = api_key
         self.agent_id = agent_id
         self.base_id = base_id
         self.base_url = base_url if base_url else BASE_URL
         self.logger = sdk_logger
-        self._thread_local = threading.local()
-        if session is not None:
-            self._thread_local.session = session
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        if rate_limiter is None and rate_limits is not None:
+            rate_limiter = RateLimiter.shared(base_id, rate_limits)
+        self.rate_limiter = rate_limiter
+        self._session_lock = threading.Lock()
+        self._session = session
+        self._owns_session = session is None
         self.logger.debug(
             f"api client initialised with api_key: ${self.api_key}, base_url: ${base_url}"
         )
 
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
     def set_session(self, session: requests.Session):
-        """Set a thread-local session for this client."""
-        self._thread_local.session = session
+        """Set the session shared by all threads using this client."""
+        with self._session_lock:
+            self._session = session
+            self._owns_session = False
 
     def get_session(self) -> requests.Session:
-        """Get the thread-local session, or create one if not set."""
-        if not hasattr(self._thread_local, "session"):
-            self._thread_local.session = requests.Session()
-        return self._thread_local.session
+        """Get the shared session, or create the pooled one if not set."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                    self._owns_session = True
+        return self._session
+
+    def for_agent(self, agent_id: str) -> "APIClient":
+        """
+        A client scoped to another agent of the base.
+
+        It sends its requests through this client's session, retry policy and
+        rate limiter, and closing it leaves the session open.
+        """
+        client = copy.copy(self)
+        client.agent_id = agent_id
+        client._session_lock = threading.Lock()
+        client.set_session(self.get_session())
+        return client
+
+    def close(self):
+        """Close the pooled session and release its connections."""
+        with self._session_lock:
+            session, self._session = self._session, None
+            owns_session = self._owns_session
+        if session is not None and owns_session:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
-    @retry_with_backoff(max_retries=3, backoff_factor=0.5)
     def validate_api_key(self):
         """Validate the API key."""
         return self.request(method="GET", endpoint="api/rest/v2/authenticate")
 
-    @retry_with_backoff(max_retries=3, backoff_factor=0.5)
-    def request(self, method: str, endpoint: str, **kwargs):
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs,
+    ):
+        """
+        Send a request to the Splore API, retrying transient failures.
+
+        Retries are driven by the client's :class:`RetryPolicy`: 4xx responses
+        fail fast, ``Retry-After`` is honored on 429/503, and POSTs are only
+        retried when an ``idempotency_key`` is given.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Path relative to ``base_url``.
+            deadline (Optional[Deadline]): Budget the request and its retries must fit in.
+            idempotency_key (Optional[str]): Sent as ``Idempotency-Key`` so retried
+                POSTs are de-duplicated by the server.
+            **kwargs: Passed to ``requests.Session.request``.
+
+        Raises:
+            APIError: When the request fails and is not (or no longer) retryable.
+            DeadlineExceededError: When the deadline passes before a response.
+        """
         headers = kwargs.pop("headers", {})
         headers["X-API-KEY"] = self.api_key
+        if idempotency_key:
+            headers[IDEMPOTENCY_HEADER] = idempotency_key
         url = f"{self.base_url}/{endpoint}"
+        timeout = kwargs.pop("timeout", self.timeout)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return self._send(
+                    method, endpoint, url, headers, timeout, deadline, **kwargs
+                )
+            except APIError as e:
+                if not self.retry_policy.should_retry(
+                    attempt, method, headers, e.status_code
+                ):
+                    raise
+                sleep_time = self.retry_policy.sleep_time(
+                    attempt, e.status_code, e.headers
+                )
+                remaining = deadline.remaining() if deadline is not None else None
+                if remaining is not None and sleep_time >= remaining:
+                    raise DeadlineExceededError(
+                        f"Deadline of {deadline.timeout} seconds exceeded while retrying {method.upper()} {endpoint}"
+                    ) from e
+                self.logger.warning(
+                    f"api with endpoint: {endpoint}, {method.upper()} attempt {attempt} failed: {e}. Retrying in {sleep_time:.2f}s"
+                )
+                time.sleep(sleep_time)
+
+    def _record_response(self, method: str, endpoint: str, response):
+        if self.rate_limiter is None:
+            return
+        self.rate_limiter.on_response(
+            method,
+            endpoint,
+            response.status_code,
+            self.retry_policy.retry_after(response.status_code, response.headers),
+        )
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        headers: dict,
+        timeout: Optional[Timeout],
+        deadline: Optional[Deadline],
+        **kwargs,
+    ):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, endpoint, deadline)
+        if deadline is not None:
+            deadline.check(f"{method.upper()} {endpoint}")
+            timeout = deadline.clamp_timeout(timeout)
         try:
             self.logger.debug(
                 f"api with url: {url}, method: {method} \n headers: {headers} \n started"
             )
             session = self.get_session()
-            response = session.request(method, url, headers=headers, **kwargs)
+            response = session.request(
+                method, url, headers=headers, timeout=timeout, **kwargs
+            )
+            self._record_response(method, endpoint, response)
             response.raise_for_status()
             self.logger.info(
                 f"api with endpoint: {endpoint}, {method.upper()} succeeded"
@@ -66,7 +246,10 @@ class APIClient:
                 )
                 return response.text
         except requests.exceptions.RequestException as e:
-            self.logger.error(
-                f"api with endpoint: {endpoint}, {method.upper()} failed", str(e)
+            self.logger.error(f"api with endpoint: {endpoint}, {method.upper()} failed: {e}")
+            response = getattr(e, "response", None)
+            raise APIError(
+                f"API Request {url}, method: {method} failed",
+                status_code=getattr(response, "status_code", None),
+                headers=getattr(response, "headers", None),
             )
-            raise APIError(f"API Request {url}, method: {method} failed")
@@ -0,0 +1,235 @@
+import asyncio
+import copy
+import json
+from typing import Dict, Optional
+import aiohttp
+from .exceptions import APIError, DeadlineExceededError
+from .logger import sdk_logger
+from .constants import BASE_URL, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+from .deadline import Deadline
+from .retry_policy import RetryPolicy, IDEMPOTENCY_HEADER
+from .rate_limiter import RateLimiter, RateLimit
+
+
+class AsyncAPIClient:
+    """
+    asyncio counterpart of :class:`splore_sdk.core.api_client.APIClient`.
+
+    ``request()`` accepts the same arguments as the blocking client (``params``,
+    ``json``, ``data``, ``files`` and ``headers``) and resolves to the same
+    parsed JSON (or raw text) response, so the service classes work unchanged
+    on top of it.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_id: str,
+        agent_id: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limits: Optional[Dict[str, RateLimit]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.api_key = api_key
+        self.agent_id = agent_id
+        self.base_id = base_id
+        self.base_url = base_url if base_url else BASE_URL
+        self.logger = sdk_logger
+        self._session = session
+        # client whose session this one sends through, see for_agent()
+        self._parent: Optional["AsyncAPIClient"] = None
+        self.timeout = timeout or aiohttp.ClientTimeout(
+            sock_connect=DEFAULT_CONNECT_TIMEOUT, sock_read=DEFAULT_READ_TIMEOUT
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        if rate_limiter is None and rate_limits is not None:
+            rate_limiter = RateLimiter.shared(base_id, rate_limits)
+        self.rate_limiter = rate_limiter
+        self.logger.debug(
+            f"async api client initialised with api_key: ${self.api_key}, base_url: ${base_url}"
+        )
+
+    def set_session(self, session: aiohttp.ClientSession):
+        """Set the aiohttp session used by this client."""
+        self._session = session
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session, or create one on the running event loop."""
+        if self._parent is not None:
+            return self._parent.get_session()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    def for_agent(self, agent_id: str) -> "AsyncAPIClient":
+        """
+        A client scoped to another agent of the base.
+
+        It sends its requests through this client's session (created on first
+        use), retry policy and rate limiter, and closing it leaves the
+        session open.
+        """
+        client = copy.copy(self)
+        client.agent_id = agent_id
+        client._session = None
+        client._parent = self
+        return client
+
+    async def close(self):
+        """Close the underlying aiohttp session, unless it is borrowed from another client."""
+        if self._parent is not None:
+            return
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def validate_api_key(self):
+        """Validate the API key."""
+        return await self.request(method="GET", endpoint="api/rest/v2/authenticate")
+
+    @staticmethod
+    def _prepare_params(params: Optional[dict]) -> Optional[dict]:
+        # aiohttp only accepts str/int/float query values, requests stringifies
+        # everything and drops None, mirror that here.
+        if params is None:
+            return None
+        return {key: str(value) for key, value in params.items() if value is not None}
+
+    @staticmethod
+    def _prepare_files(files: dict, data: Optional[dict] = None) -> aiohttp.FormData:
+        form = aiohttp.FormData()
+        for key, value in (data or {}).items():
+            form.add_field(key, str(value))
+        for key, value in files.items():
+            if isinstance(value, (tuple, list)):
+                filename, content = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else None
+                form.add_field(
+                    key, content, filename=filename, content_type=content_type
+                )
+            else:
+                form.add_field(key, value)
+        return form
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs,
+    ):
+        """
+        Send a request to the Splore API, retrying transient failures.
+
+        Same contract as :meth:`APIClient.request`, retries follow the client's
+        :class:`RetryPolicy` and wait with ``asyncio.sleep``.
+        """
+        headers = kwargs.pop("headers", {})
+        headers["X-API-KEY"] = self.api_key
+        if idempotency_key:
+            headers[IDEMPOTENCY_HEADER] = idempotency_key
+        url = f"{self.base_url}/{endpoint}"
+        timeout = kwargs.pop("timeout", self.timeout)
+        if "params" in kwargs:
+            kwargs["params"] = self._prepare_params(kwargs["params"])
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self._send(
+                    method, endpoint, url, headers, timeout, deadline, **kwargs
+                )
+            except APIError as e:
+                if not self.retry_policy.should_retry(
+                    attempt, method, headers, e.status_code
+                ):
+                    raise
+                sleep_time = self.retry_policy.sleep_time(
+                    attempt, e.status_code, e.headers
+                )
+                remaining = deadline.remaining() if deadline is not None else None
+                if remaining is not None and sleep_time >= remaining:
+                    raise DeadlineExceededError(
+                        f"Deadline of {deadline.timeout} seconds exceeded while retrying {method.upper()} {endpoint}"
+                    ) from e
+                self.logger.warning(
+                    f"api with endpoint: {endpoint}, {method.upper()} attempt {attempt} failed: {e}. Retrying in {sleep_time:.2f}s"
+                )
+                await asyncio.sleep(sleep_time)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        headers: dict,
+        timeout: aiohttp.ClientTimeout,
+        deadline: Optional[Deadline],
+        **kwargs,
+    ):
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.check_wait(
+                method, endpoint, self.rate_limiter.reserve(method, endpoint), deadline
+            )
+            if wait > 0:
+                await asyncio.sleep(wait)
+        if deadline is not None:
+            deadline.check(f"{method.upper()} {endpoint}")
+            timeout = aiohttp.ClientTimeout(
+                total=deadline.clamp(timeout.total),
+                sock_connect=timeout.sock_connect,
+                sock_read=timeout.sock_read,
+            )
+        files = kwargs.pop("files", None)
+        if files is not None:
+            # FormData can only be serialized once, build it for every attempt
+            kwargs["data"] = self._prepare_files(files, kwargs.pop("data", None))
+        try:
+            self.logger.debug(
+                f"api with url: {url}, method: {method} \n headers: {headers} \n started"
+            )
+            session = self.get_session()
+            async with session.request(
+                method, url, headers=headers, timeout=timeout, **kwargs
+            ) as response:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.on_response(
+                        method,
+                        endpoint,
+                        response.status,
+                        self.retry_policy.retry_after(
+                            response.status, response.headers
+                        ),
+                    )
+                if response.status >= 400:
+                    raise APIError(
+                        f"API Request {url}, method: {method} failed with status {response.status}",
+                        status_code=response.status,
+                        headers=response.headers,
+                    )
+                self.logger.info(
+                    f"api with endpoint: {endpoint}, {method.upper()} succeeded"
+                )
+                text = await response.text()
+            try:
+                return json.loads(text)
+            except ValueError:
+                self.logger.warning(
+                    f"Response is not JSON, returning raw content. URL: {url}"
+                )
+                return text
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(
+                f"api with endpoint: {endpoint}, {method.upper()} failed: {e}"
+            )
+            raise APIError(f"API Request {url}, method: {method} failed")
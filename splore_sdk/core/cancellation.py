@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from typing import Callable, List, Optional
+from .exceptions import CancelledError
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation shared by the steps of one or more operations.
+
+    Operations given a token check it between steps and wait on it instead
+    of sleeping, so :meth:`cancel` (from any thread, e.g. a signal handler
+    during shutdown) wakes a sleeping poll right away. The operation then
+    raises :class:`CancelledError`. A request already in flight is not
+    interrupted.
+
+    Example:
+        >>> token = CancellationToken()
+        >>> signal.signal(signal.SIGTERM, lambda *_: token.cancel("shutting down"))
+        >>> try:
+        ...     agent.extraction.extract(file_path="invoice.pdf", cancellation=token)
+        ... except CancelledError as e:
+        ...     requeue(e.file_id, e.extraction_id)
+    """
+
+    def __init__(self):
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled"):
+        """Cancel every operation using the token, later calls are no-ops."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Call ``callback()`` on cancellation, right away if already cancelled.
+
+        Returns:
+            Callable[[], None]: Removes the callback.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                registered = True
+            else:
+                registered = False
+        if not registered:
+            callback()
+
+        def remove():
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+        return remove
+
+    def check(self, operation: str = "operation", **ids):
+        """Raise :class:`CancelledError` (with the given ids) if cancelled."""
+        if self.cancelled:
+            raise CancelledError(f"{operation} {self.reason}", **ids)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Sleep up to ``timeout`` seconds, returning early with True if cancelled."""
+        return self._event.wait(timeout)
+
+    async def wait_async(self, timeout: Optional[float]) -> bool:
+        """Asyncio version of :meth:`wait`."""
+        if self.cancelled:
+            return True
+        loop = asyncio.get_event_loop()
+        waiter = loop.create_future()
+
+        def wake():
+            try:
+                loop.call_soon_threadsafe(
+                    lambda: waiter.done() or waiter.set_result(True)
+                )
+            except RuntimeError:
+                # the loop is closed, nobody is waiting anymore
+                pass
+
+        remove = self.add_callback(wake)
+        try:
+            await asyncio.wait([waiter], timeout=timeout)
+        finally:
+            remove()
+            if not waiter.done():
+                waiter.cancel()
+        return self.cancelled
+
+    def __repr__(self):
+        return f"CancellationToken(cancelled={self.cancelled}, reason={self.reason})"
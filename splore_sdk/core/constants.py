@@ -1,2 +1,14 @@
 BASE_URL = "https://api.splore.ai"
 FILE_UPLOAD_URL = f"{BASE_URL}/api/rest/files"
+
+# Connection pool defaults for the shared requests session (mirrors requests' own).
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# Default (connect, read) timeouts in seconds applied to every API request.
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 60
+DEFAULT_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+# tus upload chunk size, also the in-memory threshold when spooling non-seekable streams.
+DEFAULT_UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024
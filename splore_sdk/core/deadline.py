@@ -0,0 +1,77 @@
+import time
+from typing import Optional, Tuple, Union
+from .exceptions import DeadlineExceededError
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class Deadline:
+    """
+    End-to-end time budget shared by every step of an operation.
+
+    A deadline is created once (e.g. at the start of ``extract()``) and passed
+    down to the upload, polling and API calls, each of which clamps its own
+    timeout to the time that is left, so the whole operation is bounded by
+    ``timeout`` seconds instead of each step getting its own budget.
+
+    Example:
+        >>> deadline = Deadline(600)  # the whole job must finish in 10 minutes
+        >>> agent.extraction.extract(file_path="invoice.pdf", deadline=deadline)
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout (Optional[float]): Budget in seconds, ``None`` means unbounded.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("Deadline timeout must be non-negative.")
+        self.timeout = timeout
+        self.started_at = time.monotonic()
+        self.expires_at = None if timeout is None else self.started_at + timeout
+
+    def elapsed(self) -> float:
+        """Seconds spent since the deadline was created."""
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, ``None`` if it is unbounded."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def check(self, operation: str = "operation"):
+        """Raise :class:`DeadlineExceededError` if the deadline has passed."""
+        if self.expired():
+            raise DeadlineExceededError(
+                f"Deadline of {self.timeout} seconds exceeded during {operation}"
+            )
+
+    def clamp(self, seconds: Optional[float]) -> Optional[float]:
+        """Return ``seconds`` capped to the remaining time."""
+        remaining = self.remaining()
+        if remaining is None:
+            return seconds
+        if seconds is None:
+            return remaining
+        return min(seconds, remaining)
+
+    def clamp_timeout(self, timeout: Optional[Timeout]) -> Optional[Timeout]:
+        """Cap a requests style ``timeout`` (float or (connect, read)) to the remaining time."""
+        if isinstance(timeout, tuple):
+            return tuple(self.clamp(part) for part in timeout)
+        return self.clamp(timeout)
+
+    def __repr__(self):
+        return f"Deadline(timeout={self.timeout}, remaining={self.remaining()})"
+
+
+def resolve_deadline(deadline: Optional[Deadline], timeout: Optional[float]) -> Deadline:
+    """The given ``deadline``, else a new one of ``timeout`` seconds."""
+    if deadline is not None and timeout is not None:
+        raise ValueError("Pass either deadline or timeout, not both.")
+    return deadline or Deadline(timeout)
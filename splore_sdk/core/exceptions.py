@@ -9,6 +9,11 @@ class ValidationError(SDKError):
 class APIError(SDKError):
     """API interaction error."""
 
+    def __init__(self, message: str = "", status_code=None, headers=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.headers = headers or {}
+
 
 class AgentIdError(SDKError):
     """agent_id mandotory error."""
@@ -16,3 +21,29 @@ class AgentIdError(SDKError):
 
 class S3Error(SDKError):
     """S3 interaction error."""
+
+
+class DeadlineExceededError(SDKError, TimeoutError):
+    """Raised when an operation runs past its end-to-end deadline."""
+
+
+class CancelledError(SDKError):
+    """
+    Raised when an operation is stopped through its :class:`CancellationToken`.
+
+    Carries the ids known when it was cancelled, so the extraction can be
+    picked up again elsewhere, e.g. with ``retry_extraction`` or by polling
+    ``extraction_id``.
+    """
+
+    def __init__(
+        self,
+        message: str = "Operation cancelled",
+        file_id=None,
+        extraction_id=None,
+        version=None,
+    ):
+        super().__init__(message)
+        self.file_id = file_id
+        self.extraction_id = extraction_id
+        self.version = version
@@ -58,6 +58,21 @@ def generate_new_uuid() -> str:
     return thread_local.uuid
 
 
+def get_logging_context() -> str:
+    """Return the UUID of the current thread's logging context."""
+    return _get_or_create_uuid()
+
+
+def set_logging_context(context_uuid: str):
+    """
+    Adopt an existing logging context in the current thread.
+
+    Used when work started in one thread continues in another (e.g. a
+    background poller), so its log lines keep the trace ID of the caller.
+    """
+    _get_thread_local().uuid = context_uuid
+
+
 def with_logging_context(
     func: Optional[Callable] = None, *, new_context: bool = False
 ) -> Callable:
@@ -0,0 +1,228 @@
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+from .deadline import Deadline
+from .exceptions import DeadlineExceededError
+from .logger import sdk_logger
+
+
+class RateLimit(NamedTuple):
+    """Sustained requests per second and burst size of one endpoint family."""
+
+    rate: float
+    burst: int
+
+
+# Endpoint families the limiter distinguishes, see RateLimiter.family().
+EXTRACTION_STATUS = "extraction_status"
+EXTRACTION_START = "extraction_start"
+SEARCH = "search"
+AGENTS = "agents"
+DEFAULT = "default"
+
+DEFAULT_RATE_LIMITS = {
+    EXTRACTION_STATUS: RateLimit(rate=10, burst=20),
+    EXTRACTION_START: RateLimit(rate=2, burst=5),
+    SEARCH: RateLimit(rate=5, burst=10),
+    AGENTS: RateLimit(rate=5, burst=10),
+    DEFAULT: RateLimit(rate=10, burst=20),
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with AIMD adaptation to server throttling.
+
+    Tokens are reserved rather than waited for under the lock: :meth:`reserve`
+    takes a token (letting the balance go negative) and returns how long the
+    caller has to wait for it, so the same bucket serves threads (``time.sleep``)
+    and event loops (``asyncio.sleep``).
+
+    On a 429 the rate is multiplied by ``decrease_factor`` and the bucket is
+    paused for ``Retry-After``; every success adds back ``increase_fraction``
+    of the configured rate until it is reached again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float = 0.1,
+        decrease_factor: float = 0.5,
+        increase_fraction: float = 0.05,
+    ):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be > 0 and burst >= 1.")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.decrease_factor = decrease_factor
+        self.increase_fraction = increase_fraction
+        self.tokens = float(burst)
+        self.paused_until = 0.0
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def refund(self):
+        """Give back a reserved token that was not used."""
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+    def on_success(self):
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(
+                    self.max_rate, self.rate + self.max_rate * self.increase_fraction
+                )
+
+    def on_throttled(self, retry_after: Optional[float] = None):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self.tokens = min(self.tokens, 0.0)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self.paused_until = max(self.paused_until, now + pause)
+
+
+class RateLimiter:
+    """
+    Client side rate limiter with one :class:`TokenBucket` per endpoint family.
+
+    Use :meth:`shared` to get the limiter of a base: every ``APIClient`` (and so
+    every ``SploreSDK``/``AgentSDK``) created for the same ``base_id`` in the
+    process draws from the same buckets.
+
+    Families without a configured limit fall back to the ``default`` family, or
+    are not limited at all when ``default`` is not configured either.
+
+    Example:
+        >>> from splore_sdk.core.rate_limiter import DEFAULT_RATE_LIMITS, RateLimit
+        >>> limits = dict(DEFAULT_RATE_LIMITS, extraction_status=RateLimit(20, 40))
+        >>> sdk = SploreSDK(api_key="...", base_id="...", rate_limits=limits)
+        >>> agent = sdk.init_agent(agent_id="...")  # shares the buckets of sdk
+    """
+
+    _registry: Dict[str, "RateLimiter"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, rate_limits: Optional[Dict[str, RateLimit]] = None):
+        self.logger = sdk_logger
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.configure(rate_limits if rate_limits is not None else DEFAULT_RATE_LIMITS)
+
+    @classmethod
+    def shared(
+        cls, base_id: str, rate_limits: Optional[Dict[str, RateLimit]] = None
+    ) -> "RateLimiter":
+        """Return the process wide limiter of ``base_id``, updating its limits if given."""
+        with cls._registry_lock:
+            limiter = cls._registry.get(base_id)
+            if limiter is None:
+                limiter = cls._registry[base_id] = cls(rate_limits)
+            elif rate_limits is not None:
+                limiter.configure(rate_limits)
+            return limiter
+
+    def configure(self, rate_limits: Dict[str, RateLimit]):
+        """Create or resize the buckets of the given families."""
+        with self._lock:
+            for family, limit in rate_limits.items():
+                rate, burst = RateLimit(*limit)
+                bucket = self._buckets.get(family)
+                if bucket is None:
+                    self._buckets[family] = TokenBucket(rate, burst)
+                else:
+                    bucket.max_rate = bucket.rate = rate
+                    bucket.burst = burst
+
+    def bucket(self, family: str) -> Optional[TokenBucket]:
+        return self._buckets.get(family) or self._buckets.get(DEFAULT)
+
+    @staticmethod
+    def family(method: str, endpoint: str) -> str:
+        """Map a request to its endpoint family."""
+        path = endpoint.strip("/").split("?")[0]
+        parts = path.split("/")
+        if "extractions" in parts:
+            tail = parts[parts.index("extractions") + 1:]
+            if method.upper() == "POST" and tail and tail != ["files"]:
+                return EXTRACTION_START
+            if method.upper() == "GET":
+                return EXTRACTION_STATUS
+            return DEFAULT
+        if "search" in parts:
+            return SEARCH
+        if "agents" in parts:
+            return AGENTS
+        return DEFAULT
+
+    def reserve(self, method: str, endpoint: str) -> float:
+        bucket = self.bucket(self.family(method, endpoint))
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(
+        self, method: str, endpoint: str, deadline: Optional[Deadline] = None
+    ) -> float:
+        """Block until a request may be sent and return the time waited."""
+        wait = self.check_wait(method, endpoint, self.reserve(method, endpoint), deadline)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def check_wait(
+        self,
+        method: str,
+        endpoint: str,
+        wait: float,
+        deadline: Optional[Deadline] = None,
+    ) -> float:
+        """Refund the token and fail if ``wait`` does not fit in the deadline."""
+        if wait <= 0:
+            return 0.0
+        remaining = deadline.remaining() if deadline is not None else None
+        if remaining is not None and wait >= remaining:
+            bucket = self.bucket(self.family(method, endpoint))
+            if bucket is not None:
+                bucket.refund()
+            raise DeadlineExceededError(
+                f"Deadline of {deadline.timeout} seconds exceeded waiting for rate limit of {method.upper()} {endpoint}"
+            )
+        self.logger.debug(
+            f"rate limited {method.upper()} {endpoint}, waiting {wait:.2f}s"
+        )
+        return wait
+
+    def on_response(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        retry_after: Optional[float] = None,
+    ):
+        """Feed a response back so the family adapts to server throttling."""
+        bucket = self.bucket(self.family(method, endpoint))
+        if bucket is None:
+            return
+        if status_code == 429:
+            bucket.on_throttled(retry_after)
+            self.logger.warning(
+                f"{method.upper()} {endpoint} throttled, rate lowered to {bucket.rate:.2f}/s"
+            )
+        elif status_code is not None and status_code < 400:
+            bucket.on_success()
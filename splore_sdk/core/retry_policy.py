@@ -0,0 +1,133 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Mapping, Optional
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed API request is retried and how long to wait.
+
+    * Client errors (4xx) are never retried, except the transient ones listed in
+      ``retry_statuses`` (408, 425, 429 by default).
+    * Server errors and connection failures are retried for idempotent methods.
+      Non idempotent methods (POST) are only retried when the request carries
+      an ``Idempotency-Key`` header, so the server can de-duplicate them.
+    * ``Retry-After`` on 429/503 responses overrides the exponential backoff.
+
+    The policy is applied once, inside :meth:`APIClient.request`, so helpers
+    built on top of ``request`` never stack their own retries on top of it.
+    """
+
+    DEFAULT_RETRY_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+    DEFAULT_IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    RETRY_AFTER_STATUSES = (429, 503)
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 10,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        idempotent_methods: Iterable[str] = DEFAULT_IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120,
+        jitter_fraction: float = 0.1,
+    ):
+        """
+        Args:
+            max_retries (int): Retries after the first attempt, 0 disables retrying.
+            backoff_factor (float): Base delay, doubled after every attempt.
+            max_backoff (float): Upper bound of the exponential backoff.
+            retry_statuses (Iterable[int]): HTTP statuses considered transient.
+            idempotent_methods (Iterable[str]): Methods that are always safe to retry.
+            respect_retry_after (bool): Honor ``Retry-After`` on 429/503 responses.
+            max_retry_after (float): Upper bound applied to ``Retry-After``.
+            jitter_fraction (float): Fraction of the delay used as random jitter.
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0.")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.jitter_fraction = jitter_fraction
+
+    @classmethod
+    def no_retry(cls) -> "RetryPolicy":
+        return cls(max_retries=0)
+
+    def is_idempotent(self, method: str, headers: Optional[Mapping] = None) -> bool:
+        if method.upper() in self.idempotent_methods:
+            return True
+        return bool(headers) and IDEMPOTENCY_HEADER in headers
+
+    def should_retry(
+        self,
+        attempt: int,
+        method: str,
+        headers: Optional[Mapping] = None,
+        status_code: Optional[int] = None,
+    ) -> bool:
+        """
+        Args:
+            attempt (int): Number of attempts made so far (1 after the first failure).
+            method (str): HTTP method of the request.
+            headers (Optional[Mapping]): Headers sent with the request.
+            status_code (Optional[int]): Response status, ``None`` for connection errors.
+        """
+        if attempt > self.max_retries:
+            return False
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+        if status_code == 429:
+            # throttled requests were rejected before any side effect happened
+            return True
+        return self.is_idempotent(method, headers)
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given attempt (1-based)."""
+        delay = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        jitter = delay * self.jitter_fraction
+        return max(0.0, delay + random.uniform(-jitter, jitter))
+
+    def retry_after(
+        self, status_code: Optional[int], headers: Optional[Mapping]
+    ) -> Optional[float]:
+        """Parse ``Retry-After`` (delta seconds or HTTP date) from a response."""
+        if not self.respect_retry_after or status_code not in self.RETRY_AFTER_STATUSES:
+            return None
+        value = (headers or {}).get("Retry-After")
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError, IndexError):
+                return None
+            seconds = retry_at.timestamp() - time.time()
+        return min(max(0.0, seconds), self.max_retry_after)
+
+    def sleep_time(
+        self,
+        attempt: int,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping] = None,
+    ) -> float:
+        retry_after = self.retry_after(status_code, headers)
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
+
+    def __repr__(self):
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, "
+            f"backoff_factor={self.backoff_factor}, max_backoff={self.max_backoff})"
+        )
@@ -0,0 +1,151 @@
+import uuid
+from typing import AsyncIterator, Dict, Optional
+from splore_sdk.core.async_api_client import AsyncAPIClient
+from splore_sdk.core.compat import model_dump_or_dict
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.utils.pagination import aiter_pages
+from splore_sdk.utils.result_cache import ResultCache, cache_key, is_completed
+from .extractions_service import ExtractionService
+from .validations import StartExtractionInput
+
+
+class AsyncExtractionService(ExtractionService):
+    """
+    asyncio version of :class:`ExtractionService`.
+
+    Endpoints, payload validation and result caching follow the blocking
+    service, every call is awaited on an :class:`AsyncAPIClient` instead.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        agent_id: str,
+        result_cache: Optional[ResultCache] = None,
+    ):
+        super().__init__(api_client, agent_id=agent_id, result_cache=result_cache)
+
+    async def upload_file(self, fileObj):
+        return await self.api_client.request(
+            method="POST", endpoint=self.endpoint("/files"), files=fileObj
+        )
+
+    async def start(
+        self,
+        file_id: str,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+    ):
+        """Start an extraction for an uploaded file, see :meth:`ExtractionService.start`."""
+        self._require_agent()
+
+        payload = StartExtractionInput(
+            agent_id=self.api_client.agent_id,
+            file_id=file_id,
+        )
+        return await self.api_client.request(
+            method="POST",
+            endpoint=self.endpoint("/start"),
+            json=model_dump_or_dict(payload),
+            deadline=deadline,
+            idempotency_key=idempotency_key or str(uuid.uuid4()),
+        )
+
+    async def processing_status(
+        self, file_id: str, deadline: Optional[Deadline] = None
+    ):
+        self._require_agent()
+
+        params = {"agentId": self.api_client.agent_id, "fileId": file_id}
+        return await self.api_client.request(
+            method="GET",
+            endpoint=self.endpoint("/status"),
+            params=params,
+            deadline=deadline,
+        )
+
+    async def extracted_response(self, file_id: str):
+        self._require_agent()
+
+        params = {"agentId": self.api_client.agent_id, "fileId": file_id}
+        return await self.api_client.request(
+            method="GET", endpoint=self.endpoint(""), params=params
+        )
+
+    async def all_extracted_response(
+        self,
+        page: Optional[int] = 0,
+        size: Optional[int] = 10,
+        compact: Optional[bool] = True,
+    ):
+        params = {"page": page, "size": size, "compact": compact}
+        return await self.api_client.request(
+            method="GET", endpoint=self.endpoint(""), params=params
+        )
+
+    async def iter_extractions(
+        self,
+        size: int = 100,
+        compact: bool = True,
+        prefetch: int = 2,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterate over every extraction, see :meth:`ExtractionService.iter_extractions`.
+
+        The ``prefetch`` pages ahead are fetched concurrently.
+        """
+        pages = aiter_pages(
+            lambda page: self.all_extracted_response(page=page, size=size, compact=compact),
+            size,
+            start_page=start_page,
+            end_page=end_page,
+            prefetch=prefetch,
+        )
+        try:
+            async for items in pages:
+                for item in items:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def extracted_response_by_extraction_id(
+        self,
+        extraction_id: str,
+        version: Optional[int] = 1,
+        deadline: Optional[Deadline] = None,
+    ):
+        """
+        Fetch an extraction version, from the result cache once it completed.
+        """
+        key = cache_key("extraction", self.api_client.agent_id, extraction_id, version)
+        if self.result_cache is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return cached
+        params = {"version": version}
+        response = await self.api_client.request(
+            method="GET",
+            endpoint=self.endpoint(f"/{extraction_id}"),
+            params=params,
+            deadline=deadline,
+        )
+        if self.result_cache is not None and is_completed(response):
+            self.result_cache.set(key, response)
+        return response
+
+    async def start_extraction_by_extraction_id(
+        self,
+        extraction_id: str,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+    ):
+        """Re-run an existing extraction, retry-safe through an idempotency key."""
+        return await self.api_client.request(
+            method="POST",
+            endpoint=self.endpoint(f"/{extraction_id}"),
+            json={},
+            deadline=deadline,
+            idempotency_key=idempotency_key or str(uuid.uuid4()),
+        )
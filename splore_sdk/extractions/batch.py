@@ -0,0 +1,41 @@
+import os
+from typing import IO, Any, Dict, NamedTuple, Optional, Union
+from splore_sdk.utils.duration_history import source_size
+
+BatchInput = Union[str, "os.PathLike[str]", IO]
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one input of a batch extraction."""
+
+    input: Any
+    result: Optional[Dict] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def input_kwargs(item: BatchInput) -> Dict[str, Any]:
+    """Map a batch input to the ``file_path``/``file_stream`` arguments of ``extract``."""
+    if isinstance(item, (str, os.PathLike)):
+        return {"file_path": os.fspath(item), "file_stream": None}
+    if hasattr(item, "read"):
+        return {"file_path": None, "file_stream": item}
+    raise ValueError(
+        f"Batch inputs must be file paths or file streams, got {type(item).__name__}"
+    )
+
+
+def size_priority(item: BatchInput) -> float:
+    """
+    Shortest-job-first priority of a batch input: its size in MiB.
+
+    Indexing and extraction time grow with the page count, which grows with
+    the file size. Inputs of unknown size, such as non-seekable streams, get
+    priority ``0``.
+    """
+    kwargs = input_kwargs(item)
+    size = source_size(kwargs["file_path"], kwargs["file_stream"])
+    return 0.0 if size is None else size / (1024 * 1024)
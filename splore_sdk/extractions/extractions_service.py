@@ -1,12 +1,23 @@
-from typing import Optional
+import uuid
+from contextlib import closing
+from typing import Dict, Iterator, Optional
 from .validations import StartExtractionInput
 from splore_sdk.core.api_client import APIClient
+from splore_sdk.core.deadline import Deadline
 from splore_sdk.core.compat import model_dump_or_dict
+from splore_sdk.utils.pagination import iter_pages
+from splore_sdk.utils.result_cache import ResultCache, cache_key, is_completed
 
 
 class ExtractionService:
-    def __init__(self, api_client: APIClient, agent_id: str):
+    def __init__(
+        self,
+        api_client: APIClient,
+        agent_id: str,
+        result_cache: Optional[ResultCache] = None,
+    ):
         self.api_client = api_client
+        self.result_cache = result_cache
         self.extraction_prefix = "api/rest/v2/extractions"
         self.api_client.agent_id = agent_id
 
@@ -16,16 +27,30 @@ class ExtractionService:
     def endpoint(self, endpoint):
         return self.extraction_prefix + endpoint
 
+    def _require_agent(self):
+        if self.api_client.agent_id is None:
+            raise ValueError(
+                "for extraction agent_id is required, intialise the sdk with agent_id or call function `extractions.set_agent(agent_id)`"
+            )
+
     def upload_file(self, fileObj):
         return self.api_client.request(
             method="POST", endpoint=self.endpoint("/files"), files=fileObj
         )
 
-    def start(self, file_id: str):
-        if self.api_client.agent_id is None:
-            raise ValueError(
-                "for extraction agent_id is required, intialise the sdk with agent_id or call function `extractions.set_agent(agent_id)`"
-            )
+    def start(
+        self,
+        file_id: str,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+    ):
+        """
+        Start an extraction for an uploaded file.
+
+        The request carries an idempotency key (a fresh one unless given) so it
+        can be retried without starting duplicate extractions.
+        """
+        self._require_agent()
 
         payload = StartExtractionInput(
             agent_id=self.api_client.agent_id,
@@ -35,24 +60,23 @@ class ExtractionService:
             method="POST",
             endpoint=self.endpoint("/start"),
             json=model_dump_or_dict(payload),
+            deadline=deadline,
+            idempotency_key=idempotency_key or str(uuid.uuid4()),
         )
 
-    def processing_status(self, file_id: str):
-        if self.api_client.agent_id is None:
-            raise ValueError(
-                "for extraction agent_id is required, intialise the sdk with agent_id or call function `extractions.set_agent(agent_id)`"
-            )
+    def processing_status(self, file_id: str, deadline: Optional[Deadline] = None):
+        self._require_agent()
 
         params = {"agentId": self.api_client.agent_id, "fileId": file_id}
         return self.api_client.request(
-            method="GET", endpoint=self.endpoint("/status"), params=params
+            method="GET",
+            endpoint=self.endpoint("/status"),
+            params=params,
+            deadline=deadline,
         )
 
     def extracted_response(self, file_id: str):
-        if self.api_client.agent_id is None:
-            raise ValueError(
-                "for extraction agent_id is required, intialise the sdk with agent_id or call function `extractions.set_agent(agent_id)`"
-            )
+        self._require_agent()
 
         params = {"agentId": self.api_client.agent_id, "fileId": file_id}
         return self.api_client.request(
@@ -70,15 +94,87 @@ class ExtractionService:
             method="GET", endpoint=self.endpoint(""), params=params
         )
 
+    def iter_extractions(
+        self,
+        size: int = 100,
+        compact: bool = True,
+        prefetch: int = 2,
+        workers: int = 1,
+        start_page: int = 0,
+        end_page: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        Iterate over every extraction of :meth:`all_extracted_response`.
+
+        The next ``prefetch`` pages are fetched in the background while the
+        current one is processed, so a long export waits on its own
+        processing rather than on a round trip per page. With ``workers``
+        above one, pages of the range are fetched in parallel.
+
+        Example:
+            >>> for extraction in agent.extractions.iter_extractions(size=200, prefetch=4):
+            ...     export(extraction)
+
+        Args:
+            size (int): Extractions per page.
+            compact (bool): Request the compact representation.
+            prefetch (int): Pages fetched ahead, memory holds at most this many
+                pages besides the current one, and at least ``workers``.
+            workers (int): Pages fetched at once.
+            start_page (int): First page to read.
+            end_page (Optional[int]): Page to stop before, ``None`` reads all.
+
+        Returns:
+            Iterator[Dict]: The extractions, in page order.
+        """
+        pages = iter_pages(
+            lambda page: self.all_extracted_response(page=page, size=size, compact=compact),
+            size,
+            start_page=start_page,
+            end_page=end_page,
+            prefetch=prefetch,
+            workers=workers,
+        )
+        with closing(pages):
+            for items in pages:
+                yield from items
+
     def extracted_response_by_extraction_id(
-        self, extraction_id: str, version: Optional[int] = 1
+        self,
+        extraction_id: str,
+        version: Optional[int] = 1,
+        deadline: Optional[Deadline] = None,
     ):
+        """
+        Fetch an extraction version, from the result cache once it completed.
+        """
+        key = cache_key("extraction", self.api_client.agent_id, extraction_id, version)
+        if self.result_cache is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return cached
         params = {"version": version}
-        return self.api_client.request(
-            method="GET", endpoint=self.endpoint(f"/{extraction_id}"), params=params
+        response = self.api_client.request(
+            method="GET",
+            endpoint=self.endpoint(f"/{extraction_id}"),
+            params=params,
+            deadline=deadline,
         )
+        if self.result_cache is not None and is_completed(response):
+            self.result_cache.set(key, response)
+        return response
 
-    def start_extraction_by_extraction_id(self, extraction_id: str):
+    def start_extraction_by_extraction_id(
+        self,
+        extraction_id: str,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+    ):
+        """Re-run an existing extraction, retry-safe through an idempotency key."""
         return self.api_client.request(
-            method="POST", endpoint=self.endpoint(f"/{extraction_id}"), json={}
+            method="POST",
+            endpoint=self.endpoint(f"/{extraction_id}"),
+            json={},
+            deadline=deadline,
+            idempotency_key=idempotency_key or str(uuid.uuid4()),
         )
@@ -0,0 +1,174 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+
+class ExtractionState:
+    """States an :class:`ExtractionJob` moves through."""
+
+    PENDING = "PENDING"
+    UPLOADING = "UPLOADING"
+    INDEXING = "INDEXING"
+    STARTING = "STARTING"
+    EXTRACTING = "EXTRACTING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+    FINAL = (COMPLETED, FAILED, CANCELLED)
+
+
+class ExtractionJob:
+    """
+    Handle of an extraction submitted with ``submit_extraction()``.
+
+    The job runs in the background (upload, indexing poll, extraction start
+    and result poll) and exposes the ids as soon as they are known, and the
+    time spent in each phase in :attr:`phase_durations` as they finish. It follows
+    the :class:`concurrent.futures.Future` interface, and :attr:`future` can be
+    passed to ``concurrent.futures.wait``/``as_completed`` directly.
+
+    Example:
+        >>> job = agent.submit_extraction(file_path="invoice.pdf")
+        >>> job.file_id, job.state
+        ('file_123', 'INDEXING')
+        >>> job.result(timeout=1800)
+        >>> job.phase_durations
+        {'upload': 1.2, 'indexing': 48.0, 'start': 0.4, 'extraction': 95.1}
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        file_id: Optional[str] = None,
+        extraction_id: Optional[str] = None,
+    ):
+        self.file_path = file_path
+        self.file_id = file_id
+        self.extraction_id = extraction_id
+        self.version = 1
+        # id of the job in the capability's JobJournal, if it keeps one
+        self.journal_id: Optional[str] = None
+        # seconds spent in each finished phase: upload, indexing, start, extraction
+        self.phase_durations: Dict[str, float] = {}
+        self._state = ExtractionState.PENDING
+        self._future: Future = Future()
+        self._stage: Optional[Future] = None
+        self._lock = threading.RLock()
+
+    @property
+    def state(self) -> str:
+        """Current :class:`ExtractionState` of the job."""
+        return self._state
+
+    @property
+    def future(self) -> Future:
+        """Future resolving to the extracted response."""
+        return self._future
+
+    def result(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Wait for the extracted response.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, ``None`` waits until the
+                job finishes.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the job is still running after ``timeout``.
+            concurrent.futures.CancelledError: If the job was cancelled.
+
+        Returns:
+            Dict: Extracted response data from the file.
+        """
+        return self._future.result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Wait for the job and return the exception it failed with, if any."""
+        return self._future.exception(timeout)
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def cancelled(self) -> bool:
+        return self._future.cancelled()
+
+    def cancel(self) -> bool:
+        """
+        Stop the job locally: the pending stage is cancelled and no further
+        API calls are made. A request already in flight is not interrupted.
+
+        Returns:
+            bool: False if the job had already finished.
+        """
+        with self._lock:
+            if self._future.done():
+                return False
+            self._state = ExtractionState.CANCELLED
+            self._future.cancel()
+            stage = self._stage
+        if stage is not None:
+            stage.cancel()
+        return True
+
+    def add_done_callback(self, fn: Callable[["ExtractionJob"], Any]):
+        """Call ``fn(job)`` once the job finishes, right away if it already has."""
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def _set_state(self, state: str) -> bool:
+        with self._lock:
+            if self._future.done():
+                return False
+            self._state = state
+            return True
+
+    def _set_stage(self, stage: Future, state: Optional[str] = None) -> bool:
+        """Track the future of the running stage so :meth:`cancel` can stop it."""
+        with self._lock:
+            if self._future.done():
+                cancelled = True
+            else:
+                cancelled = False
+                self._stage = stage
+                if state is not None:
+                    self._state = state
+        if cancelled:
+            stage.cancel()
+        return not cancelled
+
+    def _finish(self, state: str) -> bool:
+        with self._lock:
+            # the future stays PENDING while the job runs so it can be
+            # cancelled, claim it here unless that already happened
+            if self._future.running() or self._future.done():
+                return False
+            if not self._future.set_running_or_notify_cancel():
+                return False
+            self._state = state
+            self._stage = None
+            return True
+
+    def _set_result(self, result: Dict):
+        if self._finish(ExtractionState.COMPLETED):
+            self._future.set_result(result)
+
+    def _set_exception(self, exception: BaseException):
+        if self._finish(ExtractionState.FAILED):
+            self._future.set_exception(exception)
+
+    def _abort(self, exception: BaseException) -> bool:
+        """Fail the job with ``exception`` and stop its pending stage."""
+        with self._lock:
+            stage = self._stage
+            if not self._finish(ExtractionState.CANCELLED):
+                return False
+        self._future.set_exception(exception)
+        if stage is not None:
+            stage.cancel()
+        return True
+
+    def __repr__(self):
+        return (
+            f"ExtractionJob(state={self._state}, file_id={self.file_id}, "
+            f"extraction_id={self.extraction_id})"
+        )
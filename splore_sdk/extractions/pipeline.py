@@ -0,0 +1,272 @@
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Iterable, Iterator, NamedTuple, Optional
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.core.logger import sdk_logger
+from splore_sdk.extractions.batch import BatchInput, BatchResult, input_kwargs
+from splore_sdk.extractions.job import ExtractionJob
+from splore_sdk.utils.poll_scheduler import PollScheduler
+
+
+class _BoundedExecutor(ThreadPoolExecutor):
+    """Thread pool whose ``submit`` blocks while ``max_queued`` tasks wait for a worker."""
+
+    def __init__(self, max_workers: int, max_queued: int, thread_name_prefix: str):
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(max_workers + max_queued)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        self._slots.acquire()
+        try:
+            future = super().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+class ExtractionPipeline:
+    """
+    Extraction as independent stages, each with its own workers.
+
+    Uploads run on ``upload_workers`` threads fed by a queue of at most
+    ``upload_queue_size`` files, extraction starts on ``start_workers``
+    threads, and the indexing and extraction status polls (which also fetch
+    the results) on the capability's :class:`PollScheduler`, or on one of
+    the pipeline's own with ``poll_workers`` threads. While files
+    1..N index and extract server side, file N+1 is already uploading, so
+    a batch moves at the pace of its slowest stage instead of the sum of
+    all of them.
+
+    Backpressure: :meth:`submit` blocks while the upload queue is full or
+    ``max_in_flight`` files are between upload and completion, so a fast
+    producer never buffers more than that.
+
+    Example:
+        >>> with agent.extraction.pipeline(upload_workers=2, max_in_flight=64) as pipeline:
+        ...     for result in pipeline.run(paths):
+        ...         print(result.input, result.ok)
+    """
+
+    def __init__(
+        self,
+        capability,
+        upload_workers: int = 4,
+        start_workers: int = 4,
+        upload_queue_size: int = 8,
+        max_in_flight: int = 64,
+        max_poll_timeout: Optional[float] = 1200,
+        poll_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            capability (ExtractionCapability): Uploads, starts and polls the files.
+            upload_workers (int): Files uploading at once.
+            start_workers (int): Extractions being started at once.
+            upload_queue_size (int): Files waiting for an upload worker.
+            max_in_flight (int): Files submitted and not finished yet.
+            max_poll_timeout (Optional[float]): Timeout of each polling phase.
+            poll_workers (Optional[int]): Status calls at once on a
+                :class:`PollScheduler` of the pipeline's own, shut down by
+                :meth:`close`. ``None`` polls on the capability's scheduler.
+        """
+        if min(upload_workers, start_workers, max_in_flight) < 1:
+            raise ValueError("Worker counts and max_in_flight must be at least 1.")
+        if poll_workers is not None and poll_workers < 1:
+            raise ValueError("poll_workers must be at least 1.")
+        if upload_queue_size < 0:
+            raise ValueError("upload_queue_size must not be negative.")
+        self.capability = capability
+        self.max_poll_timeout = max_poll_timeout
+        self.logger = sdk_logger
+        self._uploads = _BoundedExecutor(
+            upload_workers, upload_queue_size, thread_name_prefix="splore-upload"
+        )
+        self._starts = ThreadPoolExecutor(
+            max_workers=start_workers, thread_name_prefix="splore-start"
+        )
+        self._poll_scheduler = (
+            PollScheduler(max_workers=poll_workers) if poll_workers is not None else None
+        )
+        self.max_in_flight = max_in_flight
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._jobs = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(
+        self, file_path: Optional[str] = None, file_stream: Optional[IO] = None
+    ) -> ExtractionJob:
+        """
+        Queue one file, blocking while the pipeline is full.
+
+        Raises:
+            ValueError: If neither file_path nor file_stream is provided.
+            RuntimeError: If the pipeline is closed.
+
+        Returns:
+            ExtractionJob: Handle resolving to the extracted response.
+        """
+        if not (file_path or file_stream):
+            raise ValueError("One of file_path or file_stream must be provided.")
+        self._in_flight.acquire()
+        return self._submit_acquired(file_path, file_stream)
+
+    def _submit_acquired(
+        self, file_path: Optional[str], file_stream: Optional[IO]
+    ) -> ExtractionJob:
+        try:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Cannot submit files after close.")
+            job = self.capability._submit(
+                file_path,
+                file_stream,
+                self.max_poll_timeout,
+                Deadline(),
+                self._uploads,
+                start_executor=self._starts,
+                poll_scheduler=self._poll_scheduler,
+            )
+        except BaseException:
+            self._in_flight.release()
+            raise
+        with self._lock:
+            self._jobs.add(job)
+        job.add_done_callback(self._finished)
+        return job
+
+    def _finished(self, job: ExtractionJob):
+        with self._lock:
+            self._jobs.discard(job)
+        self._in_flight.release()
+
+    def in_flight(self) -> int:
+        """Number of files submitted and not finished yet."""
+        with self._lock:
+            return len(self._jobs)
+
+    def run(self, inputs: Iterable[BatchInput]) -> Iterator[BatchResult]:
+        """
+        Feed ``inputs`` through the pipeline, yielding results in completion order.
+
+        Once iteration starts, inputs are submitted from a background thread
+        as the pipeline has room, so results are available while later files
+        still upload. Closing the iterator early stops feeding and cancels the
+        files in flight.
+
+        Args:
+            inputs (Iterable[BatchInput]): File paths and/or file streams, may be
+                a generator.
+
+        Returns:
+            Iterator[BatchResult]: One result per input, in completion order.
+        """
+        results: "queue.Queue" = queue.Queue()
+        stop = threading.Event()
+        submitted = []
+
+        def feed():
+            count = 0
+            try:
+                for item in inputs:
+                    if stop.is_set():
+                        return
+                    try:
+                        kwargs = input_kwargs(item)
+                    except (ValueError, OSError) as e:
+                        count += 1
+                        results.put(BatchResult(input=item, error=e))
+                        continue
+                    # wait for room here so a closed iterator submits nothing more
+                    self._in_flight.acquire()
+                    if stop.is_set():
+                        self._in_flight.release()
+                        return
+                    count += 1
+                    try:
+                        job = self._submit_acquired(**kwargs)
+                    except RuntimeError as e:
+                        results.put(BatchResult(input=item, error=e))
+                        continue
+                    submitted.append(job)
+                    job.add_done_callback(
+                        lambda job, item=item: results.put(_batch_result(item, job))
+                    )
+                    if stop.is_set():
+                        job.cancel()
+            except Exception as e:
+                self.logger.error(f"Reading pipeline inputs failed: {e}")
+                results.put(e)
+            finally:
+                # every input counted puts exactly one result
+                results.put(_FedInputs(count))
+
+        return self._results(feed, results, stop, submitted)
+
+    @staticmethod
+    def _results(feed, results, stop, submitted) -> Iterator[BatchResult]:
+        yielded = 0
+        total = None
+        threading.Thread(target=feed, name="splore-pipeline-feed", daemon=True).start()
+        try:
+            while total is None or yielded < total:
+                item = results.get()
+                if isinstance(item, _FedInputs):
+                    total = item.count
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yielded += 1
+                    yield item
+        finally:
+            stop.set()
+            for job in list(submitted):
+                job.cancel()
+
+    def close(self, wait: bool = True):
+        """
+        Stop accepting files and release the workers.
+
+        With ``wait``, blocks until the files in flight finish (each within
+        its poll timeouts), otherwise cancels them.
+        """
+        with self._lock:
+            self._closed = True
+            jobs = list(self._jobs)
+        if wait:
+            # every file in flight holds a slot, so all of them are free once
+            # the last one finished
+            for _ in range(self.max_in_flight):
+                self._in_flight.acquire()
+            for _ in range(self.max_in_flight):
+                self._in_flight.release()
+        else:
+            for job in jobs:
+                job.cancel()
+        self._uploads.shutdown(wait=wait)
+        self._starts.shutdown(wait=wait)
+        if self._poll_scheduler is not None:
+            self._poll_scheduler.shutdown(wait=wait)
+
+    def __enter__(self) -> "ExtractionPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # leaving on an error cancels the files instead of waiting for them
+        self.close(wait=exc_type is None)
+
+
+class _FedInputs(NamedTuple):
+    """End marker of the pipeline feeder, with the number of inputs it read."""
+
+    count: int
+
+
+def _batch_result(item: BatchInput, job: ExtractionJob) -> BatchResult:
+    try:
+        return BatchResult(input=item, result=job.result())
+    except Exception as e:
+        return BatchResult(input=item, error=e)
@@ -1,12 +1,75 @@
+import time
 from abc import ABC
-from typing import IO, Optional, Dict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError as FutureCancelledError,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from threading import Lock
+from typing import IO, Callable, Optional, Dict, Iterable, Iterator, List, Set, Tuple
 from splore_sdk.core.api_client import APIClient
-from splore_sdk.core.logger import sdk_logger, with_logging_context
+from splore_sdk.core.cancellation import CancellationToken
+from splore_sdk.core.deadline import Deadline, resolve_deadline
+from splore_sdk.core.exceptions import APIError, CancelledError, DeadlineExceededError
+from splore_sdk.core.logger import (
+    sdk_logger,
+    with_logging_context,
+    get_logging_context,
+    set_logging_context,
+)
 from splore_sdk.extractions.extractions_service import ExtractionService
+from splore_sdk.extractions.batch import BatchInput, BatchResult, input_kwargs
+from splore_sdk.extractions.job import ExtractionJob, ExtractionState
+from splore_sdk.extractions.pipeline import ExtractionPipeline
 from splore_sdk.search.search_service import SearchService
 from splore_sdk.agents.agents_service import AgentService
-from splore_sdk.utils.file_uploader import FileUploader
-from splore_sdk.utils.decorators import poll_with_timeout
+from splore_sdk.utils.file_uploader import FileUploader, UPLOAD_OPTIONS
+from splore_sdk.utils.poll_scheduler import PollScheduler
+from splore_sdk.utils.priority_executor import PriorityExecutor
+from splore_sdk.utils.dedup_index import DedupIndex, content_sha256
+from splore_sdk.utils.result_cache import ResultCache, cache_key, is_completed
+from splore_sdk.utils.poll_strategy import (
+    DEFAULT_EXTRACTION_POLL_STRATEGY,
+    DelayedPollStrategy,
+    EtaPollStrategy,
+    PollStrategy,
+)
+from splore_sdk.utils.duration_history import DurationHistory, source_size
+from splore_sdk.utils.completion_notifier import CompletionNotifier
+from splore_sdk.utils.job_journal import JobJournal, JournalEntry
+
+# SDK options routed to ExtractionCapability instead of APIClient, see BaseSDK.
+EXTRACTION_OPTIONS = (
+    "dedup_index",
+    "result_cache",
+    "result_cache_ttl",
+    "poll_strategy",
+    "duration_history",
+    "completion_notifier",
+    "job_journal",
+    "poll_scheduler",
+    "poll_workers",
+)
+
+# Share of the time left that a phase leaves the later phases when their
+# durations were not learned yet.
+UNLEARNED_PHASES_SHARE = 0.5
+
+
+def _chain(source: Future, target: Future):
+    """Settle ``target`` like the finished ``source``, unless it was cancelled."""
+    if not target.set_running_or_notify_cancel():
+        return
+    if source.cancelled():
+        target.set_exception(FutureCancelledError())
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
 
 
 class BaseSDK:
@@ -17,7 +80,22 @@ class BaseSDK:
         base_id: str,
         user_id: Optional[str] = None,
         agent_id: Optional[str] = None,
+        **client_options,
     ):
+        """
+        Args:
+            api_key (str): The API key for the Splore base.
+            base_id (str): The base id of the Splore base.
+            user_id (Optional[str]): The user id attached to uploaded files.
+            agent_id (Optional[str]): The agent id for agent scoped SDKs.
+            **client_options: Extra options forwarded to :class:`APIClient`,
+                e.g. ``pool_connections``, ``pool_maxsize`` or ``pool_block``,
+                to :class:`FileUploader` for ``parallel_uploads``, or to
+                :class:`ExtractionCapability` for ``dedup_index``,
+                ``result_cache``, ``result_cache_ttl``, ``poll_strategy``,
+                ``duration_history``, ``completion_notifier``,
+                ``job_journal``, ``poll_scheduler`` and ``poll_workers``.
+        """
         self.logger = sdk_logger
 
         if not api_key:
@@ -26,11 +104,28 @@ class BaseSDK:
         self.api_key = api_key
         self.user_id = user_id
         self.agent_id = agent_id
+        self.client_options = client_options
+        api_options = {
+            key: value
+            for key, value in client_options.items()
+            if key not in UPLOAD_OPTIONS and key not in EXTRACTION_OPTIONS
+        }
+        upload_options = {
+            key: value for key, value in client_options.items() if key in UPLOAD_OPTIONS
+        }
+        self.extraction_options = {
+            key: value
+            for key, value in client_options.items()
+            if key in EXTRACTION_OPTIONS
+        }
         self.client = APIClient(
-            api_key=self.api_key, base_id=base_id, agent_id=agent_id
+            api_key=self.api_key, base_id=base_id, agent_id=agent_id, **api_options
         )
         self.file_uploader = FileUploader(
-            api_key=self.api_key, base_id=self.base_id, user_id=self.user_id
+            api_key=self.api_key,
+            base_id=self.base_id,
+            user_id=self.user_id,
+            **upload_options,
         )
         self.validate_api_key()
         self.logger.info(
@@ -45,10 +140,26 @@ class BaseSDK:
             self.logger.debug(f"API Key validation failed: {e}")
             raise ValueError("API Key validation failed")
 
+    def close(self):
+        """Release the pooled HTTP connections held by the SDK."""
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 
 class SploreSDK(BaseSDK):
-    def __init__(self, api_key: str, base_id: str, user_id: Optional[str] = None):
-        super().__init__(api_key, base_id, user_id)
+    def __init__(
+        self,
+        api_key: str,
+        base_id: str,
+        user_id: Optional[str] = None,
+        **client_options,
+    ):
+        super().__init__(api_key, base_id, user_id, **client_options)
         self.agents = AgentService(self.client)
 
     def get_agents(
@@ -71,7 +182,12 @@ class SploreSDK(BaseSDK):
         if not agent_id:
             raise ValueError("Agent ID is required to initialize an agent.")
         self.logger.info(f"Initializing agent with ID: {agent_id}")
-        return AgentSDK(api_key=self.api_key, base_id=self.base_id, agent_id=agent_id)
+        return AgentSDK(
+            api_key=self.api_key,
+            base_id=self.base_id,
+            agent_id=agent_id,
+            **self.client_options,
+        )
 
 
 # Agent capabilities as separate modules
@@ -88,11 +204,249 @@ class ExtractionCapability(AgentCapability):
     """Extraction capability for agents"""
 
     def __init__(
-        self, client: APIClient, agent_id: str, file_uploader: FileUploader, logger=None
+        self,
+        client: APIClient,
+        agent_id: str,
+        file_uploader: FileUploader,
+        logger=None,
+        poll_scheduler: Optional[PollScheduler] = None,
+        max_workers: int = 16,
+        dedup_index: Optional[DedupIndex] = None,
+        result_cache: Optional[ResultCache] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        duration_history: Optional[DurationHistory] = None,
+        completion_notifier: Optional[CompletionNotifier] = None,
+        job_journal: Optional[JobJournal] = None,
+        result_cache_ttl: float = 24 * 60 * 60,
+        poll_workers: Optional[int] = None,
     ):
+        """
+        Args:
+            client (APIClient): Client for the extraction API calls.
+            agent_id (str): The agent running the extractions.
+            file_uploader (FileUploader): Uploads the files to extract.
+            poll_scheduler (Optional[PollScheduler]): Scheduler of the status
+                polls. By default the process wide :meth:`PollScheduler.shared`
+                one, whose 4 workers issue the status calls of every SDK in
+                the process.
+            max_workers (int): Threads uploading and starting extractions.
+            dedup_index (Optional[DedupIndex]): Skip the upload and indexing of
+                content this agent already has an indexed file for.
+            result_cache (Optional[ResultCache]): Completed extraction responses,
+                reused for identical content and extraction versions instead of
+                extracting or downloading them again.
+            poll_strategy (Optional[PollStrategy]): Schedule of the indexing and
+                extraction status polls, defaults to 30s to 300s interleaved
+                intervals. :class:`ExponentialPollStrategy` picks up short
+                documents within seconds.
+            duration_history (Optional[DurationHistory]): Records how long
+                indexing and extraction take per file size, and polls files
+                with an :class:`EtaPollStrategy` around the predicted
+                completion once enough durations are known, unless a
+                ``poll_strategy`` is passed to the call.
+            completion_notifier (Optional[CompletionNotifier]): Source of
+                completion events, e.g. a :class:`WebhookReceiver`. An event
+                triggers the status check right away; polling only starts
+                once ``fallback_after`` seconds passed without one.
+            job_journal (Optional[JobJournal]): Records the stage, file id and
+                extraction id of every job so :meth:`resume` can continue
+                them after a crash.
+            result_cache_ttl (float): Seconds a result cached for identical
+                content is reused; changes to the agent's configuration reach
+                such files after at most this long. Defaults to a day.
+            poll_workers (Optional[int]): Status calls at once on a
+                :class:`PollScheduler` of this capability's own, shut down by
+                :meth:`close`, instead of the shared one.
+        """
+        if result_cache_ttl <= 0:
+            raise ValueError("result_cache_ttl must be positive.")
+        if poll_workers is not None and poll_scheduler is not None:
+            raise ValueError("Pass either poll_scheduler or poll_workers, not both.")
         super().__init__(client, agent_id, logger)
-        self.service = ExtractionService(client, agent_id=agent_id)
+        self.service = ExtractionService(
+            client, agent_id=agent_id, result_cache=result_cache
+        )
         self.file_uploader = file_uploader
+        self.dedup_index = dedup_index
+        self.result_cache = result_cache
+        self.result_cache_ttl = result_cache_ttl
+        self.poll_strategy = poll_strategy or DEFAULT_EXTRACTION_POLL_STRATEGY
+        self.duration_history = duration_history
+        self.completion_notifier = completion_notifier
+        self.job_journal = job_journal
+        # a scheduler built from poll_workers is owned and shut down by close()
+        self._owned_poll_scheduler = (
+            PollScheduler(max_workers=poll_workers) if poll_workers is not None else None
+        )
+        self.poll_scheduler = (
+            poll_scheduler or self._owned_poll_scheduler or PollScheduler.shared()
+        )
+        # uploads and extraction starts of submit_extraction()/extract()
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+        # unfinished jobs, failed by close()
+        self._jobs: Set[ExtractionJob] = set()
+
+    def _poll_indexing(
+        self,
+        file_id: str,
+        max_poll_timeout: float,
+        deadline: Deadline,
+        poll_strategy: PollStrategy,
+        poll_scheduler: Optional[PollScheduler] = None,
+    ) -> Future:
+        """Schedule polling of the file status until it is ``INDEXED``."""
+
+        def check_indexing_status():
+            resp = self.service.processing_status(file_id=file_id, deadline=deadline)
+            if resp.get("fileProcessingStatus") != "INDEXED":
+                self.logger.info("File indexing not completed, waiting...")
+            return resp
+
+        return self._watch(
+            CompletionNotifier.file_key(file_id),
+            check_indexing_status,
+            lambda resp: resp.get("fileProcessingStatus") == "INDEXED",
+            deadline.clamp(max_poll_timeout),
+            poll_strategy,
+            poll_scheduler,
+        )
+
+    def _watch(
+        self,
+        key: str,
+        poll: Callable[[], Dict],
+        condition: Callable[[Dict], bool],
+        max_timeout: float,
+        poll_strategy: PollStrategy,
+        poll_scheduler: Optional[PollScheduler] = None,
+    ) -> Future:
+        """
+        Schedule ``poll`` on ``poll_scheduler`` (the capability's unless given),
+        checking right away on completion events for ``key``.
+        """
+        scheduler = poll_scheduler or self.poll_scheduler
+        notifier = self.completion_notifier
+        if notifier is None:
+            return scheduler.submit(
+                poll, condition=condition, max_timeout=max_timeout, strategy=poll_strategy
+            )
+        future = scheduler.submit(
+            poll,
+            condition=condition,
+            max_timeout=max_timeout,
+            strategy=DelayedPollStrategy(poll_strategy, notifier.fallback_after),
+        )
+        unsubscribe = notifier.subscribe(
+            key, lambda _: scheduler.poll_now(future)
+        )
+        future.add_done_callback(lambda _: unsubscribe())
+        return future
+
+    def _phase_strategy(
+        self, phase: str, size: Optional[int], poll_strategy: Optional[PollStrategy]
+    ) -> PollStrategy:
+        """The given strategy, else one timed by past durations, else the default."""
+        if poll_strategy is not None:
+            return poll_strategy
+        if self.duration_history is not None and size is not None:
+            eta = self.duration_history.estimate(self.agent_id, phase, size)
+            if eta is not None:
+                self.logger.debug(f"Expecting {phase} to take {eta:.1f}s")
+                return EtaPollStrategy(eta, first_poll_fraction=0.8)
+        return self.poll_strategy
+
+    def _record_duration(self, phase: str, size: Optional[int], seconds: float):
+        if self.duration_history is not None and size is not None:
+            self.duration_history.record(self.agent_id, phase, size, seconds)
+
+    def _phase_timeout(
+        self,
+        deadline: Deadline,
+        max_poll_timeout: Optional[float],
+        size: Optional[int],
+        phase: str,
+        later_phases: Tuple[str, ...] = (),
+    ) -> Optional[float]:
+        """
+        Poll timeout of ``phase``: what is left of the deadline, capped by
+        ``max_poll_timeout``, minus the time learned for ``later_phases``.
+        Later phases with no learned duration keep
+        :data:`UNLEARNED_PHASES_SHARE` of the rest.
+
+        Raises:
+            DeadlineExceededError: If the learned durations of ``phase`` and
+                ``later_phases`` no longer fit in the deadline, so the job is
+                dropped now instead of running into it.
+        """
+        timeout = deadline.clamp(max_poll_timeout)
+        remaining = deadline.remaining()
+        if remaining is None:
+            return timeout
+        learned = {}
+        if self.duration_history is not None and size is not None:
+            for name in (phase,) + later_phases:
+                seconds = self.duration_history.estimate(self.agent_id, name, size)
+                if seconds is not None:
+                    learned[name] = seconds
+        reserve = sum(learned.get(name, 0.0) for name in later_phases)
+        if learned.get(phase, 0.0) + reserve > remaining:
+            raise DeadlineExceededError(
+                f"Deadline of {deadline.timeout} seconds leaves {remaining:.1f}s, "
+                f"{' and '.join(learned)} usually take {sum(learned.values()):.1f}s, "
+                "dropping the extraction"
+            )
+        if any(name not in learned for name in later_phases):
+            reserve += (remaining - reserve) * UNLEARNED_PHASES_SHARE
+        return min(timeout, remaining - reserve)
+
+    def _reuse_upload(self, content_hash: str, deadline: Deadline) -> Optional[str]:
+        """Return the indexed file id recorded for the content, if the server still has it."""
+        key = (content_hash, self.agent_id, self.client.base_id)
+        file_id = self.dedup_index.get(*key)
+        if file_id is None:
+            return None
+        try:
+            resp = self.service.processing_status(file_id=file_id, deadline=deadline)
+        except APIError as e:
+            self.logger.debug(f"Status of deduplicated file {file_id} failed: {e}")
+            resp = {}
+        if resp.get("fileProcessingStatus") == "INDEXED":
+            self.logger.info(f"Reusing indexed file {file_id} for identical content")
+            return file_id
+        self.dedup_index.remove(*key)
+        return None
+
+    def _poll_extraction(
+        self,
+        extraction_id: str,
+        version: int,
+        max_poll_timeout: float,
+        deadline: Deadline,
+        poll_strategy: PollStrategy,
+        poll_scheduler: Optional[PollScheduler] = None,
+    ) -> Future:
+        """Schedule polling of the extraction until its file status is ``COMPLETED``."""
+
+        def check_and_get_extracted_response():
+            resp = self.service.extracted_response_by_extraction_id(
+                extraction_id=extraction_id, version=version, deadline=deadline
+            )
+            if resp.get("file", {}).get("status") != "COMPLETED":
+                self.logger.info(
+                    f"File extraction not completed, status: {resp.get('file', {}).get('status')}, waiting..."
+                )
+            return resp
+
+        return self._watch(
+            CompletionNotifier.extraction_key(extraction_id),
+            check_and_get_extracted_response,
+            lambda resp: resp.get("file", {}).get("status") == "COMPLETED",
+            deadline.clamp(max_poll_timeout),
+            poll_strategy,
+            poll_scheduler,
+        )
 
     @with_logging_context(new_context=True)
     def extract(
@@ -100,20 +454,90 @@ class ExtractionCapability(AgentCapability):
         file_path: Optional[str] = None,
         file_stream: Optional[IO] = None,
         max_poll_timeout: Optional[float] = 1200,  # 20 minutes
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ) -> Dict:
         """
         Run the extraction pipeline for the agent by uploading a file.
 
+        Blocking shorthand for ``submit_extraction(...).result()``.
+
         Args:
             file_path (Optional[str], optional): Local file path.
             file_stream (Optional[IO], optional): File object/blob.
+            max_poll_timeout (Optional[float], optional): Timeout of each polling phase.
+            deadline (Optional[Deadline], optional): End-to-end budget shared by the
+                upload, indexing poll, extraction start and result poll.
+            poll_strategy (Optional[PollStrategy], optional): Overrides the
+                capability's poll schedule for this file.
+            cancellation (Optional[CancellationToken], optional): Stops the
+                extraction and returns right away when cancelled.
+            timeout (Optional[float], optional): Total budget in seconds shared by
+                all phases, shorthand for ``deadline=Deadline(timeout)``.
 
         Raises:
-            ValueError: If neither file_path nor file_stream is provided.
+            ValueError: If neither file_path nor file_stream is provided, or
+                both deadline and timeout are.
+            DeadlineExceededError: If the deadline passes before the extraction completes.
+            CancelledError: If ``cancellation`` is cancelled first, with the
+                file_id and extraction_id reached so far.
 
         Returns:
             Dict: Extracted response data from the file.
         """
+        return self.submit_extraction(
+            file_path=file_path,
+            file_stream=file_stream,
+            max_poll_timeout=max_poll_timeout,
+            deadline=deadline,
+            poll_strategy=poll_strategy,
+            cancellation=cancellation,
+            timeout=timeout,
+        ).result()
+
+    @with_logging_context(new_context=True)
+    def submit_extraction(
+        self,
+        file_path: Optional[str] = None,
+        file_stream: Optional[IO] = None,
+        max_poll_timeout: Optional[float] = 1200,
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> ExtractionJob:
+        """
+        Start the extraction pipeline in the background and return right away.
+
+        The upload and extraction start run on the capability's worker pool,
+        the status polls on the shared :class:`PollScheduler`, so no thread
+        waits on the extraction while it is processed server side.
+
+        Args:
+            file_path (Optional[str], optional): Local file path.
+            file_stream (Optional[IO], optional): File object/blob.
+            max_poll_timeout (Optional[float], optional): Timeout of each polling phase.
+            deadline (Optional[Deadline], optional): End-to-end budget shared by the
+                upload, indexing poll, extraction start and result poll.
+            poll_strategy (Optional[PollStrategy], optional): Overrides the
+                capability's poll schedule for this file.
+            cancellation (Optional[CancellationToken], optional): Fails the job
+                with :class:`CancelledError` when cancelled.
+            timeout (Optional[float], optional): Total budget in seconds shared by
+                all phases, shorthand for ``deadline=Deadline(timeout)``. With a
+                :class:`DurationHistory`, the indexing poll leaves the time
+                extraction usually takes, and a job that can no longer make it
+                fails early with :class:`DeadlineExceededError`.
+
+        Raises:
+            ValueError: If neither file_path nor file_stream is provided, or
+                both deadline and timeout are.
+
+        Returns:
+            ExtractionJob: Handle resolving to the extracted response.
+        """
         if not (file_path or file_stream):
             raise ValueError("One of file_path or file_stream must be provided.")
         if not self.agent_id:
@@ -122,95 +546,910 @@ class ExtractionCapability(AgentCapability):
         # Creating a new context for this extraction operation
         # The decorator already generated a new UUID, so no need to call generate_new_uuid() explicitly
         self.logger.info(f"Starting extraction task for file: {file_path or 'stream'}")
+        return self._submit(
+            file_path,
+            file_stream,
+            max_poll_timeout,
+            resolve_deadline(deadline, timeout),
+            self._get_executor(),
+            poll_strategy,
+            cancellation=cancellation,
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="splore-extract"
+                )
+            return self._executor
+
+    def close(self):
+        """
+        Stop the worker pool and fail the jobs not finished yet.
+
+        Unfinished jobs fail with :class:`CancelledError` carrying the ids
+        reached so far, requests already in flight are waited for. A poll
+        scheduler built from ``poll_workers`` is shut down too.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            jobs, self._jobs = self._jobs, set()
+        for job in jobs:
+            job._abort(
+                CancelledError(
+                    "Extraction capability closed",
+                    file_id=job.file_id,
+                    extraction_id=job.extraction_id,
+                    version=job.version,
+                )
+            )
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._owned_poll_scheduler is not None:
+            self._owned_poll_scheduler.shutdown()
+
+    def _track(self, job: ExtractionJob):
+        """Keep ``job`` for :meth:`close` to fail until it finishes."""
+        with self._executor_lock:
+            self._jobs.add(job)
+        job.add_done_callback(self._forget)
+
+    def _forget(self, job: ExtractionJob):
+        with self._executor_lock:
+            self._jobs.discard(job)
 
+    def _submit(
+        self,
+        file_path: Optional[str],
+        file_stream: Optional[IO],
+        max_poll_timeout: float,
+        deadline: Deadline,
+        executor: Executor,
+        poll_strategy: Optional[PollStrategy] = None,
+        start_executor: Optional[Executor] = None,
+        resume: Optional[JournalEntry] = None,
+        cancellation: Optional[CancellationToken] = None,
+        indexed_file: Optional[Future] = None,
+        priority: Optional[float] = None,
+        poll_scheduler: Optional[PollScheduler] = None,
+    ) -> ExtractionJob:
+        """
+        Drive one job: upload -> indexing poll -> start -> extraction poll.
+
+        The upload runs on ``executor``, queued by ``priority`` if it is a
+        :class:`PriorityExecutor`, the extraction start on ``start_executor``
+        (``executor`` unless given) and the polls on ``poll_scheduler`` (the
+        capability's unless given). A
+        journal entry to ``resume`` skips the stages it already got past, an
+        ``indexed_file`` future from :meth:`_index_file`, resolving to a file
+        indexed for several jobs and its content hash, replaces the upload and indexing poll, the time until it
+        resolves counting as indexing. Cancelling ``cancellation`` fails the
+        job with :class:`CancelledError` and stops its pending stage. The
+        time each phase took is recorded in ``job.phase_durations``.
+        """
+        start_executor = start_executor or executor
+        job = ExtractionJob(file_path=file_path)
+        if resume is not None:
+            job.journal_id = resume.job_id
+            job.file_id = resume.file_id
+            job.extraction_id = resume.extraction_id
+            job.version = resume.version
+        elif self.job_journal is not None:
+            job.journal_id = self.job_journal.add(
+                self.agent_id, self.client.base_id, file_path
+            )
+        context = get_logging_context()
+        content_hash: Optional[str] = None
+        size: Optional[int] = None
+        phase_started_at = time.monotonic()
         self.service.set_agent(agent_id=self.agent_id)
+
+        def run_in_executor(
+            stage: Callable[[], None], pool: Executor, priority: Optional[float] = None
+        ):
+            def run():
+                set_logging_context(context)
+                try:
+                    stage()
+                except Exception as e:
+                    fail(e)
+
+            try:
+                if priority is None:
+                    job._set_stage(pool.submit(run))
+                else:
+                    job._set_stage(pool.submit_prioritized(priority, run))
+            except Exception as e:
+                # e.g. the pool was shut down by close()
+                fail(e)
+
+        def then(next_stage: Callable[[Dict], None]):
+            def callback(future: Future):
+                if future.cancelled():
+                    return
+                error = future.exception()
+                if error is not None:
+                    fail(error)
+                    return
+                try:
+                    next_stage(future.result())
+                except Exception as e:
+                    fail(e)
+
+            return callback
+
+        def result_key() -> str:
+            # the server has no agent configuration version to key on, so these
+            # entries expire after result_cache_ttl instead
+            return cache_key("content", self.agent_id, content_hash)
+
+        def end_phase(phase: str):
+            nonlocal phase_started_at
+            now = time.monotonic()
+            job.phase_durations[phase] = now - phase_started_at
+            phase_started_at = now
+
+        def report(outcome: str):
+            durations = ", ".join(
+                f"{phase} {seconds:.1f}s" for phase, seconds in job.phase_durations.items()
+            )
+            self.logger.info(
+                f"Extraction job {outcome} after {deadline.elapsed():.1f}s"
+                + (f" ({durations})" if durations else "")
+            )
+
+        def fail(error: BaseException):
+            if not job.done():
+                report("failed")
+            job._set_exception(error)
+
+        def record(state: str, **fields):
+            if job.journal_id is not None:
+                self.job_journal.update(job.journal_id, state, **fields)
+
+        def finished(job: ExtractionJob):
+            error = None if job.cancelled() else job.exception()
+            if isinstance(error, CancelledError):
+                # keep the last stage so resume() continues the job
+                return
+            record(job.state, error=str(error) if error is not None else None)
+
+        def cancel():
+            job._abort(
+                CancelledError(
+                    f"Extraction {cancellation.reason}",
+                    file_id=job.file_id,
+                    extraction_id=job.extraction_id,
+                    version=job.version,
+                )
+            )
+
+        def upload():
+            nonlocal content_hash, size, phase_started_at
+            if not job._set_state(ExtractionState.UPLOADING):
+                return
+            phase_started_at = time.monotonic()
+            spool = None
+            try:
+                if self.dedup_index is not None or self.result_cache is not None:
+                    content_hash, spool = content_sha256(file_path, file_stream)
+                if self.result_cache is not None:
+                    cached = self.result_cache.get(result_key())
+                    if cached is not None:
+                        self.logger.info("Reusing cached extraction of identical content")
+                        end_phase("upload")
+                        report("completed")
+                        job._set_result(cached)
+                        return
+                if self.duration_history is not None:
+                    size = source_size(file_path, spool or file_stream)
+                if self.dedup_index is not None:
+                    job.file_id = self._reuse_upload(content_hash, deadline)
+                    if job.file_id is not None:
+                        end_phase("upload")
+                        start()
+                        return
+                self.logger.info(
+                    f"Starting file upload for agent {self.agent_id}, file: {file_path}"
+                )
+                job.file_id = self.file_uploader.upload_file(
+                    file_path=file_path,
+                    file_stream=spool or file_stream,
+                    deadline=deadline,
+                )
+            finally:
+                if spool is not None:
+                    spool.close()
+            self.logger.info(f"File upload completed with file_id: {job.file_id}")
+            end_phase("upload")
+            record(ExtractionState.INDEXING, file_id=job.file_id)
+            wait_for_indexing()
+
+        def wait_for_indexing():
+            nonlocal phase_started_at
+            # Wait for indexing to complete with timeout, polled by the shared scheduler,
+            # leaving the time extraction usually takes out of the deadline
+            phase_started_at = time.monotonic()
+            indexing = self._poll_indexing(
+                job.file_id,
+                self._phase_timeout(
+                    deadline,
+                    max_poll_timeout,
+                    size,
+                    DurationHistory.INDEXING,
+                    (DurationHistory.EXTRACTION,),
+                ),
+                deadline,
+                self._phase_strategy(DurationHistory.INDEXING, size, poll_strategy),
+                poll_scheduler,
+            )
+            if job._set_stage(indexing, ExtractionState.INDEXING):
+                indexing.add_done_callback(then(lambda _: run_in_executor(indexed, start_executor)))
+
+        def wait_for_shared_file():
+            # a copy, cancelling the job must not cancel the other jobs' file
+            waiting: Future = Future()
+            indexed_file.add_done_callback(lambda shared: _chain(shared, waiting))
+            if job._set_stage(waiting, ExtractionState.INDEXING):
+                waiting.add_done_callback(then(shared_file_indexed))
+
+        def shared_file_indexed(shared: Tuple[str, Optional[str]]):
+            nonlocal content_hash
+            job.file_id, content_hash = shared
+            end_phase(DurationHistory.INDEXING)
+            record(ExtractionState.INDEXING, file_id=job.file_id)
+            run_in_executor(start, start_executor)
+
+        def indexed():
+            end_phase(DurationHistory.INDEXING)
+            self._record_duration(
+                DurationHistory.INDEXING, size, job.phase_durations[DurationHistory.INDEXING]
+            )
+            if self.dedup_index is not None:
+                self.dedup_index.put(
+                    content_hash, self.agent_id, self.client.base_id, job.file_id
+                )
+            start()
+
+        def start():
+            if not job._set_state(ExtractionState.STARTING):
+                return
+            # don't start server side work the deadline leaves no time for
+            self._phase_timeout(
+                deadline, max_poll_timeout, size, DurationHistory.EXTRACTION
+            )
+            extraction_resp = self.service.start(file_id=job.file_id, deadline=deadline)
+            if extraction_resp is None:
+                raise Exception("Extraction Failed")
+            job.extraction_id = extraction_resp.get("extractionId", None)
+            self.logger.info(
+                f"File extraction started with extractionId: {job.extraction_id}"
+            )
+            record(
+                ExtractionState.EXTRACTING,
+                file_id=job.file_id,
+                extraction_id=job.extraction_id,
+                version=job.version,
+            )
+            end_phase("start")
+            wait_for_extraction()
+
+        def wait_for_extraction():
+            nonlocal phase_started_at
+            # Wait for extraction to complete with timeout
+            phase_started_at = time.monotonic()
+            extraction = self._poll_extraction(
+                job.extraction_id,
+                job.version,
+                max_poll_timeout,
+                deadline,
+                self._phase_strategy(DurationHistory.EXTRACTION, size, poll_strategy),
+                poll_scheduler,
+            )
+            if job._set_stage(extraction, ExtractionState.EXTRACTING):
+                extraction.add_done_callback(then(completed))
+
+        def completed(extracted_resp: Dict):
+            self.logger.info("File extraction completed")
+            end_phase(DurationHistory.EXTRACTION)
+            self._record_duration(
+                DurationHistory.EXTRACTION,
+                size,
+                job.phase_durations[DurationHistory.EXTRACTION],
+            )
+            # resumed jobs never hashed their content
+            if (
+                self.result_cache is not None
+                and content_hash is not None
+                and is_completed(extracted_resp)
+            ):
+                self.result_cache.set(
+                    result_key(), extracted_resp, ttl=self.result_cache_ttl
+                )
+            report("completed")
+            job._set_result(extracted_resp)
+
+        self._track(job)
+        if job.journal_id is not None:
+            job.add_done_callback(finished)
+        if cancellation is not None:
+            remove = cancellation.add_callback(cancel)
+            job.add_done_callback(lambda _: remove())
+        if job.extraction_id is not None:
+            self.logger.info(f"Resuming extraction {job.extraction_id}")
+            run_in_executor(wait_for_extraction, start_executor)
+        elif job.file_id is not None:
+            self.logger.info(f"Resuming indexing of file {job.file_id}")
+            run_in_executor(wait_for_indexing, executor)
+        elif indexed_file is not None:
+            wait_for_shared_file()
+        else:
+            run_in_executor(upload, executor, priority)
+        return job
+
+    def extract_many(
+        self,
+        inputs: Iterable[BatchInput],
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        max_poll_timeout: Optional[float] = 1200,
+        priority: Optional[Callable[[BatchInput], float]] = None,
+        aging_rate: float = 1.0,
+    ) -> List[BatchResult]:
+        """
+        Run the extraction pipeline for many files with bounded concurrency.
+
+        All files share this capability's API client, connection pool and file
+        uploader, so a batch needs one SDK instance instead of one per file.
+        Uploads and extraction starts run on ``max_concurrency`` threads, the
+        status polls of every file on the shared :class:`PollScheduler`.
+        A failing file does not abort the batch: its exception is collected in
+        the matching :class:`BatchResult`.
+
+        Uploads start in input order unless a ``priority`` is given: then the
+        inputs of lowest priority go first, and a waiting input's priority
+        drops by ``aging_rate`` per second so large files are not starved.
+        With :func:`size_priority`, small documents no longer queue behind
+        large ones (shortest job first).
+
+        Example:
+            >>> agent.extraction.extract_many(paths, priority=size_priority)
+
+        Args:
+            inputs (Iterable[BatchInput]): File paths and/or file streams.
+            max_concurrency (int, optional): Maximum files uploading or starting
+                at once. Defaults to 8.
+            ordered (bool, optional): Return results in input order (default) or
+                in completion order.
+            max_poll_timeout (Optional[float], optional): Timeout of each polling phase.
+            priority (Optional[Callable[[BatchInput], float]], optional): Priority
+                of each input, lowest first, e.g. :func:`size_priority` or page
+                counts.
+            aging_rate (float, optional): Priority a waiting input loses per
+                second. Defaults to 1.0.
+
+        Returns:
+            List[BatchResult]: One result per input.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if not self.agent_id:
+            raise ValueError("Agent ID is required for extraction flow.")
+        items = list(inputs)
+        results: List[Optional[BatchResult]] = [None] * len(items)
+        completed: List[BatchResult] = []
+        self.logger.info(
+            f"Starting batch extraction of {len(items)} files, max_concurrency: {max_concurrency}"
+        )
+
+        if priority is None:
+            executor: Executor = ThreadPoolExecutor(
+                max_workers=max_concurrency, thread_name_prefix="splore-extract"
+            )
+        else:
+            executor = PriorityExecutor(
+                max_concurrency, aging_rate=aging_rate, thread_name_prefix="splore-extract"
+            )
+        with executor:
+            futures = {}
+            for index, item in enumerate(items):
+                try:
+                    kwargs = input_kwargs(item)
+                    item_priority = None if priority is None else priority(item)
+                except (ValueError, OSError) as e:
+                    results[index] = BatchResult(input=item, error=e)
+                    completed.append(results[index])
+                    continue
+                job = self._submit(
+                    kwargs["file_path"],
+                    kwargs["file_stream"],
+                    max_poll_timeout,
+                    Deadline(),
+                    executor,
+                    priority=item_priority,
+                )
+                futures[job.future] = index
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    batch_result = BatchResult(input=items[index], result=future.result())
+                except Exception as e:
+                    batch_result = BatchResult(input=items[index], error=e)
+                results[index] = batch_result
+                completed.append(batch_result)
+
+        failed = sum(1 for result in completed if not result.ok)
         self.logger.info(
-            f"Starting file upload for agent {self.agent_id}, file: {file_path}"
+            f"Batch extraction finished: {len(items) - failed} succeeded, {failed} failed"
         )
-        upload_res = self.file_uploader.upload_file(
-            file_path=file_path, file_stream=file_stream
+        return results if ordered else completed
+
+    def extract_as_completed(
+        self,
+        inputs: Iterable[BatchInput],
+        max_in_flight: int = 8,
+        max_poll_timeout: Optional[float] = 1200,
+    ) -> Iterator[BatchResult]:
+        """
+        Extract many files, yielding each :class:`BatchResult` as soon as it finishes.
+
+        Inputs are consumed lazily and at most ``max_in_flight`` extractions
+        run at once, so memory stays flat however long ``inputs`` is, and
+        results can be written downstream while other files are still
+        indexing. Failing files are yielded with their exception. Closing the
+        generator early cancels the extractions still in flight.
+
+        Example:
+            >>> for result in agent.extraction.extract_as_completed(paths, max_in_flight=16):
+            ...     writer.write(result.input, result.result if result.ok else result.error)
+
+        Args:
+            inputs (Iterable[BatchInput]): File paths and/or file streams, may be
+                a generator.
+            max_in_flight (int, optional): Maximum extractions running at once.
+                Defaults to 8.
+            max_poll_timeout (Optional[float], optional): Timeout of each polling phase.
+
+        Returns:
+            Iterator[BatchResult]: One result per input, in completion order.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        if not self.agent_id:
+            raise ValueError("Agent ID is required for extraction flow.")
+        return self._extract_as_completed(iter(inputs), max_in_flight, max_poll_timeout)
+
+    def _extract_as_completed(
+        self,
+        inputs: Iterator[BatchInput],
+        max_in_flight: int,
+        max_poll_timeout: float,
+    ) -> Iterator[BatchResult]:
+        executor = self._get_executor()
+        in_flight: Dict[Future, Tuple[BatchInput, ExtractionJob]] = {}
+
+        def finished(return_when) -> List[BatchResult]:
+            done, _ = wait(list(in_flight), return_when=return_when)
+            results = []
+            for future in done:
+                item, _ = in_flight.pop(future)
+                try:
+                    results.append(BatchResult(input=item, result=future.result()))
+                except Exception as e:
+                    results.append(BatchResult(input=item, error=e))
+            return results
+
+        try:
+            for item in inputs:
+                try:
+                    kwargs = input_kwargs(item)
+                except (ValueError, OSError) as e:
+                    yield BatchResult(input=item, error=e)
+                    continue
+                job = self._submit(
+                    kwargs["file_path"],
+                    kwargs["file_stream"],
+                    max_poll_timeout,
+                    Deadline(),
+                    executor,
+                )
+                in_flight[job.future] = (item, job)
+                if len(in_flight) >= max_in_flight:
+                    yield from finished(FIRST_COMPLETED)
+            while in_flight:
+                yield from finished(FIRST_COMPLETED)
+        finally:
+            for _, job in in_flight.values():
+                job.cancel()
+
+    @with_logging_context(new_context=True)
+    def extract_with_agents(
+        self,
+        agent_ids: Iterable[str],
+        file_path: Optional[str] = None,
+        file_stream: Optional[IO] = None,
+        max_poll_timeout: Optional[float] = 1200,
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, BatchResult]:
+        """
+        Extract one file with several agents of the base, uploading it once.
+
+        Blocking shorthand for :meth:`submit_to_agents`. An agent failing does
+        not fail the others: its exception is collected in its result.
+
+        Example:
+            >>> results = agent.extraction.extract_with_agents(
+            ...     ["invoice_header", "line_items", "compliance"], file_path="invoice.pdf"
+            ... )
+            >>> results["line_items"].result
+
+        Args:
+            agent_ids (Iterable[str]): The agents extracting the file.
+            file_path (Optional[str], optional): Local file path.
+            file_stream (Optional[IO], optional): File object/blob.
+            max_poll_timeout (Optional[float], optional): Timeout of each polling phase.
+            deadline (Optional[Deadline], optional): End-to-end budget shared by the
+                upload, indexing poll and every agent's extraction.
+            poll_strategy (Optional[PollStrategy], optional): Overrides the
+                capability's poll schedule for this file.
+            cancellation (Optional[CancellationToken], optional): Stops every
+                agent's extraction when cancelled.
+            timeout (Optional[float], optional): Total budget in seconds,
+                shorthand for ``deadline=Deadline(timeout)``.
+
+        Raises:
+            ValueError: If neither file_path nor file_stream is provided, or no
+                agent_ids are.
+
+        Returns:
+            Dict[str, BatchResult]: The result of each agent, by agent id.
+        """
+        jobs = self.submit_to_agents(
+            agent_ids,
+            file_path=file_path,
+            file_stream=file_stream,
+            max_poll_timeout=max_poll_timeout,
+            deadline=deadline,
+            poll_strategy=poll_strategy,
+            cancellation=cancellation,
+            timeout=timeout,
+        )
+        results = {}
+        for agent_id, job in jobs.items():
+            try:
+                results[agent_id] = BatchResult(input=agent_id, result=job.result())
+            except Exception as e:
+                results[agent_id] = BatchResult(input=agent_id, error=e)
+        return results
+
+    @with_logging_context(new_context=True)
+    def submit_to_agents(
+        self,
+        agent_ids: Iterable[str],
+        file_path: Optional[str] = None,
+        file_stream: Optional[IO] = None,
+        max_poll_timeout: Optional[float] = 1200,
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, ExtractionJob]:
+        """
+        Start extractions of one file by several agents in the background.
+
+        The file is uploaded and its indexing awaited once, then every agent's
+        extraction is started and polled concurrently, saving an upload and an
+        indexing wait per extra agent. The agents share this capability's
+        connection pool, uploader, poll scheduler and stores. Takes the
+        arguments of :meth:`extract_with_agents`.
+
+        Returns:
+            Dict[str, ExtractionJob]: The job of each agent, by agent id. A
+            failed upload or indexing fails all of them.
+        """
+        if not (file_path or file_stream):
+            raise ValueError("One of file_path or file_stream must be provided.")
+        agent_ids = list(dict.fromkeys(agent_ids))
+        if not agent_ids:
+            raise ValueError("At least one agent_id is required.")
+        deadline = resolve_deadline(deadline, timeout)
+        executor = self._get_executor()
+        agents = [self._for_agent(agent_id) for agent_id in agent_ids]
+        self.logger.info(
+            f"Starting extraction of {file_path or 'stream'} for agents: {', '.join(agent_ids)}"
         )
-        self.logger.info(f"File upload completed with file_id: {upload_res}")
-
-        # Define the polling function for indexing status
-        @poll_with_timeout(
-            condition=lambda resp: resp.get("fileProcessingStatus") == "INDEXED",
-            max_timeout=max_poll_timeout,
-            min_poll_interval=30,
-            max_poll_interval=300,
+        indexed_file = agents[0]._index_file(
+            file_path,
+            file_stream,
+            max_poll_timeout,
+            deadline,
+            executor,
+            poll_strategy or self.poll_strategy,
         )
-        def check_indexing_status():
-            resp = self.service.processing_status(file_id=upload_res)
-            if resp.get("fileProcessingStatus") != "INDEXED":
-                self.logger.info("File indexing not completed, waiting...")
-            return resp
+        jobs = {
+            agent.agent_id: agent._submit(
+                file_path,
+                None,
+                max_poll_timeout,
+                deadline,
+                executor,
+                poll_strategy,
+                cancellation=cancellation,
+                indexed_file=indexed_file,
+            )
+            for agent in agents
+        }
+        unfinished = [len(jobs)]
+        lock = Lock()
 
-        # Wait for indexing to complete with timeout
-        check_indexing_status()
+        def job_finished(_):
+            with lock:
+                unfinished[0] -= 1
+                if unfinished[0]:
+                    return
+            # nobody is waiting for the file any more
+            indexed_file.cancel()
 
-        extraction_resp = self.service.start(file_id=upload_res)
-        if extraction_resp is None:
-            raise Exception("Extraction Failed")
-        extraction_id = extraction_resp.get("extractionId", None)
-        self.logger.info(f"File extraction started with extractionId: {extraction_id}")
-
-        # Define the polling function for extraction status
-        @poll_with_timeout(
-            condition=lambda resp: resp.get("file", {}).get("status") == "COMPLETED",
-            max_timeout=max_poll_timeout,
-            min_poll_interval=30,
-            max_poll_interval=300,
+        for job in jobs.values():
+            # the other agents' capabilities are not closed, this one is
+            self._track(job)
+            job.add_done_callback(job_finished)
+        return jobs
+
+    def _for_agent(self, agent_id: str) -> "ExtractionCapability":
+        """This capability for another agent of the base, sharing its pools and stores."""
+        if agent_id == self.agent_id:
+            return self
+        return ExtractionCapability(
+            self.client.for_agent(agent_id),
+            agent_id,
+            self.file_uploader,
+            self.logger,
+            poll_scheduler=self.poll_scheduler,
+            max_workers=self.max_workers,
+            dedup_index=self.dedup_index,
+            result_cache=self.result_cache,
+            result_cache_ttl=self.result_cache_ttl,
+            poll_strategy=self.poll_strategy,
+            duration_history=self.duration_history,
+            completion_notifier=self.completion_notifier,
+            job_journal=self.job_journal,
         )
-        def check_and_get_extracted_response():
-            resp = self.service.extracted_response_by_extraction_id(
-                extraction_id=extraction_id
+
+    def _index_file(
+        self,
+        file_path: Optional[str],
+        file_stream: Optional[IO],
+        max_poll_timeout: float,
+        deadline: Deadline,
+        executor: ThreadPoolExecutor,
+        poll_strategy: PollStrategy,
+    ) -> Future:
+        """
+        Upload a file and poll its indexing, resolving to the file id and
+        the sha256 of its content (``None`` without a dedup index or result
+        cache).
+
+        An indexed upload of the same content in the dedup index is reused.
+        Cancelling the returned future stops the pending upload or poll.
+        """
+        indexed: Future = Future()
+        context = get_logging_context()
+        stage: Optional[Future] = None
+        stage_lock = Lock()
+
+        def set_stage(future: Future):
+            nonlocal stage
+            with stage_lock:
+                stage = future
+            if indexed.cancelled():
+                future.cancel()
+
+        def upload():
+            set_logging_context(context)
+            content_hash = spool = None
+            try:
+                file_id = None
+                if self.dedup_index is not None or self.result_cache is not None:
+                    content_hash, spool = content_sha256(file_path, file_stream)
+                if self.dedup_index is not None:
+                    file_id = self._reuse_upload(content_hash, deadline)
+                if file_id is None:
+                    file_id = self.file_uploader.upload_file(
+                        file_path=file_path,
+                        file_stream=spool or file_stream,
+                        deadline=deadline,
+                    )
+                    self.logger.info(f"File upload completed with file_id: {file_id}")
+                polling = self._poll_indexing(
+                    file_id, max_poll_timeout, deadline, poll_strategy
+                )
+            except Exception as e:
+                if indexed.set_running_or_notify_cancel():
+                    indexed.set_exception(e)
+                return
+            finally:
+                if spool is not None:
+                    spool.close()
+            polling.add_done_callback(
+                lambda future: done_indexing(future, file_id, content_hash)
             )
-            if resp.get("file", {}).get("status") != "COMPLETED":
-                self.logger.info(
-                    f"File extraction not completed, status: {resp.get('file', {}).get('status')}, waiting..."
+            set_stage(polling)
+
+        def done_indexing(polling: Future, file_id: str, content_hash: Optional[str]):
+            if not indexed.set_running_or_notify_cancel():
+                return
+            if polling.cancelled():
+                indexed.set_exception(FutureCancelledError())
+            elif polling.exception() is not None:
+                indexed.set_exception(polling.exception())
+            else:
+                if self.dedup_index is not None:
+                    self.dedup_index.put(
+                        content_hash, self.agent_id, self.client.base_id, file_id
+                    )
+                indexed.set_result((file_id, content_hash))
+
+        indexed.add_done_callback(lambda _: stage is not None and stage.cancel())
+        # a quick upload must not have its poll replaced by the upload's future
+        with stage_lock:
+            stage = executor.submit(upload)
+        return indexed
+
+    def resume(
+        self,
+        max_poll_timeout: Optional[float] = 1200,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> List[ExtractionJob]:
+        """
+        Continue the unfinished jobs recorded in the job journal.
+
+        Each job picks up at the last recorded stage: started extractions are
+        polled again, indexing files are polled and then started, and files
+        that never finished uploading are uploaded again from their path.
+        Stream inputs cannot be read again and are marked ``FAILED`` unless
+        their upload completed. Call it on startup, before other processes
+        sharing the journal submit new work.
+
+        Example:
+            >>> for job in agent.extraction.resume():
+            ...     print(job.file_path, job.result())
+
+        Args:
+            max_poll_timeout (Optional[float], optional): Timeout of each polling phase.
+            poll_strategy (Optional[PollStrategy], optional): Overrides the
+                capability's poll schedule for the resumed jobs.
+
+        Raises:
+            ValueError: If the capability has no job journal.
+
+        Returns:
+            List[ExtractionJob]: The resumed jobs, oldest first.
+        """
+        if self.job_journal is None:
+            raise ValueError("resume() needs a job_journal.")
+        executor = self._get_executor()
+        jobs = []
+        for entry in self.job_journal.entries(
+            self.agent_id, self.client.base_id, unfinished=True
+        ):
+            if entry.file_id is None and entry.file_path is None:
+                self.job_journal.update(
+                    entry.job_id,
+                    ExtractionState.FAILED,
+                    error="Stream input interrupted before its upload completed",
                 )
-            return resp
+                continue
+            jobs.append(
+                self._submit(
+                    entry.file_path,
+                    None,
+                    max_poll_timeout,
+                    Deadline(),
+                    executor,
+                    poll_strategy,
+                    resume=entry,
+                )
+            )
+        self.logger.info(f"Resumed {len(jobs)} extraction jobs")
+        return jobs
 
-        # Wait for extraction to complete with timeout
-        extracted_resp = check_and_get_extracted_response()
-        self.logger.info("File extraction completed")
-        return extracted_resp
+    def pipeline(
+        self,
+        upload_workers: int = 4,
+        start_workers: int = 4,
+        upload_queue_size: int = 8,
+        max_in_flight: int = 64,
+        max_poll_timeout: Optional[float] = 1200,
+        poll_workers: Optional[int] = None,
+    ) -> ExtractionPipeline:
+        """
+        Create an :class:`ExtractionPipeline` with separate upload and start workers.
+
+        Unlike :meth:`extract_many`, where one pool uploads and starts
+        extractions, the next uploads never wait behind starts (or the other
+        way round), and :meth:`ExtractionPipeline.submit` blocks the producer
+        once the pipeline is full.
+
+        Args:
+            upload_workers (int, optional): Files uploading at once. Defaults to 4.
+            start_workers (int, optional): Extractions being started at once.
+                Defaults to 4.
+            upload_queue_size (int, optional): Files waiting for an upload worker.
+                Defaults to 8.
+            max_in_flight (int, optional): Files submitted and not finished yet.
+                Defaults to 64.
+            max_poll_timeout (Optional[float], optional): Timeout of each polling phase.
+            poll_workers (Optional[int], optional): Status calls of the pipeline's
+                own :class:`PollScheduler`, by default it polls on the capability's.
+
+        Returns:
+            ExtractionPipeline: Close it (or use it as a context manager) when done.
+        """
+        if not self.agent_id:
+            raise ValueError("Agent ID is required for extraction flow.")
+        return ExtractionPipeline(
+            self,
+            upload_workers=upload_workers,
+            start_workers=start_workers,
+            upload_queue_size=upload_queue_size,
+            max_in_flight=max_in_flight,
+            max_poll_timeout=max_poll_timeout,
+            poll_workers=poll_workers,
+        )
 
     @with_logging_context(new_context=True)
     def retry_extraction(
-        self, extraction_id: str, max_poll_timeout: Optional[float] = 1200
+        self,
+        extraction_id: str,
+        max_poll_timeout: Optional[float] = 1200,
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ):
         # The decorator already generated a new UUID, so no need to call generate_new_uuid() explicitly
         self.logger.info(
             f"Starting extraction retry task for extraction ID: {extraction_id}"
         )
 
+        deadline = resolve_deadline(deadline, timeout)
+        if cancellation is not None:
+            cancellation.check("Extraction retry", extraction_id=extraction_id)
         extraction_resp = self.service.start_extraction_by_extraction_id(
-            extraction_id=extraction_id
+            extraction_id=extraction_id, deadline=deadline
         )
         if extraction_resp is None:
             raise Exception("Extraction Failed")
         version = extraction_resp.get("version", 1)
 
-        # Define the polling function for extraction status
-        @poll_with_timeout(
-            condition=lambda resp: resp.get("file", {}).get("status") == "COMPLETED",
-            max_timeout=max_poll_timeout,
-            min_poll_interval=30,
-            max_poll_interval=300,
-        )
-        def check_and_get_extracted_response():
-            resp = self.service.extracted_response_by_extraction_id(
-                extraction_id=extraction_id, version=version
-            )
-            if resp.get("file", {}).get("status") != "COMPLETED":
-                self.logger.info(
-                    f"File extraction not completed, status: {resp.get('file', {}).get('status')}, waiting..."
-                )
-            return resp
-
         # Wait for extraction to complete with timeout
-        extracted_resp = check_and_get_extracted_response()
+        extraction = self._poll_extraction(
+            extraction_id,
+            version,
+            max_poll_timeout,
+            deadline,
+            poll_strategy or self.poll_strategy,
+        )
+        if cancellation is None:
+            extracted_resp = extraction.result()
+        else:
+            remove = cancellation.add_callback(extraction.cancel)
+            try:
+                extracted_resp = extraction.result()
+            except FutureCancelledError:
+                raise CancelledError(
+                    f"Extraction retry {cancellation.reason}",
+                    extraction_id=extraction_id,
+                    version=version,
+                ) from None
+            finally:
+                remove()
         self.logger.info("File extraction completed")
         return extracted_resp
 
@@ -272,17 +1511,25 @@ class SearchCapability(AgentCapability):
 
 # Main Agent SDK with capabilities
 class AgentSDK(BaseSDK):
-    def __init__(self, api_key: str, base_id: str, agent_id: str):
-        super().__init__(api_key, base_id, agent_id=agent_id)
+    def __init__(self, api_key: str, base_id: str, agent_id: str, **client_options):
+        super().__init__(api_key, base_id, agent_id=agent_id, **client_options)
 
         # Initialize capabilities
         self._extraction = ExtractionCapability(
-            self.client, agent_id, self.file_uploader, self.logger
+            self.client,
+            agent_id,
+            self.file_uploader,
+            self.logger,
+            **self.extraction_options,
         )
         self._search = SearchCapability(self.client, agent_id, self.logger)
 
         # For backward compatibility
-        self.extractions = ExtractionService(self.client, agent_id=agent_id)
+        self.extractions = ExtractionService(
+            self.client,
+            agent_id=agent_id,
+            result_cache=self.extraction_options.get("result_cache"),
+        )
         self._search_service = SearchService(self.client, agent_id=agent_id)
 
     @property
@@ -290,6 +1537,11 @@ class AgentSDK(BaseSDK):
         """Access to extraction capabilities"""
         return self._extraction
 
+    def close(self):
+        """Stop the extraction workers and release the pooled HTTP connections."""
+        self.extraction.close()
+        super().close()
+
     @property
     def search(self) -> SearchCapability:
         """Access to search capabilities"""
@@ -306,6 +1558,10 @@ class AgentSDK(BaseSDK):
         file_path: Optional[str] = None,
         file_stream: Optional[IO] = None,
         max_poll_timeout: Optional[float] = 1200,
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ) -> Dict:
         """Backward compatibility method for extraction"""
         if file_path is None and file_stream is None:
@@ -314,8 +1570,83 @@ class AgentSDK(BaseSDK):
             file_path=file_path,
             file_stream=file_stream,
             max_poll_timeout=max_poll_timeout,
+            deadline=deadline,
+            poll_strategy=poll_strategy,
+            cancellation=cancellation,
+            timeout=timeout,
+        )
+
+    def submit_extraction(
+        self,
+        file_path: Optional[str] = None,
+        file_stream: Optional[IO] = None,
+        max_poll_timeout: Optional[float] = 1200,
+        deadline: Optional[Deadline] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancellation: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> ExtractionJob:
+        """Start an extraction in the background, see :meth:`ExtractionCapability.submit_extraction`."""
+        return self.extraction.submit_extraction(
+            file_path=file_path,
+            file_stream=file_stream,
+            max_poll_timeout=max_poll_timeout,
+            deadline=deadline,
+            poll_strategy=poll_strategy,
+            cancellation=cancellation,
+            timeout=timeout,
         )
 
+    def extract_many(
+        self,
+        inputs: Iterable[BatchInput],
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        max_poll_timeout: Optional[float] = 1200,
+        priority: Optional[Callable[[BatchInput], float]] = None,
+        aging_rate: float = 1.0,
+    ) -> List[BatchResult]:
+        """Run the extraction pipeline for many files, see :meth:`ExtractionCapability.extract_many`."""
+        return self.extraction.extract_many(
+            inputs,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            max_poll_timeout=max_poll_timeout,
+            priority=priority,
+            aging_rate=aging_rate,
+        )
+
+    def extract_as_completed(
+        self,
+        inputs: Iterable[BatchInput],
+        max_in_flight: int = 8,
+        max_poll_timeout: Optional[float] = 1200,
+    ) -> Iterator[BatchResult]:
+        """Stream batch results as they finish, see :meth:`ExtractionCapability.extract_as_completed`."""
+        return self.extraction.extract_as_completed(
+            inputs, max_in_flight=max_in_flight, max_poll_timeout=max_poll_timeout
+        )
+
+    def extract_with_agents(
+        self, agent_ids: Iterable[str], **options
+    ) -> Dict[str, BatchResult]:
+        """Extract one file with several agents, see :meth:`ExtractionCapability.extract_with_agents`."""
+        return self.extraction.extract_with_agents(agent_ids, **options)
+
+    def submit_to_agents(
+        self, agent_ids: Iterable[str], **options
+    ) -> Dict[str, ExtractionJob]:
+        """Start one file's extractions by several agents, see :meth:`ExtractionCapability.submit_to_agents`."""
+        return self.extraction.submit_to_agents(agent_ids, **options)
+
+    def resume(self, **options) -> List[ExtractionJob]:
+        """Continue journaled jobs after a crash, see :meth:`ExtractionCapability.resume`."""
+        return self.extraction.resume(**options)
+
+    def pipeline(self, **options) -> ExtractionPipeline:
+        """Staged extraction pipeline, see :meth:`ExtractionCapability.pipeline`."""
+        return self.extraction.pipeline(**options)
+
     def search_query(
         self, query: str, count: Optional[int] = 10, engine: Optional[str] = "google"
     ) -> Dict:
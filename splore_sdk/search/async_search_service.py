@@ -0,0 +1,43 @@
+from typing import Optional
+from splore_sdk.core.async_api_client import AsyncAPIClient
+from .search_service import SearchService
+
+
+class AsyncSearchService(SearchService):
+    """asyncio version of :class:`SearchService`."""
+
+    def __init__(self, api_client: AsyncAPIClient, agent_id: str):
+        super().__init__(api_client, agent_id=agent_id)
+
+    async def search(
+        self, query: str, count: Optional[int] = 10, engine: Optional[str] = "google"
+    ):
+        """
+        Perform a search query using the specified parameters.
+
+        Args:
+            query: The search query string
+            count: Number of results to return (default: 10)
+            engine: Search engine to use (default: "google")
+
+        Returns:
+            The search results from the API
+        """
+        return await super().search(query=query, count=count, engine=engine)
+
+    async def get_search_history(
+        self,
+        page: Optional[int] = 0,
+        size: Optional[int] = 10,
+    ):
+        """
+        Get search history for the current agent.
+
+        Args:
+            page: Page number for pagination (default: 0)
+            size: Number of results per page (default: 10)
+
+        Returns:
+            The search history from the API
+        """
+        return await super().get_search_history(page=page, size=size)
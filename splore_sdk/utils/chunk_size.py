@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Dict, List, Optional
+
+MIN_UPLOAD_CHUNK_SIZE = 256 * 1024
+MAX_UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class AdaptiveChunkSize:
+    """
+    Picks the size of the next tus chunk from the measured upload throughput.
+
+    Each chunk aims to take ``target_seconds``: on fast links where the PATCH
+    round trip dominates the size grows, on slow or flaky links it shrinks so
+    a failed chunk wastes less. A step never more than doubles or halves the
+    size, and the result stays within ``[min_size, max_size]``.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        min_size: int = MIN_UPLOAD_CHUNK_SIZE,
+        max_size: int = MAX_UPLOAD_CHUNK_SIZE,
+        target_seconds: float = 2.0,
+        smoothing: float = 0.5,
+    ):
+        if not 0 < min_size <= max_size:
+            raise ValueError("Chunk size bounds must satisfy 0 < min_size <= max_size.")
+        if target_seconds <= 0:
+            raise ValueError("target_seconds must be positive.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_seconds = target_seconds
+        self.smoothing = smoothing
+        self.size = self._clamp(initial_size)
+        self.throughput: Optional[float] = None
+
+    def _clamp(self, size: float) -> int:
+        return int(min(self.max_size, max(self.min_size, size)))
+
+    def update(self, sent_bytes: int, seconds: float) -> int:
+        """Record one chunk and return the size of the next one."""
+        if sent_bytes <= 0 or seconds <= 0:
+            return self.size
+        throughput = sent_bytes / seconds
+        if self.throughput is None:
+            self.throughput = throughput
+        else:
+            self.throughput = (
+                self.smoothing * throughput + (1 - self.smoothing) * self.throughput
+            )
+        if sent_bytes < self.size:
+            # the last, short chunk of a file says little about the link
+            return self.size
+        desired = self.throughput * self.target_seconds
+        self.size = self._clamp(min(self.size * 2, max(self.size / 2, desired)))
+        return self.size
+
+    def on_failure(self) -> int:
+        """Halve the size after a failed chunk."""
+        self.size = self._clamp(self.size / 2)
+        return self.size
+
+
+class UploadStats:
+    """Per-upload measurements, shared by the partial uploads of a parallel upload."""
+
+    def __init__(self, total_bytes: int = 0):
+        self.total_bytes = total_bytes
+        self.bytes_uploaded = 0
+        self.chunks = 0
+        self.failed_chunks = 0
+        self.parts = 1
+        self.chunk_sizes: List[int] = []
+        self.chunk_seconds: List[float] = []
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record_chunk(self, sent_bytes: int, seconds: float):
+        with self._lock:
+            self.bytes_uploaded += sent_bytes
+            self.chunks += 1
+            self.chunk_sizes.append(sent_bytes)
+            self.chunk_seconds.append(seconds)
+
+    def record_failure(self):
+        with self._lock:
+            self.failed_chunks += 1
+
+    def finish(self):
+        self.finished_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Average bytes per second over the whole upload."""
+        elapsed = self.elapsed
+        return self.bytes_uploaded / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mean_chunk_seconds(self) -> float:
+        return sum(self.chunk_seconds) / len(self.chunk_seconds) if self.chunks else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            "total_bytes": self.total_bytes,
+            "bytes_uploaded": self.bytes_uploaded,
+            "chunks": self.chunks,
+            "failed_chunks": self.failed_chunks,
+            "parts": self.parts,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "mean_chunk_seconds": self.mean_chunk_seconds,
+            "last_chunk_size": self.chunk_sizes[-1] if self.chunk_sizes else 0,
+        }
+
+    def __repr__(self):
+        return (
+            f"UploadStats(bytes_uploaded={self.bytes_uploaded}, chunks={self.chunks}, "
+            f"elapsed={self.elapsed:.2f}s, throughput={self.throughput:.0f}B/s)"
+        )
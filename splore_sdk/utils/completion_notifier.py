@@ -0,0 +1,214 @@
+import hashlib
+import hmac
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+from splore_sdk.core.logger import sdk_logger
+
+
+class CompletionNotifier:
+    """
+    Delivers "something changed" events for files and extractions.
+
+    The extraction capability subscribes to the file while it is indexing and
+    to the extraction while it runs; on an event it checks the status right
+    away instead of waiting for the next poll. Polling stays on as a fallback,
+    its first check pushed back by ``fallback_after`` seconds, so a lost event
+    only costs latency.
+
+    Events may arrive before anyone subscribed (indexing can finish while the
+    poll is being set up), so they are remembered for ``retention`` seconds and
+    replayed to late subscribers.
+
+    Subclass it to feed events from any transport (a message queue, a relay)
+    by calling :meth:`notify`; :class:`WebhookReceiver` is the HTTP one.
+    """
+
+    def __init__(self, fallback_after: float = 60, retention: float = 300):
+        """
+        Args:
+            fallback_after (float): Seconds to wait for an event before polling.
+            retention (float): Seconds an event is replayed to late subscribers.
+        """
+        if fallback_after < 0 or retention < 0:
+            raise ValueError("fallback_after and retention must not be negative.")
+        self.fallback_after = fallback_after
+        self.retention = retention
+        self.logger = sdk_logger
+        self._subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._recent: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def file_key(file_id: str) -> str:
+        return f"file:{file_id}"
+
+    @staticmethod
+    def extraction_key(extraction_id: str) -> str:
+        return f"extraction:{extraction_id}"
+
+    def subscribe(self, key: str, callback: Callable[[Any], None]) -> Callable[[], None]:
+        """
+        Call ``callback(payload)`` on every event for ``key``.
+
+        Returns:
+            Callable[[], None]: Removes the subscription.
+        """
+        with self._lock:
+            self._subscribers.setdefault(key, []).append(callback)
+            recent = self._recent.get(key)
+        if recent is not None and time.monotonic() - recent[0] <= self.retention:
+            callback(recent[1])
+
+        def unsubscribe():
+            with self._lock:
+                callbacks = self._subscribers.get(key, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+                if not callbacks:
+                    self._subscribers.pop(key, None)
+
+        return unsubscribe
+
+    def notify(self, key: str, payload: Any = None):
+        """Deliver an event for ``key`` to its subscribers."""
+        now = time.monotonic()
+        with self._lock:
+            self._recent[key] = (now, payload)
+            for stale in [k for k, (at, _) in self._recent.items() if now - at > self.retention]:
+                del self._recent[stale]
+            callbacks = list(self._subscribers.get(key, []))
+        self.logger.debug(f"Completion event for {key}, {len(callbacks)} subscribers")
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception as e:
+                self.logger.warning(f"Completion callback for {key} failed: {e}")
+
+
+class WebhookReceiver(CompletionNotifier):
+    """
+    Embeddable HTTP endpoint turning webhook calls into completion events.
+
+    Accepts ``POST`` requests with a JSON body on ``path`` and notifies the
+    ``fileId`` and ``extractionId`` found in it. With a ``secret``, requests
+    must carry ``X-Splore-Signature: sha256=<hex HMAC of the body>``.
+    Register :attr:`url` (or the public address forwarding to it) as the
+    callback URL of the base.
+
+    Example:
+        >>> receiver = WebhookReceiver(port=8085, secret="...")
+        >>> receiver.start()
+        >>> agent = AgentSDK(api_key="...", base_id="...", agent_id="...", completion_notifier=receiver)
+    """
+
+    SIGNATURE_HEADER = "X-Splore-Signature"
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/splore/callback",
+        secret: Optional[str] = None,
+        fallback_after: float = 60,
+        retention: float = 300,
+    ):
+        """
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, ``0`` picks a free one.
+            path (str): Path accepting the callbacks.
+            secret (Optional[str]): Shared secret signing the request bodies.
+            fallback_after (float): Seconds to wait for an event before polling.
+            retention (float): Seconds an event is replayed to late subscribers.
+        """
+        super().__init__(fallback_after=fallback_after, retention=retention)
+        self.host = host
+        self.port = port
+        self.path = path
+        self.secret = secret
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("The receiver is not started.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def start(self) -> "WebhookReceiver":
+        """Start serving on a background thread."""
+        if self._server is not None:
+            return self
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="splore-webhook", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"Listening for completion callbacks on {self.url}")
+        return self
+
+    def close(self):
+        """Stop serving."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            self._thread.join()
+
+    def __enter__(self) -> "WebhookReceiver":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def verify(self, body: bytes, signature: Optional[str]) -> bool:
+        """Whether ``signature`` matches ``body``, always true without a secret."""
+        if self.secret is None:
+            return True
+        expected = hmac.new(self.secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        return signature is not None and hmac.compare_digest(
+            signature, f"sha256={expected}"
+        )
+
+    def handle_event(self, payload: Dict):
+        """Notify the file and extraction an event payload refers to."""
+        file_id = payload.get("fileId")
+        extraction_id = payload.get("extractionId")
+        if file_id:
+            self.notify(self.file_key(file_id), payload)
+        if extraction_id:
+            self.notify(self.extraction_key(extraction_id), payload)
+
+    def _handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split("?", 1)[0] != receiver.path:
+                    self.send_error(404)
+                    return
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if not receiver.verify(body, self.headers.get(receiver.SIGNATURE_HEADER)):
+                    self.send_error(401)
+                    return
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    self.send_error(400)
+                    return
+                if not isinstance(payload, dict):
+                    self.send_error(400)
+                    return
+                receiver.handle_event(payload)
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                receiver.logger.debug("Webhook: " + format % args)
+
+        return Handler
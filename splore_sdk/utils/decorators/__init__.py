@@ -1,4 +1,8 @@
-from .poll_with_timeout import poll_with_timeout
+from .poll_with_timeout import poll_with_timeout, async_poll_with_timeout
 from .retry_with_backoff import retry_with_backoff
 
-__all__ = ["poll_with_timeout", "retry_with_backoff"]
+__all__ = [
+    "poll_with_timeout",
+    "async_poll_with_timeout",
+    "retry_with_backoff",
+]
@@ -2,6 +2,7 @@ import random
 import time
 from functools import wraps
 from splore_sdk.core.logger import sdk_logger
+from splore_sdk.core.exceptions import DeadlineExceededError
 
 
 def retry_with_backoff(
@@ -44,6 +45,9 @@ def retry_with_backoff(
                         f"Operation {func_name} succeeded on attempt {attempt} after {elapsed:.2f}s"
                     )
                     return result
+                except DeadlineExceededError:
+                    # the caller's budget is spent, retrying cannot help
+                    raise
                 except Exception as e:
                     retries_left -= 1
                     elapsed = time.time() - start_time
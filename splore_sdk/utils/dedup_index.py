@@ -0,0 +1,173 @@
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import closing
+from typing import IO, Optional, Tuple, Union
+from splore_sdk.core.constants import DEFAULT_UPLOAD_CHUNK_SIZE
+
+
+class _HashingWriter:
+    """File-like sink feeding everything written to it into a hash, then to ``target``."""
+
+    def __init__(self, target: IO, hasher):
+        self.target = target
+        self.hasher = hasher
+
+    def write(self, data) -> int:
+        self.hasher.update(data)
+        return self.target.write(data)
+
+
+def content_sha256(
+    file_path: Optional[str] = None,
+    file_stream: Optional[Union[IO, bytes, bytearray, memoryview]] = None,
+) -> Tuple[str, Optional[IO]]:
+    """
+    Return the sha256 hex digest of an upload source.
+
+    Non-seekable streams can only be read once, they are hashed while being
+    spooled (the same copy :meth:`FileUploader.upload_file` would make) and
+    the spool is returned so the upload reads from it instead of the consumed
+    stream.
+
+    Returns:
+        Tuple[str, Optional[IO]]: The digest, and the spooled replacement for
+        ``file_stream`` which the caller must close, or ``None``.
+    """
+    hasher = hashlib.sha256()
+    if file_path:
+        with open(file_path, "rb") as stream:
+            for block in iter(lambda: stream.read(DEFAULT_UPLOAD_CHUNK_SIZE), b""):
+                hasher.update(block)
+        return hasher.hexdigest(), None
+    if isinstance(file_stream, (bytes, bytearray, memoryview)):
+        hasher.update(memoryview(file_stream).cast("B"))
+        return hasher.hexdigest(), None
+    try:
+        seekable = bool(file_stream.seekable())
+    except (AttributeError, ValueError):
+        seekable = False
+    if seekable:
+        # tus uploads streams from their start, hash the same bytes
+        file_stream.seek(0)
+        for block in iter(lambda: file_stream.read(DEFAULT_UPLOAD_CHUNK_SIZE), b""):
+            hasher.update(block)
+        file_stream.seek(0)
+        return hasher.hexdigest(), None
+    spool = tempfile.SpooledTemporaryFile(max_size=DEFAULT_UPLOAD_CHUNK_SIZE)
+    shutil.copyfileobj(
+        file_stream, _HashingWriter(spool, hasher), DEFAULT_UPLOAD_CHUNK_SIZE
+    )
+    spool.seek(0)
+    return hasher.hexdigest(), spool
+
+
+class DedupIndex:
+    """
+    Local index of uploaded content: ``(sha256, agent_id, base_id) -> file_id``.
+
+    Lets ``extract()`` reuse the server file of a document that was already
+    uploaded and indexed instead of sending the bytes again. Entries expire
+    after ``ttl`` seconds and the least recently used ones are evicted beyond
+    ``max_entries``. Backed by SQLite so several processes can share it.
+
+    Example:
+        >>> index = DedupIndex("~/.splore/dedup.db", ttl=7 * 24 * 60 * 60)
+        >>> agent = AgentSDK(api_key="...", base_id="...", agent_id="...", dedup_index=index)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = 7 * 24 * 60 * 60,
+        max_entries: Optional[int] = 100000,
+    ):
+        """
+        Args:
+            path (str): Database file, created with its directory if missing.
+            ttl (Optional[float]): Seconds an entry stays valid, ``None`` keeps
+                entries until they are evicted.
+            max_entries (Optional[int]): Entries kept, ``None`` is unbounded.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS uploaded_files ("
+                "content_hash TEXT NOT NULL, agent_id TEXT NOT NULL, base_id TEXT NOT NULL, "
+                "file_id TEXT NOT NULL, created_at REAL NOT NULL, used_at REAL NOT NULL, "
+                "PRIMARY KEY (content_hash, agent_id, base_id))"
+            )
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def get(self, content_hash: str, agent_id: str, base_id: str) -> Optional[str]:
+        """Return the file id stored for the content, ``None`` if missing or expired."""
+        key = (content_hash, agent_id, base_id)
+        now = time.time()
+        with self._lock, self._connect() as connection, connection:
+            row = connection.execute(
+                "SELECT file_id, created_at FROM uploaded_files "
+                "WHERE content_hash = ? AND agent_id = ? AND base_id = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            file_id, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                connection.execute(
+                    "DELETE FROM uploaded_files "
+                    "WHERE content_hash = ? AND agent_id = ? AND base_id = ?",
+                    key,
+                )
+                return None
+            connection.execute(
+                "UPDATE uploaded_files SET used_at = ? "
+                "WHERE content_hash = ? AND agent_id = ? AND base_id = ?",
+                (now,) + key,
+            )
+        return file_id
+
+    def put(self, content_hash: str, agent_id: str, base_id: str, file_id: str):
+        """Record the file id of uploaded content, evicting expired and excess entries."""
+        now = time.time()
+        with self._lock, self._connect() as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO uploaded_files "
+                "(content_hash, agent_id, base_id, file_id, created_at, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (content_hash, agent_id, base_id, file_id, now, now),
+            )
+            if self.ttl is not None:
+                connection.execute(
+                    "DELETE FROM uploaded_files WHERE created_at < ?", (now - self.ttl,)
+                )
+            if self.max_entries is not None:
+                connection.execute(
+                    "DELETE FROM uploaded_files WHERE rowid NOT IN ("
+                    "SELECT rowid FROM uploaded_files ORDER BY used_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+
+    def remove(self, content_hash: str, agent_id: str, base_id: str):
+        """Forget the content, e.g. when the server no longer has its file."""
+        with self._lock, self._connect() as connection, connection:
+            connection.execute(
+                "DELETE FROM uploaded_files "
+                "WHERE content_hash = ? AND agent_id = ? AND base_id = ?",
+                (content_hash, agent_id, base_id),
+            )
+
+    def __len__(self) -> int:
+        with self._lock, self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM uploaded_files").fetchone()[0]
@@ -0,0 +1,109 @@
+import math
+import os
+import sqlite3
+import statistics
+import threading
+import time
+from contextlib import closing
+from typing import IO, Optional, Union
+
+
+def source_size(
+    file_path: Optional[str] = None,
+    file_stream: Optional[Union[IO, bytes, bytearray, memoryview]] = None,
+) -> Optional[int]:
+    """Size in bytes of an upload source, ``None`` for non-seekable streams."""
+    if file_path:
+        return os.path.getsize(file_path)
+    if isinstance(file_stream, (bytes, bytearray, memoryview)):
+        return memoryview(file_stream).nbytes
+    try:
+        if not file_stream.seekable():
+            return None
+        position = file_stream.tell()
+        size = file_stream.seek(0, os.SEEK_END)
+        file_stream.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class DurationHistory:
+    """
+    Observed indexing and extraction durations, per agent and file size bucket.
+
+    Documents of one agent tend to be of the same kind, so how long the last
+    few files of a similar size took is a good predictor of the next one.
+    :meth:`estimate` returns the median of the last ``max_samples`` durations
+    of the bucket, which the extraction capability turns into an
+    :class:`EtaPollStrategy`. Buckets are powers of two of the file size.
+    Backed by SQLite so the history survives restarts.
+
+    Example:
+        >>> history = DurationHistory("~/.splore/durations.db")
+        >>> agent = AgentSDK(api_key="...", base_id="...", agent_id="...", duration_history=history)
+    """
+
+    INDEXING = "indexing"
+    EXTRACTION = "extraction"
+
+    def __init__(self, path: str, max_samples: int = 20, min_samples: int = 3):
+        """
+        Args:
+            path (str): Database file, created with its directory if missing.
+            max_samples (int): Recent durations kept per agent, phase and bucket.
+            min_samples (int): Durations needed before a bucket is estimated.
+        """
+        if not 1 <= min_samples <= max_samples:
+            raise ValueError("Sample counts must satisfy 1 <= min_samples <= max_samples.")
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS durations ("
+                "agent_id TEXT NOT NULL, phase TEXT NOT NULL, bucket INTEGER NOT NULL, "
+                "seconds REAL NOT NULL, recorded_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS durations_key "
+                "ON durations (agent_id, phase, bucket, recorded_at)"
+            )
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    @staticmethod
+    def size_bucket(size: int) -> int:
+        return int(math.log2(max(size, 1)))
+
+    def record(self, agent_id: str, phase: str, size: int, seconds: float):
+        """Record how long ``phase`` took for a file of ``size`` bytes."""
+        key = (agent_id, phase, self.size_bucket(size))
+        with self._lock, self._connect() as connection, connection:
+            connection.execute(
+                "INSERT INTO durations (agent_id, phase, bucket, seconds, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                key + (seconds, time.time()),
+            )
+            connection.execute(
+                "DELETE FROM durations WHERE agent_id = ? AND phase = ? AND bucket = ? "
+                "AND rowid NOT IN (SELECT rowid FROM durations "
+                "WHERE agent_id = ? AND phase = ? AND bucket = ? "
+                "ORDER BY recorded_at DESC LIMIT ?)",
+                key + key + (self.max_samples,),
+            )
+
+    def estimate(self, agent_id: str, phase: str, size: int) -> Optional[float]:
+        """Predicted duration of ``phase`` in seconds, ``None`` until enough were recorded."""
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(
+                "SELECT seconds FROM durations "
+                "WHERE agent_id = ? AND phase = ? AND bucket = ?",
+                (agent_id, phase, self.size_bucket(size)),
+            ).fetchall()
+        if len(rows) < self.min_samples:
+            return None
+        return statistics.median(seconds for seconds, in rows)
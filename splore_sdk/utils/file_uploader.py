@@ -1,26 +1,195 @@
+import asyncio
+import functools
+import io
 import os
+import shutil
 import tempfile
 import threading
-from typing import Optional, IO, Dict
-from splore_sdk.core.constants import FILE_UPLOAD_URL
+from abc import ABC, abstractmethod
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, IO, Dict, List, Tuple, Union
+from urllib.parse import urljoin
+import requests
+from splore_sdk.core.constants import (
+    FILE_UPLOAD_URL,
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    DEFAULT_TIMEOUT,
+)
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.core.exceptions import DeadlineExceededError
+from splore_sdk.core.logger import sdk_logger
+from splore_sdk.utils.chunk_size import (
+    AdaptiveChunkSize,
+    UploadStats,
+    MIN_UPLOAD_CHUNK_SIZE,
+    MAX_UPLOAD_CHUNK_SIZE,
+)
+from splore_sdk.utils.upload_storage import UploadFingerprint
 from tusclient import client
-from tusclient.uploader import Uploader
+from tusclient.exceptions import TusCommunicationError, TusUploadFailed
+from tusclient.fingerprint.interface import Fingerprint
+from tusclient.request import TusRequest, catch_requests_error
+from tusclient.storage.interface import Storage
+from tusclient.uploader import Uploader, AsyncUploader
 import mimetypes
 import time
 
 
+def _request_timeout(deadline: Optional[Deadline], operation: str):
+    """Timeout of a tus request, clamped to ``deadline`` once checked."""
+    if deadline is None:
+        return DEFAULT_TIMEOUT
+    deadline.check(operation)
+    return deadline.clamp_timeout(DEFAULT_TIMEOUT)
+
+
+class _MemoizedFingerprint(Fingerprint):
+    """
+    Fingerprint of one upload, computed on first use.
+
+    tus asks for the fingerprint each time it reads or writes the url
+    storage, and :class:`UploadFingerprint` reads the whole content.
+    """
+
+    def __init__(self, fingerprinter: Fingerprint):
+        self.fingerprinter = fingerprinter
+        self._fingerprint: Optional[str] = None
+
+    def get_fingerprint(self, fs: IO) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = self.fingerprinter.get_fingerprint(fs)
+        return self._fingerprint
+
+
+class _TimedTusRequest(TusRequest):
+    """tus PATCH request sent with a ``(connect, read)`` timeout."""
+
+    def __init__(self, uploader: Uploader, timeout):
+        super().__init__(uploader)
+        self.timeout = timeout
+
+    def perform(self):
+        try:
+            chunk = self.file.read(self._content_length)
+            self.add_checksum(chunk)
+            resp = requests.patch(
+                self._url,
+                data=chunk,
+                headers=self._request_headers,
+                verify=self.verify_tls_cert,
+                stream=True,
+                cert=self.client_cert,
+                timeout=self.timeout,
+            )
+            self.status_code = resp.status_code
+            self.response_content = resp.content
+            self.response_headers = {k.lower(): v for k, v in resp.headers.items()}
+        except requests.exceptions.RequestException as error:
+            raise TusUploadFailed(error)
+
+
 class ProgressUploader(Uploader):
-    def __init__(self, *args, progress=True, **kwargs):
+    """
+    tus uploader reporting progress and stats, whose requests all carry
+    timeouts clamped to the ``deadline``.
+    """
+
+    def __init__(
+        self,
+        *args,
+        progress=True,
+        deadline: Optional[Deadline] = None,
+        chunk_sizer: Optional[AdaptiveChunkSize] = None,
+        stats: Optional[UploadStats] = None,
+        **kwargs,
+    ):
+        # resuming a stored upload asks for its offset while initialising
+        self.deadline = deadline
         super().__init__(*args, **kwargs)
-        self.uploaded_bytes = 0
+        # a resumed upload starts at the offset the server already has
+        self.uploaded_bytes = self.offset
         self.progress = progress
+        self.chunk_sizer = chunk_sizer
+        self.stats = stats
+        if chunk_sizer is not None:
+            self.chunk_size = chunk_sizer.size
 
     def upload_chunk(self):
-        super().upload_chunk()
-        self.uploaded_bytes += self.chunk_size
+        offset = self.offset
+        started_at = time.monotonic()
+        try:
+            super().upload_chunk()
+        except Exception:
+            if self.stats is not None:
+                self.stats.record_failure()
+            if self.chunk_sizer is not None:
+                self.chunk_sizer.on_failure()
+            raise
+        seconds = time.monotonic() - started_at
+        sent_bytes = self.offset - offset
+        self.uploaded_bytes += sent_bytes
+        if self.stats is not None:
+            self.stats.record_chunk(sent_bytes, seconds)
+        if self.chunk_sizer is not None:
+            self.chunk_size = self.chunk_sizer.update(sent_bytes, seconds)
         if self.progress:
             self.progress_callback(self.uploaded_bytes, self.get_file_size())
 
+    def _request_timeout(self, operation: str):
+        return _request_timeout(self.deadline, operation)
+
+    @catch_requests_error
+    def create_url(self):
+        resp = requests.post(
+            self.client.url,
+            headers=self.get_url_creation_headers(),
+            verify=self.verify_tls_cert,
+            cert=self.client_cert,
+            timeout=self._request_timeout("file upload creation"),
+        )
+        url = resp.headers.get("location")
+        if url is None:
+            raise TusCommunicationError(
+                f"Attempt to retrieve create file url with status {resp.status_code}",
+                resp.status_code,
+                resp.content,
+            )
+        return urljoin(self.client.url, url)
+
+    @catch_requests_error
+    def get_offset(self):
+        resp = requests.head(
+            self.url,
+            headers=self.get_headers(),
+            verify=self.verify_tls_cert,
+            cert=self.client_cert,
+            timeout=self._request_timeout("file upload offset check"),
+        )
+        offset = resp.headers.get("upload-offset")
+        if offset is None:
+            raise TusCommunicationError(
+                f"Attempt to retrieve offset fails with status {resp.status_code}",
+                resp.status_code,
+                resp.content,
+            )
+        return int(offset)
+
+    def _do_request(self):
+        # retries come through here too, so they stop once the deadline passed
+        self.request = _TimedTusRequest(self, self._request_timeout("file upload"))
+        try:
+            self.request.perform()
+            if not 200 <= self.request.status_code < 300:
+                raise TusUploadFailed(
+                    "", self.request.status_code, self.request.response_content
+                )
+        except TusUploadFailed as error:
+            # a request cut short by the deadline fails the upload as such
+            if self.deadline is not None:
+                self.deadline.check("file upload")
+            self._retry_or_cry(error)
+
     def progress_callback(self, uploaded_bytes, total_bytes):
         # file size will be less than total_bytes as we are uploading the metadata
         # with file chunk.
@@ -28,6 +197,150 @@ class ProgressUploader(Uploader):
         print(f"Uploaded: {uploaded_bytes} / {total_bytes} bytes ({progress: .2f}%)")
 
 
+UploadSource = Union[IO, bytes, bytearray, memoryview]
+
+# SDK options routed to FileUploader instead of APIClient, see BaseSDK.
+UPLOAD_OPTIONS = (
+    "parallel_uploads",
+    "chunk_size",
+    "adaptive_chunk_size",
+    "min_chunk_size",
+    "max_chunk_size",
+    "url_storage",
+)
+
+
+class _ReadOnlyStream(io.RawIOBase, ABC):
+    """Seekable, read-only stream of ``size()`` bytes; subclasses implement ``_read``."""
+
+    def __new__(cls, *args, **kwargs):
+        # io's C base class skips the abstract method check of object.__new__
+        if cls.__abstractmethods__:
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__} with abstract methods "
+                + ", ".join(sorted(cls.__abstractmethods__))
+            )
+        return super().__new__(cls, *args, **kwargs)
+
+    def __init__(self):
+        super().__init__()
+        self._position = 0
+
+    @abstractmethod
+    def size(self) -> int:
+        """Length of the stream in bytes."""
+
+    @abstractmethod
+    def _read(self, start: int, length: int) -> bytes:
+        """The ``length`` bytes from ``start``, fewer at the end of the stream."""
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size() + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self.size() - self._position
+        length = remaining if size is None or size < 0 else min(size, remaining)
+        if length <= 0:
+            return b""
+        chunk = self._read(self._position, length)
+        self._position += len(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        # the data belongs to the caller, and tus closes the stream it fingerprints
+        pass
+
+
+class BufferStream(_ReadOnlyStream):
+    """
+    Read-only, seekable stream over an in-memory buffer.
+
+    Lets ``bytes``, ``bytearray`` and ``memoryview`` payloads be uploaded by
+    tus without copying them into a ``BytesIO`` first: only the chunk being
+    sent is materialized.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview]):
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+
+    def size(self) -> int:
+        return len(self._view)
+
+    def _read(self, start: int, length: int) -> bytes:
+        return bytes(self._view[start:start + length])
+
+
+class RangeStream(_ReadOnlyStream):
+    """
+    Window ``[start, start + length)`` of a seekable stream shared between threads.
+
+    Each partial upload of a parallel upload reads through its own window;
+    ``lock`` serializes the seek and read on the shared source.
+    """
+
+    def __init__(self, source: IO, start: int, length: int, lock: threading.Lock):
+        super().__init__()
+        self.source = source
+        self.start = start
+        self.length = length
+        self._lock = lock
+
+    def size(self) -> int:
+        return self.length
+
+    def _read(self, start: int, length: int) -> bytes:
+        with self._lock:
+            self.source.seek(self.start + start)
+            return self.source.read(length)
+
+
+class PartialUploader(ProgressUploader):
+    """Uploads one part of a tus concatenation (``Upload-Concat: partial``)."""
+
+    def get_url_creation_headers(self):
+        headers = self.get_headers()
+        headers["upload-length"] = str(self.get_file_size())
+        headers["upload-concat"] = "partial"
+        return headers
+
+    def _get_fingerprint(self):
+        # a part must never resume as, or be resumed by, a whole file
+        return "partial:" + super()._get_fingerprint()
+
+
+def _is_seekable(stream: IO) -> bool:
+    try:
+        return bool(stream.seekable())
+    except (AttributeError, ValueError):
+        return False
+
+
 class FileUploader:
     def __init__(
         self,
@@ -35,6 +348,12 @@ class FileUploader:
         base_id: str,
         user_id: Optional[str] = None,
         auto_cleanup: bool = True,
+        parallel_uploads: int = 1,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        adaptive_chunk_size: bool = False,
+        min_chunk_size: int = MIN_UPLOAD_CHUNK_SIZE,
+        max_chunk_size: int = MAX_UPLOAD_CHUNK_SIZE,
+        url_storage: Optional[Storage] = None,
     ):
         """
         Initializes the FileUploader instance.
@@ -43,7 +362,40 @@ class FileUploader:
             auto_cleanup (bool): Whether to automatically clean up temporary files.
             base_id (str): The base id of the Splore base.
             api_key (str): The API key for the Splore base.
+            parallel_uploads (int): Upload files larger than one chunk as up to
+                this many partial uploads on concurrent connections, joined with
+                the tus concatenation extension. 1 (default) uploads sequentially.
+            chunk_size (int): Size of the tus PATCH requests, the starting size
+                when ``adaptive_chunk_size`` is enabled.
+            adaptive_chunk_size (bool): Grow or shrink the chunk size within
+                ``[min_chunk_size, max_chunk_size]`` from the measured throughput,
+                see :class:`AdaptiveChunkSize`. The size learned by one upload is
+                the starting size of the next.
+            min_chunk_size (int): Lower bound of the adaptive chunk size.
+            max_chunk_size (int): Upper bound of the adaptive chunk size, keep it
+                under the request body limit of any proxy in front of the server.
+            url_storage (Optional[Storage]): Persists the tus url of every
+                unfinished upload, keyed by a fingerprint of the content, so an
+                upload interrupted by a crash or restart resumes from the
+                server offset instead of starting over, see
+                :class:`SQLiteURLStorage`. ``None`` (default) disables resuming.
         """
+        if parallel_uploads < 1:
+            raise ValueError("parallel_uploads must be at least 1.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+        self.logger = sdk_logger
+        self.parallel_uploads = parallel_uploads
+        self.chunk_size = chunk_size
+        self.adaptive_chunk_size = adaptive_chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        if adaptive_chunk_size:
+            # validate the bounds now rather than on the first upload
+            self._new_chunk_sizer()
+        self.url_storage = url_storage
+        self.fingerprinter = UploadFingerprint(namespace=base_id)
+        self._concatenation_supported: Optional[bool] = None
         self.tus_client = client.TusClient(
             FILE_UPLOAD_URL, headers={"X-API-KEY": api_key}
         )
@@ -119,10 +471,13 @@ class FileUploader:
             filename = os.path.basename(file_path)
             filetype = os.path.splitext(filename)[1][1:]
             mime_type, _ = mimetypes.guess_file_type(file_path)
-        elif file_stream:
-            filename = os.path.basename(file_stream.name)
+        elif file_stream is not None:
+            name = getattr(file_stream, "name", None)
+            # bytes and anonymous streams carry no name, pass one in metadata
+            name = name if isinstance(name, str) else "file"
+            filename = os.path.basename(name)
             filetype = os.path.splitext(filename)[1][1:]
-            mime_type, _ = mimetypes.guess_file_type(file_stream.name)
+            mime_type, _ = mimetypes.guess_file_type(name)
         filetype = mime_type if mime_type else filetype
         timestamp = int(time.time())
         filename = f"{timestamp}_{filename}"
@@ -149,19 +504,292 @@ class FileUploader:
         """
         return {key: str(value) for key, value in metadata.items()}
 
+    def _upload_stream(self, file_stream: UploadSource) -> Tuple[IO, bool]:
+        """
+        Returns a seekable stream tus can read the payload from, without a copy
+        where possible.
+
+        Buffers are wrapped in a :class:`BufferStream` and seekable streams are
+        used as they are. Non-seekable streams (sockets, pipes, HTTP bodies)
+        are spooled chunk by chunk into a ``SpooledTemporaryFile``, which stays
+        in memory up to one upload chunk and moves to the system temp directory
+        beyond that.
+
+        Returns:
+            Tuple[IO, bool]: The stream and whether the uploader owns (and
+            must close) it.
+        """
+        if isinstance(file_stream, (bytes, bytearray, memoryview)):
+            return BufferStream(file_stream), True
+        if _is_seekable(file_stream):
+            return file_stream, False
+        spool = tempfile.SpooledTemporaryFile(max_size=DEFAULT_UPLOAD_CHUNK_SIZE)
+        shutil.copyfileobj(file_stream, spool, DEFAULT_UPLOAD_CHUNK_SIZE)
+        spool.seek(0)
+        return spool, True
+
+    def _prepare_upload(
+        self,
+        file_path: Optional[str] = None,
+        file_stream: Optional[UploadSource] = None,
+        metadata: Optional[dict] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, str], Optional[IO]]:
+        """
+        Resolves the source tus uploads from and the encoded tus metadata.
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, str], Optional[IO]]: The ``file_path``
+            or ``file_stream`` keyword for the tus uploader, the encoded
+            metadata and the stream to close after the upload, if any.
+        """
+        owned_stream = None
+        if file_path:
+            source = {"file_path": os.path.normpath(os.path.abspath(file_path))}
+            default_metadata = self.generate_default_metadata(
+                file_path=source["file_path"]
+            )
+        else:
+            stream, owned = self._upload_stream(file_stream)
+            owned_stream = stream if owned else None
+            if self.url_storage is not None and not isinstance(stream, _ReadOnlyStream):
+                # tus closes the stream it fingerprints, hand it a view instead
+                size = stream.seek(0, os.SEEK_END)
+                stream = RangeStream(stream, 0, size, threading.Lock())
+            source = {"file_stream": stream}
+            default_metadata = self.generate_default_metadata(file_stream=file_stream)
+
+        # Generate default metadata and merge with user-provided metadata
+
+        if metadata and "filename" in metadata:
+            timestamp = int(time.time())
+            metadata["filename"] = f"{timestamp}_{metadata['filename']}"
+        final_metadata = {**default_metadata, **(metadata or {})}
+        return source, self.encode_metadata(final_metadata), owned_stream
+
+    @staticmethod
+    def _file_id_from_url(url: str) -> str:
+        url_with_file_id = url.split("+")[0]
+        return url_with_file_id.split("/")[-1]
+
+    def _cleanup_after_upload(
+        self, source: Optional[Dict[str, Any]], owned_stream: Optional[IO]
+    ):
+        if owned_stream is not None:
+            owned_stream.close()
+        file_path = (source or {}).get("file_path")
+        if self.auto_cleanup and file_path and self._is_temp_file(file_path):
+            self.cleanup_temp_files()
+
+    def _new_chunk_sizer(self) -> Optional[AdaptiveChunkSize]:
+        if not self.adaptive_chunk_size:
+            return None
+        return AdaptiveChunkSize(
+            self.chunk_size, min_size=self.min_chunk_size, max_size=self.max_chunk_size
+        )
+
+    def _learn_chunk_size(self, chunk_sizer: Optional[AdaptiveChunkSize]):
+        if chunk_sizer is not None:
+            self.chunk_size = chunk_sizer.size
+
+    @property
+    def last_upload_stats(self) -> Optional[UploadStats]:
+        """:class:`UploadStats` of the last upload made by the current thread."""
+        return getattr(self._thread_local, "last_upload_stats", None)
+
+    def _start_stats(self) -> UploadStats:
+        stats = UploadStats()
+        self._thread_local.last_upload_stats = stats
+        return stats
+
+    def _create_uploader(self, uploader_cls, **kwargs) -> Uploader:
+        """
+        Instantiate a tus uploader, resuming a stored upload of the same
+        content when ``url_storage`` is set.
+
+        A stored url the server no longer knows (expired or already removed)
+        is dropped and the upload starts over.
+        """
+        if self.url_storage is None:
+            return uploader_cls(**kwargs)
+        # one fingerprint per upload, the retry below reuses it
+        kwargs["fingerprinter"] = _MemoizedFingerprint(self.fingerprinter)
+        try:
+            uploader = uploader_cls(
+                store_url=True, url_storage=self.url_storage, **kwargs
+            )
+        except TusCommunicationError as e:
+            uploader = uploader_cls(**kwargs)
+            self.logger.warning(f"Stored upload can not be resumed, starting over: {e}")
+            self.url_storage.remove_item(uploader._get_fingerprint())
+            uploader.store_url = True
+            uploader.url_storage = self.url_storage
+            return uploader
+        if uploader.offset:
+            self.logger.info(
+                f"Resuming upload {uploader.url} at offset {uploader.offset} of {uploader.stop_at}"
+            )
+        return uploader
+
+    def _forget_upload(self, uploader: Uploader):
+        """Drop the stored url of a finished upload so new uploads of the same content start fresh."""
+        if self.url_storage is not None:
+            self.url_storage.remove_item(uploader._get_fingerprint())
+
+    def supports_concatenation(self, deadline: Optional[Deadline] = None) -> bool:
+        """Whether the tus server announces the concatenation extension (cached)."""
+        if self._concatenation_supported is None:
+            timeout = _request_timeout(deadline, "tus capability check")
+            try:
+                response = requests.options(
+                    self.tus_client.url,
+                    headers=dict(Uploader.DEFAULT_HEADERS, **self.tus_client.headers),
+                    timeout=timeout,
+                )
+                extensions = response.headers.get("Tus-Extension", "")
+                self._concatenation_supported = "concatenation" in [
+                    extension.strip() for extension in extensions.split(",")
+                ]
+            except requests.exceptions.RequestException as e:
+                self.logger.debug(f"tus OPTIONS request failed: {e}")
+                return False
+        return self._concatenation_supported
+
+    def _upload_part(
+        self, part: IO, deadline: Optional[Deadline], stats: UploadStats
+    ) -> PartialUploader:
+        chunk_sizer = self._new_chunk_sizer()
+        uploader = self._create_uploader(
+            PartialUploader,
+            client=self.tus_client,
+            file_stream=part,
+            chunk_size=self.chunk_size,
+            deadline=deadline,
+            progress=False,
+            chunk_sizer=chunk_sizer,
+            stats=stats,
+        )
+        uploader.upload()
+        self._learn_chunk_size(chunk_sizer)
+        return uploader
+
+    @catch_requests_error
+    def _concatenate(
+        self,
+        part_urls: List[str],
+        encoded_metadata: Dict[str, str],
+        deadline: Optional[Deadline] = None,
+    ) -> str:
+        """Create the final upload from the partial uploads and return its url."""
+        headers = dict(Uploader.DEFAULT_HEADERS, **self.tus_client.headers)
+        headers["upload-concat"] = "final;" + " ".join(part_urls)
+        headers["upload-metadata"] = ",".join(
+            f"{key} {b64encode(value.encode('utf-8')).decode('ascii')}"
+            for key, value in encoded_metadata.items()
+        )
+        response = requests.post(
+            self.tus_client.url,
+            headers=headers,
+            timeout=_request_timeout(deadline, "file upload concatenation"),
+        )
+        location = response.headers.get("location")
+        if location is None:
+            raise TusCommunicationError(
+                f"Attempt to concatenate uploads failed with status {response.status_code}",
+                response.status_code,
+                response.content,
+            )
+        return urljoin(self.tus_client.url, location)
+
+    def _upload_in_parallel(
+        self,
+        source: Dict[str, Any],
+        encoded_metadata: Dict[str, str],
+        parallel_uploads: int,
+        deadline: Optional[Deadline],
+        stats: UploadStats,
+    ) -> Optional[str]:
+        """
+        Upload ``source`` as concurrent partial uploads joined by tus concatenation.
+
+        Returns:
+            Optional[str]: The upload url, or ``None`` when the file fits in one
+            chunk or the server does not support concatenation, in which case
+            the caller uploads sequentially.
+        """
+        stream = source.get("file_stream")
+        handle = None
+        if stream is None:
+            handle = stream = open(source["file_path"], "rb")
+        try:
+            size = stream.seek(0, os.SEEK_END)
+            stats.total_bytes = size
+            # parts are never smaller than a chunk, small files gain nothing
+            part_size = max(self.chunk_size, -(-size // parallel_uploads))
+            ranges = [
+                (start, min(part_size, size - start))
+                for start in range(0, size, part_size)
+            ]
+            if len(ranges) < 2:
+                return None
+            if not self.supports_concatenation(deadline):
+                self.logger.warning(
+                    "tus server does not support concatenation, uploading sequentially"
+                )
+                return None
+
+            self.logger.info(
+                f"Uploading {size} bytes as {len(ranges)} parallel partial uploads"
+            )
+            stats.parts = len(ranges)
+            lock = threading.Lock()
+            with ThreadPoolExecutor(
+                max_workers=len(ranges), thread_name_prefix="splore-upload"
+            ) as executor:
+                parts = list(
+                    executor.map(
+                        lambda part: self._upload_part(
+                            RangeStream(stream, part[0], part[1], lock),
+                            deadline,
+                            stats,
+                        ),
+                        ranges,
+                    )
+                )
+            url = self._concatenate(
+                [part.url for part in parts], encoded_metadata, deadline
+            )
+            for part in parts:
+                self._forget_upload(part)
+            return url
+        finally:
+            if handle is not None:
+                handle.close()
+
     def upload_file(
         self,
         file_path: Optional[str] = None,
-        file_stream: Optional[IO] = None,
+        file_stream: Optional[UploadSource] = None,
         metadata: Optional[dict] = None,
+        deadline: Optional[Deadline] = None,
+        parallel_uploads: Optional[int] = None,
     ) -> str:
         """
         Uploads a file to the TUS server using various input options.
 
+        Streams are sent from their start. Seekable streams and ``bytes``,
+        ``bytearray`` or ``memoryview`` buffers are read chunk by chunk in
+        place; non-seekable streams are spooled first, see
+        :meth:`_upload_stream`. Name-less inputs should pass ``filename`` in
+        ``metadata``.
+
         Args:
             file_path (Optional[str]): Local file path to upload.
-            file_stream (Optional[IO]): File stream (e.g., from blob storage).
+            file_stream (Optional[UploadSource]): File stream (e.g., from blob
+                storage) or in-memory buffer.
             metadata (Optional[dict]): Metadata to include with the upload.
+            deadline (Optional[Deadline]): Checked before every chunk is sent.
+            parallel_uploads (Optional[int]): Overrides the uploader's
+                ``parallel_uploads`` for this file.
 
         Returns:
             str: return file_id.
@@ -169,67 +797,135 @@ class FileUploader:
         Raises:
             ValueError: If neither file_path nor file_stream is provided.
         """
-        if not (file_path or file_stream):
+        if not file_path and file_stream is None:
             raise ValueError("One of file_path or file_stream must be provided.")
 
-        temp_file_path = None
+        source, owned_stream = None, None
+        stats = self._start_stats()
 
         try:
-            # Determine the file path
-            if file_path:
-                temp_file_path = os.path.normpath(os.path.abspath(file_path))
-                default_metadata = self.generate_default_metadata(
-                    file_path=temp_file_path
-                )
-            elif file_stream:
-                temp_file_path = self.create_temp_file_destination(
-                    file_extension=file_stream.name
-                )
-                default_metadata = self.generate_default_metadata(
-                    file_stream=file_stream
-                )
-                self._write_stream_to_tmp(file_stream, temp_file_path)
-
-            # Generate default metadata and merge with user-provided metadata
+            source, encoded_metadata, owned_stream = self._prepare_upload(
+                file_path=file_path, file_stream=file_stream, metadata=metadata
+            )
 
-            if metadata and "filename" in metadata:
-                timestamp = int(time.time())
-                metadata["filename"] = f"{timestamp}_{metadata['filename']}"
-            final_metadata = {**default_metadata, **(metadata or {})}
-            encoded_metadata = self.encode_metadata(final_metadata)
+            if parallel_uploads is None:
+                parallel_uploads = self.parallel_uploads
+            if parallel_uploads > 1:
+                url = self._upload_in_parallel(
+                    source, encoded_metadata, parallel_uploads, deadline, stats
+                )
+                if url is not None:
+                    return self._file_id_from_url(url)
 
             # Upload to TUS server
-            chunk_size = 5 * 1024 * 1024  # 5MB chunk size
-            uploader = ProgressUploader(
+            chunk_sizer = self._new_chunk_sizer()
+            uploader = self._create_uploader(
+                ProgressUploader,
                 client=self.tus_client,
-                file_path=temp_file_path,
                 metadata=encoded_metadata,
-                chunk_size=chunk_size,
+                chunk_size=self.chunk_size,
+                deadline=deadline,
+                chunk_sizer=chunk_sizer,
+                stats=stats,
+                **source,
             )
+            stats.total_bytes = uploader.stop_at
             uploader.upload()
+            self._learn_chunk_size(chunk_sizer)
+            self._forget_upload(uploader)
 
             # Return the file id
-            url_with_file_id = uploader.url.split("+")[0]
-            return url_with_file_id.split("/")[-1]
+            return self._file_id_from_url(uploader.url)
 
         finally:
-            if (
-                self.auto_cleanup
-                and temp_file_path
-                and self._is_temp_file(temp_file_path)
-            ):
-                self.cleanup_temp_files()
-
-    def _write_stream_to_tmp(self, file_stream: IO, tmp_path: str):
+            stats.finish()
+            self.logger.debug(f"File upload finished: {stats}")
+            self._cleanup_after_upload(source, owned_stream)
+
+    @staticmethod
+    async def _upload_async(uploader: AsyncUploader):
+        """Run ``uploader``, storing the url it creates in the loop's default executor."""
+        if not uploader.url:
+            # tus would store it on the loop, fingerprinting the content there
+            url = await uploader.create_url()
+            await asyncio.get_running_loop().run_in_executor(None, uploader.set_url, url)
+            uploader.offset = 0
+        await uploader.upload()
+
+    async def upload_file_async(
+        self,
+        file_path: Optional[str] = None,
+        file_stream: Optional[UploadSource] = None,
+        metadata: Optional[dict] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> str:
         """
-        Writes a file stream to a temporary file.
+        asyncio version of :meth:`upload_file` built on tus' ``AsyncUploader``.
+
+        Spooling the source and reading or writing the stored url of a
+        resumable upload block, so they run in the loop's default executor.
 
         Args:
-            file_stream (IO): The input file stream.
-            tmp_path (str): Path to the temporary file.
+            file_path (Optional[str]): Local file path to upload.
+            file_stream (Optional[UploadSource]): File stream (e.g., from blob
+                storage) or in-memory buffer.
+            metadata (Optional[dict]): Metadata to include with the upload.
+            deadline (Optional[Deadline]): Bounds the whole upload, a request
+                still running when it passes is cancelled.
+
+        Returns:
+            str: return file_id.
+
+        Raises:
+            ValueError: If neither file_path nor file_stream is provided.
+            DeadlineExceededError: If the deadline passes before the upload finished.
         """
-        with open(tmp_path, "wb") as tmp_file:
-            tmp_file.write(file_stream.read())
+        if not file_path and file_stream is None:
+            raise ValueError("One of file_path or file_stream must be provided.")
+
+        loop = asyncio.get_running_loop()
+        source, owned_stream = None, None
+
+        try:
+            source, encoded_metadata, owned_stream = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self._prepare_upload,
+                    file_path=file_path,
+                    file_stream=file_stream,
+                    metadata=metadata,
+                ),
+            )
+
+            uploader = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self._create_uploader,
+                    AsyncUploader,
+                    client=self.tus_client,
+                    metadata=encoded_metadata,
+                    chunk_size=self.chunk_size,
+                    **source,
+                ),
+            )
+            if deadline is None:
+                await self._upload_async(uploader)
+            else:
+                deadline.check("file upload")
+                try:
+                    await asyncio.wait_for(
+                        self._upload_async(uploader), deadline.remaining()
+                    )
+                except asyncio.TimeoutError:
+                    raise DeadlineExceededError(
+                        f"Deadline of {deadline.timeout} seconds exceeded during file upload"
+                    ) from None
+            await loop.run_in_executor(None, self._forget_upload, uploader)
+
+            return self._file_id_from_url(uploader.url)
+
+        finally:
+            self._cleanup_after_upload(source, owned_stream)
 
     def cleanup_temp_files(self):
         """
@@ -0,0 +1,142 @@
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from typing import List, NamedTuple, Optional
+
+# job states after which there is nothing left to resume
+FINISHED_STATES = ("COMPLETED", "FAILED", "CANCELLED")
+
+
+class JournalEntry(NamedTuple):
+    """Last recorded state of one extraction job."""
+
+    job_id: str
+    agent_id: str
+    base_id: str
+    file_path: Optional[str]
+    state: str
+    file_id: Optional[str]
+    extraction_id: Optional[str]
+    version: int
+    error: Optional[str]
+    updated_at: float
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+
+class JobJournal:
+    """
+    Durable record of extraction jobs and the stage each one reached.
+
+    ``extract()`` records every job as it moves from upload to indexing to
+    extraction, together with its file id and extraction id. After a crash,
+    ``ExtractionCapability.resume()`` picks the unfinished jobs up where they
+    stopped: an extraction that was started is polled again, an indexed
+    upload is started, and only files that never finished uploading are
+    uploaded again. Backed by SQLite, every transition is committed before
+    the job moves on.
+
+    Example:
+        >>> journal = JobJournal("~/.splore/jobs.db")
+        >>> agent = AgentSDK(api_key="...", base_id="...", agent_id="...", job_journal=journal)
+        >>> jobs = agent.extraction.resume()
+    """
+
+    _FIELDS = ("file_id", "extraction_id", "version", "error")
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Database file, created with its directory if missing.
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS extraction_jobs ("
+                "job_id TEXT PRIMARY KEY, agent_id TEXT NOT NULL, base_id TEXT NOT NULL, "
+                "file_path TEXT, state TEXT NOT NULL, file_id TEXT, extraction_id TEXT, "
+                "version INTEGER NOT NULL DEFAULT 1, error TEXT, updated_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS extraction_jobs_state "
+                "ON extraction_jobs (agent_id, base_id, state)"
+            )
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def add(self, agent_id: str, base_id: str, file_path: Optional[str] = None) -> str:
+        """Record a new ``PENDING`` job and return its id."""
+        job_id = uuid.uuid4().hex
+        if file_path:
+            file_path = os.path.abspath(file_path)
+        with self._lock, self._connect() as connection, connection:
+            connection.execute(
+                "INSERT INTO extraction_jobs "
+                "(job_id, agent_id, base_id, file_path, state, updated_at) "
+                "VALUES (?, ?, ?, ?, 'PENDING', ?)",
+                (job_id, agent_id, base_id, file_path, time.time()),
+            )
+        return job_id
+
+    def update(self, job_id: str, state: str, **fields):
+        """
+        Record that the job reached ``state``.
+
+        Args:
+            job_id (str): Id returned by :meth:`add`.
+            state (str): The :class:`ExtractionState` reached.
+            **fields: ``file_id``, ``extraction_id``, ``version`` or ``error``
+                learned on the way, other columns keep their value.
+        """
+        unknown = set(fields) - set(self._FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown journal fields: {', '.join(sorted(unknown))}")
+        assignments = "".join(f", {name} = ?" for name in fields)
+        with self._lock, self._connect() as connection, connection:
+            connection.execute(
+                f"UPDATE extraction_jobs SET state = ?, updated_at = ?{assignments} "
+                "WHERE job_id = ?",
+                (state, time.time(), *fields.values(), job_id),
+            )
+
+    def get(self, job_id: str) -> Optional[JournalEntry]:
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM extraction_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return JournalEntry(*row) if row else None
+
+    def entries(
+        self, agent_id: str, base_id: str, unfinished: bool = False
+    ) -> List[JournalEntry]:
+        """Jobs of the agent, oldest first, only the ones left to resume with ``unfinished``."""
+        query = "SELECT * FROM extraction_jobs WHERE agent_id = ? AND base_id = ?"
+        if unfinished:
+            query += " AND state NOT IN (%s)" % ", ".join("?" * len(FINISHED_STATES))
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(
+                query + " ORDER BY updated_at, rowid",
+                (agent_id, base_id) + (FINISHED_STATES if unfinished else ()),
+            ).fetchall()
+        return [JournalEntry(*row) for row in rows]
+
+    def remove(self, job_id: str):
+        with self._lock, self._connect() as connection, connection:
+            connection.execute("DELETE FROM extraction_jobs WHERE job_id = ?", (job_id,))
+
+    def prune(self, older_than: float = 0):
+        """Drop finished jobs last updated more than ``older_than`` seconds ago."""
+        with self._lock, self._connect() as connection, connection:
+            connection.execute(
+                "DELETE FROM extraction_jobs WHERE updated_at < ? AND state IN (%s)"
+                % ", ".join("?" * len(FINISHED_STATES)),
+                (time.time() - older_than,) + FINISHED_STATES,
+            )
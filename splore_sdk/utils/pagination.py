@@ -0,0 +1,178 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+from splore_sdk.core.logger import get_logging_context, set_logging_context
+
+# keys a paginated response may keep its records under
+ITEM_KEYS = ("content", "items", "data", "extractions", "results")
+
+
+def page_items(page: Any) -> List:
+    """
+    The records of one page of a paginated response.
+
+    Accepts a bare list or a dict holding the list under one of
+    :data:`ITEM_KEYS`, also one level down (``{"data": {"content": [...]}}``).
+
+    Raises:
+        ValueError: If the page holds no list of records.
+    """
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict):
+        for key in ITEM_KEYS:
+            value = page.get(key)
+            if isinstance(value, list):
+                return value
+            if isinstance(value, dict):
+                return page_items(value)
+    raise ValueError(f"No records found in the page response: {page!r:.200}")
+
+
+def is_last_page(page: Any, items: List, size: int) -> bool:
+    """
+    Whether nothing follows ``page``.
+
+    The page's own ``last`` flag or ``number``/``totalPages`` decide when
+    present, as the server may return fewer records than asked for on any
+    page; otherwise a page shorter than ``size`` is the last one.
+    """
+    if isinstance(page, dict):
+        last = page.get("last")
+        if isinstance(last, bool):
+            return last
+        total_pages, number = page.get("totalPages"), page.get("number")
+        if isinstance(total_pages, int) and isinstance(number, int):
+            return number + 1 >= total_pages
+    return len(items) < size
+
+
+def _total_pages(page: Any) -> Optional[int]:
+    total_pages = page.get("totalPages") if isinstance(page, dict) else None
+    return total_pages if isinstance(total_pages, int) else None
+
+
+def iter_pages(
+    fetch: Callable[[int], Any],
+    size: int,
+    start_page: int = 0,
+    end_page: Optional[int] = None,
+    prefetch: int = 2,
+    workers: int = 1,
+) -> Iterator[List]:
+    """
+    Yield the records of consecutive pages, fetching the next ones in the background.
+
+    While the caller processes a page, the following ``prefetch`` pages are
+    already requested on ``workers`` threads, so a loop over many pages is
+    bound by the caller's processing instead of one round trip per page. At
+    most ``prefetch`` pages are held besides the current one. Pages are
+    yielded in order; a failed fetch raises when its page is reached.
+    Closing the generator cancels the pages not requested yet.
+
+    Args:
+        fetch (Callable[[int], Any]): Returns the page of the given number.
+        size (int): Records per page, a shorter page is the last one.
+        start_page (int): First page to fetch.
+        end_page (Optional[int]): Page to stop before, ``None`` reads to the end.
+        prefetch (int): Pages fetched ahead of the one being processed, raised
+            to ``workers`` so every worker has a page to fetch.
+        workers (int): Pages fetched at once, more than one fetches a range of
+            pages in parallel.
+
+    Returns:
+        Iterator[List]: The records of each page.
+    """
+    if size < 1 or workers < 1:
+        raise ValueError("size and workers must be at least 1.")
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative.")
+    # with fewer pages ahead than workers the extra workers would stay idle
+    prefetch = max(prefetch, workers)
+    context = get_logging_context()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="splore-pages")
+    pending = deque()
+    next_page = start_page
+
+    def fetch_page(number: int) -> Any:
+        set_logging_context(context)
+        return fetch(number)
+
+    def fill(count: int):
+        nonlocal next_page
+        while len(pending) < count and (end_page is None or next_page < end_page):
+            pending.append(executor.submit(fetch_page, next_page))
+            next_page += 1
+
+    try:
+        while True:
+            if not pending:
+                fill(1)
+                if not pending:
+                    return
+            future = pending.popleft()
+            fill(prefetch)
+            page = future.result()
+            items = page_items(page)
+            if is_last_page(page, items, size):
+                if items:
+                    yield items
+                return
+            total_pages = _total_pages(page)
+            if total_pages is not None and (end_page is None or total_pages < end_page):
+                end_page = total_pages
+            yield items
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: Callable[[int], Awaitable[Any]],
+    size: int,
+    start_page: int = 0,
+    end_page: Optional[int] = None,
+    prefetch: int = 2,
+) -> AsyncIterator[List]:
+    """
+    asyncio counterpart of :func:`iter_pages`.
+
+    The ``prefetch`` pages ahead are requested concurrently as tasks on the
+    running loop.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1.")
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative.")
+    pending = deque()
+    next_page = start_page
+
+    def fill(count: int):
+        nonlocal next_page
+        while len(pending) < count and (end_page is None or next_page < end_page):
+            pending.append(asyncio.ensure_future(fetch(next_page)))
+            next_page += 1
+
+    try:
+        while True:
+            if not pending:
+                fill(1)
+                if not pending:
+                    return
+            task = pending.popleft()
+            fill(prefetch)
+            page = await task
+            items = page_items(page)
+            if is_last_page(page, items, size):
+                if items:
+                    yield items
+                return
+            total_pages = _total_pages(page)
+            if total_pages is not None and (end_page is None or total_pages < end_page):
+                end_page = total_pages
+            yield items
+    finally:
+        for task in pending:
+            task.cancel()
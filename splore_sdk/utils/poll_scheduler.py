@@ -0,0 +1,296 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from splore_sdk.core.logger import sdk_logger, get_logging_context, set_logging_context
+from splore_sdk.utils.poll_strategy import InterleavedPollStrategy, PollStrategy
+
+
+class _PollTask:
+    """One outstanding poll: what to call, when it is done and its schedule."""
+
+    def __init__(
+        self,
+        poll: Callable[[], Any],
+        condition: Callable[[Any], bool],
+        max_timeout: float,
+        strategy: PollStrategy,
+        name: str,
+    ):
+        self.poll = poll
+        self.condition = condition
+        self.max_timeout = max_timeout
+        self.strategy = strategy
+        self.name = name
+        self.future: Future = Future()
+        self.started_at = time.monotonic()
+        self.attempts = 0
+        # sequence number of the task's live heap entry, None while not queued
+        self.entry: Optional[int] = None
+        self.poll_again = False
+        self.log_context = get_logging_context()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class PollScheduler:
+    """
+    Polls many pending operations from a single timer thread.
+
+    Every submitted poll is kept in a heap ordered by its next due time; one
+    background thread sleeps until the earliest one is due and hands the
+    status call to a small, bounded pool of poll workers. The result is
+    delivered through a :class:`concurrent.futures.Future`, so thousands of
+    outstanding extractions cost one timer thread plus ``max_workers`` poll
+    threads instead of one parked thread each.
+
+    Schedules follow :func:`poll_with_timeout`: the interval moves between
+    ``min_poll_interval`` and ``max_poll_interval`` with jitter, or follows the
+    given :class:`PollStrategy`, and the future fails with ``TimeoutError``
+    once ``max_timeout`` passes. Exceptions raised by
+    the poll function fail the future immediately. :meth:`poll_now` moves the
+    next attempt forward, e.g. when a completion callback arrives.
+
+    Example:
+        >>> scheduler = PollScheduler.shared()
+        >>> future = scheduler.submit(
+        ...     lambda: service.processing_status(file_id=file_id),
+        ...     condition=lambda resp: resp.get("fileProcessingStatus") == "INDEXED",
+        ...     max_timeout=1200,
+        ... )
+        >>> future.result()
+    """
+
+    _shared: Optional["PollScheduler"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Args:
+            max_workers (int): Threads issuing status calls concurrently.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.logger = sdk_logger
+        self.max_workers = max_workers
+        self._heap: List[Tuple[float, int, _PollTask]] = []
+        self._tasks: Dict[Future, _PollTask] = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._shutdown = False
+
+    @classmethod
+    def shared(cls) -> "PollScheduler":
+        """Return the process wide scheduler, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared._shutdown:
+                cls._shared = cls()
+            return cls._shared
+
+    def submit(
+        self,
+        poll: Callable[[], Any],
+        condition: Callable[[Any], bool] = lambda x: x is not None,
+        max_timeout: float = 30,
+        min_poll_interval: float = 1,
+        max_poll_interval: float = 5,
+        poll_interval_change_rate: float = 2,
+        jitter_fraction: float = 0.1,
+        name: Optional[str] = None,
+        strategy: Optional[PollStrategy] = None,
+    ) -> Future:
+        """
+        Start polling ``poll`` until its result satisfies ``condition``.
+
+        The first poll runs right away, or after the strategy's
+        :meth:`PollStrategy.first_delay`. Cancelling the returned future stops
+        the polling.
+
+        Args:
+            poll (Callable[[], Any]): Zero-argument status call.
+            condition (Callable[[Any], bool]): The condition to check on the result.
+            max_timeout (float): The maximum time to wait for the result.
+            min_poll_interval (float): The minimum poll interval.
+            max_poll_interval (float): The maximum poll interval.
+            poll_interval_change_rate (float): The rate at which the poll interval
+                changes.
+            jitter_fraction (float): Fraction of interval to use as jitter.
+            name (Optional[str]): Label used in log messages.
+            strategy (Optional[PollStrategy]): Schedule of the waits between
+                polls, replaces the interval arguments above.
+
+        Returns:
+            Future: Resolves to the first result satisfying ``condition``.
+        """
+        if strategy is None:
+            strategy = InterleavedPollStrategy(
+                min_poll_interval,
+                max_poll_interval,
+                poll_interval_change_rate,
+                jitter_fraction,
+            )
+        task = _PollTask(
+            poll=poll,
+            condition=condition,
+            max_timeout=max_timeout,
+            strategy=strategy,
+            name=name or getattr(poll, "__name__", "poll"),
+        )
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit polls after shutdown.")
+            self._ensure_started()
+            self._tasks[task.future] = task
+            self._push(
+                task, time.monotonic() + min(strategy.first_delay(), max_timeout)
+            )
+        # a cancelled poll stops counting as pending right away
+        task.future.add_done_callback(self._forget)
+        self.logger.debug(f"Scheduled polling operation for {task.name}")
+        return task.future
+
+    def poll_now(self, future: Future) -> bool:
+        """
+        Run the next attempt of the poll behind ``future`` right away.
+
+        A poll whose attempt is running is polled again as soon as it
+        finishes. Returns whether the poll was still pending.
+        """
+        with self._condition:
+            task = self._tasks.get(future)
+            if task is None or task.future.done():
+                return False
+            if task.entry is None:
+                task.poll_again = True
+            else:
+                self._push(task, time.monotonic())
+            return True
+
+    def pending(self) -> int:
+        """Number of polls waiting for their next attempt or running one."""
+        with self._condition:
+            return len(self._tasks)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the scheduler, cancelling every poll that has not completed."""
+        with self._condition:
+            self._shutdown = True
+            tasks = [task for _, _, task in self._heap]
+            self._heap.clear()
+            self._tasks.clear()
+            self._condition.notify_all()
+        for task in tasks:
+            task.future.cancel()
+        if self._thread is not None and wait:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="splore-poll"
+            )
+            self._thread = threading.Thread(
+                target=self._run, name="splore-poll-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def _push(self, task: _PollTask, due: float):
+        # a rescheduled task leaves its old entry behind, popping skips it
+        task.entry = next(self._counter)
+        heapq.heappush(self._heap, (due, task.entry, task))
+        self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._shutdown:
+                    now = time.monotonic()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    self._condition.wait(timeout)
+                if self._shutdown:
+                    return
+                _, entry, task = heapq.heappop(self._heap)
+                if entry != task.entry:
+                    continue
+                task.entry = None
+                if task.future.cancelled():
+                    self._tasks.pop(task.future, None)
+                    continue
+                # under the lock, shutdown() cannot close the executor in between
+                self._executor.submit(self._attempt, task)
+
+    def _attempt(self, task: _PollTask):
+        set_logging_context(task.log_context)
+        self._poll_once(task)
+
+    def _poll_once(self, task: _PollTask):
+        task.attempts += 1
+        try:
+            result = task.poll()
+            done = task.condition(result)
+        except Exception as e:
+            self.logger.debug(
+                f"Poll attempt {task.attempts} for {task.name} failed: {e}"
+            )
+            self._complete(task, exception=e)
+            return
+
+        elapsed = task.elapsed()
+        if done:
+            self.logger.debug(
+                f"Poll operation for {task.name} completed successfully after {task.attempts} attempts, total time: {elapsed:.2f}s"
+            )
+            self._complete(task, result=result)
+            return
+        if elapsed >= task.max_timeout:
+            self.logger.warning(
+                f"Poll operation for {task.name} timed out after {elapsed:.2f}s and {task.attempts} attempts"
+            )
+            self._complete(
+                task,
+                exception=TimeoutError(
+                    f"Timeout exceeded after {task.max_timeout} seconds for {task.name}"
+                ),
+            )
+            return
+
+        # never sleep past the timeout, the caller may be on a deadline
+        sleep_time = min(
+            task.strategy.next_sleep(task.attempts, elapsed),
+            task.max_timeout - elapsed,
+        )
+        self.logger.debug(
+            f"Poll attempt {task.attempts} for {task.name}: condition not met after {elapsed:.2f}s, waiting {sleep_time:.2f}s"
+        )
+        with self._condition:
+            if self._shutdown:
+                task.future.cancel()
+                return
+            if task.poll_again:
+                task.poll_again = False
+                sleep_time = 0
+            self._push(task, time.monotonic() + sleep_time)
+
+    def _forget(self, future: Future):
+        with self._condition:
+            self._tasks.pop(future, None)
+
+    @staticmethod
+    def _complete(task: _PollTask, result: Any = None, exception=None):
+        # the future stays PENDING while polling so callers can cancel it,
+        # claim it here; a cancelled future is simply dropped
+        if not task.future.set_running_or_notify_cancel():
+            return
+        if exception is not None:
+            task.future.set_exception(exception)
+        else:
+            task.future.set_result(result)
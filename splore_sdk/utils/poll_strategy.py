@@ -0,0 +1,220 @@
+import math
+import random
+from abc import ABC, abstractmethod
+from typing import List
+
+
+def generate_intervals(min_poll_interval, max_poll_interval, poll_interval_change_rate):
+    # Calculate number of steps
+    n_steps = (
+        int(math.log(max_poll_interval / min_poll_interval, poll_interval_change_rate))
+        + 1
+    )
+
+    # Increasing sequence
+    inc = [min_poll_interval * (poll_interval_change_rate**i) for i in range(n_steps)]
+    # Ensure max is included (in case of floating point error)
+    if inc[-1] < max_poll_interval:
+        inc.append(max_poll_interval)
+
+    # Decreasing sequence
+    dec = [max_poll_interval / (poll_interval_change_rate**i) for i in range(n_steps)]
+    if dec[-1] > min_poll_interval:
+        dec.append(min_poll_interval)
+
+    return inc, dec
+
+
+def interleave_intervals(min_poll_interval, max_poll_interval, poll_interval_change_rate):
+    """Interleave the increasing and decreasing interval sequences."""
+    inc, dec = generate_intervals(
+        min_poll_interval, max_poll_interval, poll_interval_change_rate
+    )
+    # Interleave inc and dec, handle uneven lengths
+    intervals = []
+    max_len = max(len(inc), len(dec))
+    for i in range(max_len):
+        if i < len(inc):
+            intervals.append(inc[i])
+        if i < len(dec):
+            intervals.append(dec[i])
+    return intervals
+
+
+def _validate_poll_intervals(
+    min_poll_interval, max_poll_interval, poll_interval_change_rate
+):
+    if min_poll_interval <= 0 or max_poll_interval <= 0:
+        raise ValueError("Poll intervals must be positive.")
+    if poll_interval_change_rate <= 1:
+        raise ValueError("poll_interval_change_rate must be > 1.")
+
+
+class PollStrategy(ABC):
+    """
+    Decides how long to wait before the next attempt of a status poll.
+
+    Strategies keep no per-poll state (schedules are computed once, when the
+    strategy is created), so one instance can drive any number of concurrent
+    polls, e.g. every extraction of an SDK.
+    """
+
+    def __init__(self, jitter_fraction: float = 0.1):
+        if jitter_fraction < 0:
+            raise ValueError("jitter_fraction must not be negative.")
+        self.jitter_fraction = jitter_fraction
+
+    @abstractmethod
+    def interval(self, attempt: int, elapsed: float) -> float:
+        """
+        Base wait after ``attempt`` unsuccessful polls, ``elapsed`` seconds
+        after the first one.
+        """
+
+    def first_delay(self) -> float:
+        """Wait before the first poll, right away by default."""
+        return 0.0
+
+    def next_sleep(self, attempt: int, elapsed: float) -> float:
+        """:meth:`interval` with jitter applied."""
+        base_interval = self.interval(attempt, elapsed)
+        jitter = base_interval * self.jitter_fraction
+        return max(0, base_interval + random.uniform(-jitter, jitter))
+
+
+class ScheduledPollStrategy(PollStrategy):
+    """Waits ``intervals[attempt - 1]``, repeating the last interval once exhausted."""
+
+    def __init__(self, intervals: List[float], jitter_fraction: float = 0.1):
+        super().__init__(jitter_fraction)
+        if not intervals or min(intervals) <= 0:
+            raise ValueError("Poll intervals must be positive.")
+        self.intervals = list(intervals)
+
+    def interval(self, attempt: int, elapsed: float) -> float:
+        return self.intervals[min(attempt, len(self.intervals)) - 1]
+
+
+class InterleavedPollStrategy(ScheduledPollStrategy):
+    """
+    The :func:`poll_with_timeout` schedule: intervals rising from
+    ``min_poll_interval`` to ``max_poll_interval`` interleaved with falling ones.
+    """
+
+    def __init__(
+        self,
+        min_poll_interval: float = 1,
+        max_poll_interval: float = 5,
+        poll_interval_change_rate: float = 2,
+        jitter_fraction: float = 0.1,
+    ):
+        _validate_poll_intervals(
+            min_poll_interval, max_poll_interval, poll_interval_change_rate
+        )
+        super().__init__(
+            interleave_intervals(
+                min_poll_interval, max_poll_interval, poll_interval_change_rate
+            ),
+            jitter_fraction,
+        )
+
+
+class ExponentialPollStrategy(ScheduledPollStrategy):
+    """
+    Fast start: sub-second first polls growing by ``factor`` up to ``max_interval``.
+
+    Short documents are picked up within a second or two of being ready while
+    long running ones settle at ``max_interval``.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.5,
+        max_interval: float = 30,
+        factor: float = 2,
+        jitter_fraction: float = 0.1,
+    ):
+        _validate_poll_intervals(initial_interval, max_interval, factor)
+        intervals = [initial_interval]
+        while intervals[-1] < max_interval:
+            intervals.append(min(max_interval, intervals[-1] * factor))
+        super().__init__(intervals, jitter_fraction)
+
+
+class FixedPollStrategy(ScheduledPollStrategy):
+    """Polls every ``interval`` seconds."""
+
+    def __init__(self, interval: float, jitter_fraction: float = 0.1):
+        super().__init__([interval], jitter_fraction)
+
+
+class EtaPollStrategy(PollStrategy):
+    """
+    Polls around an expected completion time ``eta`` (seconds after the first poll).
+
+    The first poll happens at ``first_poll_fraction * eta``. Before the ETA it
+    waits half the remaining time, closing in on it; past the ETA the overdue
+    time grows by ``factor`` each attempt. Every wait stays within
+    ``[min_interval, max_interval]``.
+    """
+
+    def __init__(
+        self,
+        eta: float,
+        min_interval: float = 0.5,
+        max_interval: float = 60,
+        factor: float = 2,
+        jitter_fraction: float = 0.1,
+        first_poll_fraction: float = 0.0,
+    ):
+        super().__init__(jitter_fraction)
+        _validate_poll_intervals(min_interval, max_interval, factor)
+        if eta < 0:
+            raise ValueError("eta must not be negative.")
+        if not 0 <= first_poll_fraction <= 1:
+            raise ValueError("first_poll_fraction must be in [0, 1].")
+        self.eta = eta
+        self.first_poll_fraction = first_poll_fraction
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+
+    def first_delay(self) -> float:
+        return self.eta * self.first_poll_fraction
+
+    def interval(self, attempt: int, elapsed: float) -> float:
+        remaining = self.eta - elapsed
+        if remaining > 0:
+            wait = remaining / 2 if remaining > 2 * self.min_interval else remaining
+        else:
+            wait = -remaining * (self.factor - 1)
+        return min(self.max_interval, max(self.min_interval, wait))
+
+
+class DelayedPollStrategy(PollStrategy):
+    """
+    ``strategy`` with its first poll pushed back by ``delay`` seconds, e.g.
+    while waiting for a completion callback.
+    """
+
+    def __init__(self, strategy: PollStrategy, delay: float):
+        super().__init__(strategy.jitter_fraction)
+        if delay < 0:
+            raise ValueError("delay must not be negative.")
+        self.strategy = strategy
+        self.delay = delay
+
+    def first_delay(self) -> float:
+        return self.delay + self.strategy.first_delay()
+
+    def interval(self, attempt: int, elapsed: float) -> float:
+        return self.strategy.interval(attempt, max(0.0, elapsed - self.delay))
+
+    def next_sleep(self, attempt: int, elapsed: float) -> float:
+        return self.strategy.next_sleep(attempt, max(0.0, elapsed - self.delay))
+
+
+# the schedule extraction statuses have always been polled with
+DEFAULT_EXTRACTION_POLL_STRATEGY = InterleavedPollStrategy(
+    min_poll_interval=30, max_poll_interval=300
+)
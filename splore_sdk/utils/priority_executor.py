@@ -0,0 +1,118 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, List, Tuple
+
+
+class PriorityExecutor(Executor):
+    """
+    Thread pool running queued tasks by priority instead of submission order.
+
+    :meth:`submit_prioritized` queues a task by its priority, lowest first,
+    e.g. the size of the file to upload for shortest-job-first. To keep large
+    jobs from starving behind a stream of small ones, a waiting task's
+    priority drops by ``aging_rate`` per second it waits, so any task runs
+    eventually. Tasks queued with plain :meth:`submit` (the short stages
+    following a prioritized one, such as starting an extraction) skip the
+    prioritized queue.
+
+    Example:
+        >>> with PriorityExecutor(max_workers=4, aging_rate=1.0) as executor:
+        ...     executor.submit_prioritized(800, upload, "large.pdf")
+        ...     executor.submit_prioritized(1, upload, "receipt.pdf")
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        aging_rate: float = 1.0,
+        thread_name_prefix: str = "splore-priority",
+    ):
+        """
+        Args:
+            max_workers (int): Tasks running at once.
+            aging_rate (float): How much a waiting task's priority drops per
+                second, ``0`` runs strictly by priority.
+            thread_name_prefix (str): Name prefix of the worker threads.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if aging_rate < 0:
+            raise ValueError("aging_rate must not be negative.")
+        self.max_workers = max_workers
+        self.aging_rate = aging_rate
+        self.thread_name_prefix = thread_name_prefix
+        # (lane, aged priority, sequence, future, fn, args, kwargs), lane 0 skips the queue
+        self._queue: List[Tuple] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._shutdown = False
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run ``fn`` ahead of every prioritized task."""
+        return self._put(0, 0.0, fn, args, kwargs)
+
+    def submit_prioritized(self, priority: float, fn: Callable, *args, **kwargs) -> Future:
+        """Run ``fn`` once the tasks of lower priority, after aging, have started."""
+        # a task's priority after waiting w seconds is priority - aging_rate * w;
+        # all waiting tasks age alike, so ordering by the priority it had at
+        # time zero keeps the heap valid without reordering it
+        return self._put(1, priority + self.aging_rate * time.monotonic(), fn, args, kwargs)
+
+    def _put(self, lane: int, key: float, fn: Callable, args: tuple, kwargs: dict) -> Future:
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            heapq.heappush(
+                self._queue, (lane, key, next(self._sequence), future, fn, args, kwargs)
+            )
+            if self._idle == 0 and len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.thread_name_prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+            else:
+                self._condition.notify()
+        return future
+
+    def queued(self) -> int:
+        """Tasks waiting for a worker."""
+        with self._condition:
+            return len(self._queue)
+
+    def _work(self):
+        while True:
+            with self._condition:
+                self._idle += 1
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                self._idle -= 1
+                if not self._queue:
+                    return
+                _, _, _, future, fn, args, kwargs = heapq.heappop(self._queue)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result: Any = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting tasks, the queued ones still run."""
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
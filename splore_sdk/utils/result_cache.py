@@ -0,0 +1,198 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from splore_sdk.core.logger import sdk_logger
+
+
+def cache_key(*parts) -> str:
+    """Join the parts identifying a cached result, e.g. agent id, extraction id and version."""
+    return ":".join(str(part) for part in parts)
+
+
+def is_completed(response) -> bool:
+    """Whether an extracted response is final and may be cached."""
+    return isinstance(response, dict) and response.get("file", {}).get("status") == "COMPLETED"
+
+
+def _expires_at(ttl: Optional[float]) -> Optional[float]:
+    if ttl is None:
+        return None
+    if ttl <= 0:
+        raise ValueError("ttl must be positive.")
+    return time.time() + ttl
+
+
+def _expired(expires_at: Optional[float]) -> bool:
+    return expires_at is not None and time.time() >= expires_at
+
+
+class ResultCache(ABC):
+    """
+    Cache of completed extraction responses.
+
+    A completed extraction version never changes, so its entry is only
+    evicted to stay under the size limit. Entries set with a ``ttl``, such
+    as results reused for identical content, which depend on the agent's
+    configuration at the time, expire after ``ttl`` seconds. Implementations
+    must be thread safe and return a fresh copy from :meth:`get`.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict]:
+        """The cached value of ``key``, ``None`` if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Dict, ttl: Optional[float] = None):
+        """Cache ``value`` under ``key``, for ``ttl`` seconds unless ``None``."""
+
+
+class MemoryResultCache(ResultCache):
+    """
+    In-process LRU cache holding at most ``max_bytes`` of JSON encoded responses.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive.")
+        self.max_bytes = max_bytes
+        self.size = 0
+        # key -> (JSON encoded value, expiry time or None)
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            encoded, expires_at = entry
+            if _expired(expires_at):
+                del self._entries[key]
+                self.size -= len(encoded)
+                return None
+            self._entries.move_to_end(key)
+        return json.loads(encoded)
+
+    def set(self, key: str, value: Dict, ttl: Optional[float] = None):
+        expires_at = _expires_at(ttl)
+        encoded = json.dumps(value).encode("utf-8")
+        if len(encoded) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[0])
+            self._entries[key] = (encoded, expires_at)
+            self.size += len(encoded)
+            while self.size > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskResultCache(ResultCache):
+    """
+    Gzip compressed JSON files in ``directory``, at most ``max_bytes`` on disk.
+
+    The least recently read files are evicted first. Files are written
+    atomically so several processes may share the directory. Each file
+    holds ``{"expires_at": ..., "value": ...}``.
+    """
+
+    SUFFIX = ".json.gz"
+
+    def __init__(self, directory: str, max_bytes: int = 1024 * 1024 * 1024):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive.")
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        self.logger = sdk_logger
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self.size = sum(size for _, size, _ in self._files())
+
+    def _path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + self.SUFFIX)
+
+    def _files(self):
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(self.SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rb") as file:
+                entry = json.loads(file.read())
+            value, expires_at = entry["value"], entry["expires_at"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Dropping unreadable cached result {path}: {e}")
+            self._remove(path)
+            return None
+        if _expired(expires_at):
+            self._remove(path)
+            return None
+        try:
+            # the mtime orders eviction, a read marks the file as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Dict, ttl: Optional[float] = None):
+        entry = {"expires_at": _expires_at(ttl), "value": value}
+        compressed = gzip.compress(json.dumps(entry).encode("utf-8"))
+        if len(compressed) > self.max_bytes:
+            return
+        path = self._path(key)
+        descriptor, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(compressed)
+        with self._lock:
+            try:
+                self.size -= os.path.getsize(path)
+            except OSError:
+                pass
+            os.replace(tmp_path, path)
+            self.size += len(compressed)
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def _remove(self, path: str):
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                self.size -= size
+            except OSError:
+                pass
+
+    def _evict(self):
+        # other processes write here too, recount before evicting
+        files = sorted(self._files(), key=lambda file: file[2])
+        self.size = sum(size for _, size, _ in files)
+        for path, size, _ in files:
+            if self.size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.size -= size
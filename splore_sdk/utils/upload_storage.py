@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import IO, Optional
+from tusclient.fingerprint.interface import Fingerprint
+from tusclient.storage.interface import Storage
+from splore_sdk.utils.dedup_index import content_sha256
+
+
+class UploadFingerprint(Fingerprint):
+    """
+    Identifies an upload by its size and the sha256 of its whole content.
+
+    tus' default fingerprint only hashes the first block, which scanned
+    documents produced by the same device often share; resuming another
+    file's upload would send the server a mix of both. The key is prefixed
+    with ``namespace`` (the base id) so bases sharing one store never resume
+    each other's uploads.
+    """
+
+    def __init__(self, namespace: str = ""):
+        self.namespace = namespace
+
+    def get_fingerprint(self, fs: IO) -> str:
+        digest, _ = content_sha256(file_stream=fs)
+        size = fs.seek(0, os.SEEK_END)
+        return f"{self.namespace}:size:{size}--sha256:{digest}"
+
+
+class SQLiteURLStorage(Storage):
+    """
+    tus ``url_storage`` persisted in a SQLite database.
+
+    Maps upload fingerprints to tus upload urls so an upload interrupted by a
+    crash or redeploy resumes from the server offset in the next process.
+    Several processes may share one database file.
+
+    Example:
+        >>> storage = SQLiteURLStorage("~/.splore/uploads.db")
+        >>> sdk = SploreSDK(api_key="...", base_id="...", url_storage=storage)
+    """
+
+    def __init__(self, path: str, max_age: Optional[float] = 24 * 60 * 60):
+        """
+        Args:
+            path (str): Database file, created with its directory if missing.
+            max_age (Optional[float]): Seconds after which a stored url is
+                ignored, as the server expires unfinished uploads. ``None``
+                keeps urls until the upload completes.
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tus_uploads ("
+                "fingerprint TEXT PRIMARY KEY, url TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def get_item(self, key: str) -> Optional[str]:
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                "SELECT url, updated_at FROM tus_uploads WHERE fingerprint = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        url, updated_at = row
+        if self.max_age is not None and time.time() - updated_at > self.max_age:
+            self.remove_item(key)
+            return None
+        return url
+
+    def set_item(self, key: str, value: Optional[str]):
+        if value is None:
+            # tus stores whatever it looked up, including a miss
+            self.remove_item(key)
+            return
+        with self._lock, self._connect() as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO tus_uploads (fingerprint, url, updated_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+
+    def remove_item(self, key: str):
+        with self._lock, self._connect() as connection, connection:
+            connection.execute("DELETE FROM tus_uploads WHERE fingerprint = ?", (key,))
@@ -0,0 +1,201 @@
+import threading
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from splore_sdk.core.api_client import APIClient
+from splore_sdk.core.constants import DEFAULT_TIMEOUT
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.core.exceptions import APIError, DeadlineExceededError
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient(
+        api_key="test_api_key", base_id="base_1", pool_connections=4, pool_maxsize=8
+    )
+    yield client
+    client.close()
+
+
+def test_session_is_shared_across_threads(api_client):
+    sessions = []
+
+    def grab_session():
+        sessions.append(api_client.get_session())
+
+    threads = [threading.Thread(target=grab_session) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(sessions) == 8
+    assert all(session is sessions[0] for session in sessions)
+
+
+
+def test_agent_client_shares_the_session(api_client):
+    api_client.agent_id = "agent_1"
+    other = api_client.for_agent("agent_2")
+
+    assert other.get_session() is api_client.get_session()
+    assert (api_client.agent_id, other.agent_id) == ("agent_1", "agent_2")
+    other.close()
+    assert api_client._session is not None
+
+def test_pool_is_configured_from_client_options(api_client):
+    adapter = api_client.get_session().get_adapter("https://api.splore.ai")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 8
+    assert adapter._pool_block is False
+
+
+def test_close_releases_owned_session(api_client):
+    session = api_client.get_session()
+    session.close = MagicMock()
+
+    api_client.close()
+
+    session.close.assert_called_once()
+    # a fresh pool is created on the next request
+    assert api_client.get_session() is not session
+
+
+def test_close_keeps_caller_owned_session():
+    session = MagicMock()
+    client = APIClient(api_key="test_api_key", base_id="base_1", session=session)
+    assert client.get_session() is session
+
+    client.close()
+
+    session.close.assert_not_called()
+
+
+def test_context_manager_closes_client():
+    with APIClient(api_key="test_api_key", base_id="base_1") as client:
+        session = client.get_session()
+        session.close = MagicMock()
+    session.close.assert_called_once()
+
+
+def _mock_session(api_client):
+    session = MagicMock()
+    session.request.return_value.json.return_value = {"ok": True}
+    api_client.set_session(session)
+    return session
+
+
+def test_request_applies_default_timeout(api_client):
+    session = _mock_session(api_client)
+
+    api_client.request(method="GET", endpoint="api/rest/v2/agents")
+
+    assert session.request.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+
+def test_request_clamps_timeout_to_deadline(api_client):
+    session = _mock_session(api_client)
+    deadline = MagicMock()
+    deadline.clamp_timeout.return_value = (2.0, 2.0)
+
+    api_client.request(method="GET", endpoint="api/rest/v2/agents", deadline=deadline)
+
+    deadline.check.assert_called_once()
+    deadline.clamp_timeout.assert_called_once_with(DEFAULT_TIMEOUT)
+    assert session.request.call_args.kwargs["timeout"] == (2.0, 2.0)
+
+
+def test_expired_deadline_is_not_retried(api_client):
+    session = _mock_session(api_client)
+
+    with pytest.raises(DeadlineExceededError):
+        api_client.request(
+            method="GET", endpoint="api/rest/v2/agents", deadline=Deadline(0)
+        )
+    session.request.assert_not_called()
+
+
+def _http_error_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+def test_validate_api_key_fails_fast_on_unauthorized(api_client):
+    session = MagicMock()
+    session.request.return_value = _http_error_response(401)
+    api_client.set_session(session)
+
+    with pytest.raises(APIError) as exc_info:
+        api_client.validate_api_key()
+
+    assert exc_info.value.status_code == 401
+    assert session.request.call_count == 1
+
+
+def test_request_honors_retry_after(api_client):
+    ok = MagicMock()
+    ok.json.return_value = {"ok": True}
+    session = MagicMock()
+    session.request.side_effect = [
+        _http_error_response(429, {"Retry-After": "3"}),
+        ok,
+    ]
+    api_client.set_session(session)
+
+    with patch("splore_sdk.core.api_client.time.sleep") as mock_sleep:
+        result = api_client.request(method="GET", endpoint="api/rest/v2/agents")
+
+    assert result == {"ok": True}
+    mock_sleep.assert_called_once_with(3.0)
+
+
+def test_post_without_idempotency_key_is_not_retried(api_client):
+    session = MagicMock()
+    session.request.return_value = _http_error_response(502)
+    api_client.set_session(session)
+
+    with pytest.raises(APIError):
+        api_client.request(method="POST", endpoint="api/rest/v2/extractions/files")
+
+    assert session.request.call_count == 1
+
+
+def test_post_with_idempotency_key_is_retried_with_same_key(api_client):
+    ok = MagicMock()
+    ok.json.return_value = {"extractionId": "ext_1"}
+    session = MagicMock()
+    session.request.side_effect = [_http_error_response(502), ok]
+    api_client.set_session(session)
+
+    with patch("splore_sdk.core.api_client.time.sleep"):
+        result = api_client.request(
+            method="POST",
+            endpoint="api/rest/v2/extractions/start",
+            json={},
+            idempotency_key="key-1",
+        )
+
+    assert result == {"extractionId": "ext_1"}
+    sent_keys = [
+        call.kwargs["headers"]["Idempotency-Key"]
+        for call in session.request.call_args_list
+    ]
+    assert sent_keys == ["key-1", "key-1"]
+
+
+def test_retry_sleep_never_overruns_deadline(api_client):
+    session = MagicMock()
+    session.request.return_value = _http_error_response(
+        503, {"Retry-After": "60"}
+    )
+    api_client.set_session(session)
+
+    with patch("splore_sdk.core.api_client.time.sleep") as mock_sleep:
+        with pytest.raises(DeadlineExceededError):
+            api_client.request(
+                method="GET", endpoint="api/rest/v2/agents", deadline=Deadline(5)
+            )
+    mock_sleep.assert_not_called()
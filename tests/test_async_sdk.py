@@ -0,0 +1,232 @@
+import asyncio
+import pytest
+from unittest.mock import ANY, MagicMock, patch
+from aiohttp import web
+
+from splore_sdk.async_sdk import AsyncAgentSDK, AsyncSploreSDK
+from splore_sdk.core.async_api_client import AsyncAPIClient
+from splore_sdk.core.exceptions import APIError
+from splore_sdk.extractions.async_extractions_service import AsyncExtractionService
+from splore_sdk.utils.result_cache import MemoryResultCache
+
+
+class FakeAsyncClient:
+    """Records calls the way MagicMock does, but returns awaitables."""
+
+    def __init__(self, responses=None):
+        self.agent_id = None
+        self.calls = []
+        self.responses = list(responses or [])
+
+    async def request(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses.pop(0) if self.responses else {}
+
+    def for_agent(self, agent_id):
+        return self
+
+
+async def _serve(app, coro_factory):
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        return await coro_factory(f"http://127.0.0.1:{port}")
+    finally:
+        await runner.cleanup()
+
+
+def test_async_api_client_request_returns_json():
+    seen = {}
+
+    async def handler(request):
+        seen["api_key"] = request.headers.get("X-API-KEY")
+        seen["query"] = dict(request.query)
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/api/rest/v2/extractions", handler)
+
+    async def run(base_url):
+        async with AsyncAPIClient("key", "base", base_url=base_url) as client:
+            return await client.request(
+                method="GET",
+                endpoint="api/rest/v2/extractions",
+                params={"page": 0, "compact": True, "skip": None},
+            )
+
+    assert asyncio.run(_serve(app, run)) == {"ok": True}
+    assert seen["api_key"] == "key"
+    assert seen["query"] == {"page": "0", "compact": "True"}
+
+
+def _status_app(path, statuses, calls):
+    async def handler(request):
+        calls.append(request.headers.get("Idempotency-Key"))
+        return web.Response(status=statuses[min(len(calls), len(statuses)) - 1])
+
+    app = web.Application()
+    app.router.add_route("*", path, handler)
+    return app
+
+
+def test_async_api_client_retries_server_errors_then_raises():
+    calls = []
+    app = _status_app("/boom", [500], calls)
+
+    async def run(base_url):
+        async with AsyncAPIClient("key", "base", base_url=base_url) as client:
+            with patch("splore_sdk.core.async_api_client.asyncio.sleep"):
+                with pytest.raises(APIError) as exc_info:
+                    await client.request(method="GET", endpoint="boom")
+        assert exc_info.value.status_code == 500
+
+    asyncio.run(_serve(app, run))
+    assert len(calls) == 4
+
+
+def test_async_api_client_does_not_retry_client_errors():
+    calls = []
+    app = _status_app("/missing", [404], calls)
+
+    async def run(base_url):
+        async with AsyncAPIClient("key", "base", base_url=base_url) as client:
+            with pytest.raises(APIError):
+                await client.request(method="GET", endpoint="missing")
+
+    asyncio.run(_serve(app, run))
+    assert len(calls) == 1
+
+
+def test_async_api_client_retries_post_with_same_idempotency_key():
+    calls = []
+    app = _status_app("/start", [503, 200], calls)
+
+    async def run(base_url):
+        async with AsyncAPIClient("key", "base", base_url=base_url) as client:
+            with patch("splore_sdk.core.async_api_client.asyncio.sleep"):
+                return await client.request(
+                    method="POST", endpoint="start", json={}, idempotency_key="abc"
+                )
+
+    asyncio.run(_serve(app, run))
+    assert calls == ["abc", "abc"]
+
+
+def test_async_extraction_service_start():
+    client = FakeAsyncClient(responses=[{"extractionId": "ext_1"}])
+    service = AsyncExtractionService(client, agent_id="agent_1")
+
+    response = asyncio.run(service.start(file_id="file_1"))
+
+    assert response == {"extractionId": "ext_1"}
+    assert client.calls == [
+        {
+            "method": "POST",
+            "endpoint": "api/rest/v2/extractions/start",
+            "json": {"agent_id": "agent_1", "file_id": "file_1"},
+            "deadline": None,
+            "idempotency_key": ANY,
+        }
+    ]
+
+
+def test_async_extraction_service_requires_agent():
+    service = AsyncExtractionService(FakeAsyncClient(), agent_id=None)
+    with pytest.raises(ValueError):
+        asyncio.run(service.processing_status(file_id="file_1"))
+
+
+def test_async_agent_sdk_extract_flow():
+    client = FakeAsyncClient(
+        responses=[
+            {"fileProcessingStatus": "INDEXED"},
+            {"extractionId": "ext_1"},
+            {"file": {"status": "COMPLETED"}, "data": "extracted"},
+        ]
+    )
+    with patch("splore_sdk.async_sdk.AsyncAPIClient", return_value=client), patch(
+        "splore_sdk.async_sdk.FileUploader"
+    ) as MockFileUploader:
+        uploader = MagicMock()
+
+        async def upload_file_async(**kwargs):
+            return "file_1"
+
+        uploader.upload_file_async = upload_file_async
+        MockFileUploader.return_value = uploader
+        agent = AsyncAgentSDK("key", "base", "agent_1")
+        result = asyncio.run(agent.extract(file_path="invoice.pdf"))
+
+    assert result == {"file": {"status": "COMPLETED"}, "data": "extracted"}
+    assert [call["endpoint"] for call in client.calls] == [
+        "api/rest/v2/extractions/status",
+        "api/rest/v2/extractions/start",
+        "api/rest/v2/extractions/ext_1",
+    ]
+
+
+def test_async_sdk_context_manager_validates_key():
+    client = FakeAsyncClient()
+    closed = []
+
+    async def validate_api_key():
+        return {"valid": True}
+
+    async def close():
+        closed.append(True)
+
+    client.validate_api_key = validate_api_key
+    client.close = close
+    with patch("splore_sdk.async_sdk.AsyncAPIClient", return_value=client), patch(
+        "splore_sdk.async_sdk.FileUploader"
+    ):
+
+        async def run():
+            async with AsyncSploreSDK("key", "base") as sdk:
+                return sdk.init_agent("agent_1")
+
+        agent = asyncio.run(run())
+
+    assert isinstance(agent, AsyncAgentSDK)
+    assert agent.client is client
+    assert closed == [True]
+
+
+def test_agents_share_the_sdk_session():
+    async def run():
+        client = AsyncAPIClient("key", "base")
+        agent_client = client.for_agent("agent_2")
+        session = agent_client.get_session()
+        assert session is client.get_session()
+        assert agent_client.agent_id == "agent_2" and client.agent_id is None
+        await agent_client.close()
+        assert not session.closed
+        await client.close()
+        assert session.closed
+
+    asyncio.run(run())
+
+
+def test_init_agent_borrows_the_sdk_client():
+    sdk = AsyncSploreSDK("key", "base")
+    agent = sdk.init_agent("agent_1")
+
+    assert agent.client._parent is sdk.client
+    assert agent.client.agent_id == "agent_1"
+
+
+def test_async_service_serves_completed_extractions_from_the_cache():
+    completed = {"file": {"status": "COMPLETED"}}
+    client = FakeAsyncClient(responses=[completed])
+    service = AsyncExtractionService(
+        client, agent_id="agent_1", result_cache=MemoryResultCache()
+    )
+
+    async def run():
+        return [await service.extracted_response_by_extraction_id("ext_1") for _ in range(2)]
+
+    assert asyncio.run(run()) == [completed, completed]
+    assert len(client.calls) == 1
@@ -0,0 +1,210 @@
+import io
+import os
+import threading
+import time
+import pytest
+from unittest.mock import ANY, MagicMock
+
+from splore_sdk.extractions.batch import input_kwargs, size_priority
+from splore_sdk.sdk import ExtractionCapability
+
+
+@pytest.fixture
+def capability():
+    service = MagicMock()
+    service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    service.start.return_value = {"extractionId": "ext_1"}
+    service.extracted_response_by_extraction_id.return_value = {
+        "file": {"status": "COMPLETED"}
+    }
+    capability = ExtractionCapability(MagicMock(), "agent_1", MagicMock())
+    capability.service = service
+    return capability
+
+
+def _uploads(capability, upload):
+    """Make each extraction resolve to the file id returned by ``upload``."""
+    capability.file_uploader.upload_file.side_effect = upload
+
+    def start(file_id, deadline=None):
+        return {"extractionId": file_id}
+
+    def extracted(extraction_id, version=1, deadline=None):
+        return {"file": {"status": "COMPLETED"}, "id": extraction_id}
+
+    capability.service.start.side_effect = start
+    capability.service.extracted_response_by_extraction_id.side_effect = extracted
+
+
+def test_input_kwargs_maps_paths_and_streams(tmp_path):
+    stream = io.BytesIO(b"data")
+    assert input_kwargs("a.pdf") == {"file_path": "a.pdf", "file_stream": None}
+    assert input_kwargs(tmp_path / "b.pdf")["file_path"] == str(tmp_path / "b.pdf")
+    assert input_kwargs(stream) == {"file_path": None, "file_stream": stream}
+    with pytest.raises(ValueError):
+        input_kwargs(42)
+
+
+def test_extract_many_returns_results_in_input_order(capability):
+    def upload(file_path=None, file_stream=None, deadline=None):
+        # finish in reverse order of submission
+        time.sleep({"a.pdf": 0.1, "b.pdf": 0.0}[file_path])
+        return file_path
+
+    _uploads(capability, upload)
+
+    results = capability.extract_many(["a.pdf", "b.pdf"], max_concurrency=2)
+
+    assert [result.input for result in results] == ["a.pdf", "b.pdf"]
+    assert [result.result["id"] for result in results] == ["a.pdf", "b.pdf"]
+    unordered = capability.extract_many(
+        ["a.pdf", "b.pdf"], max_concurrency=2, ordered=False
+    )
+    assert [result.input for result in unordered] == ["b.pdf", "a.pdf"]
+
+
+def test_extract_many_collects_errors_per_input(capability):
+    error = RuntimeError("upload failed")
+
+    def upload(file_path=None, file_stream=None, deadline=None):
+        if file_path == "bad.pdf":
+            raise error
+        return file_path
+
+    _uploads(capability, upload)
+
+    results = capability.extract_many(["good.pdf", "bad.pdf", 42])
+
+    assert results[0].ok and results[0].result["id"] == "good.pdf"
+    assert not results[1].ok and results[1].error is error
+    assert isinstance(results[2].error, ValueError)
+    assert capability.file_uploader.upload_file.call_count == 2
+
+
+def test_extract_many_bounds_concurrency(capability):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def upload(file_path=None, file_stream=None, deadline=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return file_path
+
+    _uploads(capability, upload)
+
+    results = capability.extract_many([f"{i}.pdf" for i in range(8)], max_concurrency=3)
+
+    assert len(results) == 8 and all(result.ok for result in results)
+    assert peak[0] <= 3
+
+
+def test_extract_many_rejects_invalid_concurrency(capability):
+    with pytest.raises(ValueError):
+        capability.extract_many(["a.pdf"], max_concurrency=0)
+
+
+def test_size_priority(tmp_path):
+    path = tmp_path / "large.pdf"
+    path.write_bytes(b"x" * 2 * 1024 * 1024)
+
+    assert size_priority(str(path)) == 2
+    assert size_priority(io.BytesIO(b"x" * 1024 * 1024)) == 1
+
+
+def test_extract_many_uploads_small_files_first(capability):
+    sizes = {"first.pdf": -1, "large.pdf": 800, "medium.pdf": 20, "small.pdf": 1, "tiny.pdf": 0.5}
+    uploaded = []
+
+    def upload(file_path=None, file_stream=None, deadline=None):
+        uploaded.append(file_path)
+        # hold the only worker until every file is queued
+        time.sleep(0.1 if file_path == "first.pdf" else 0.0)
+        return file_path
+
+    _uploads(capability, upload)
+
+    results = capability.extract_many(
+        list(sizes), max_concurrency=1, priority=sizes.get, aging_rate=0
+    )
+
+    assert uploaded == ["first.pdf", "tiny.pdf", "small.pdf", "medium.pdf", "large.pdf"]
+    assert [result.input for result in results] == list(sizes)
+    assert all(result.ok for result in results)
+
+
+def test_extract_many_collects_priority_errors(capability):
+    _uploads(capability, lambda file_path=None, file_stream=None, deadline=None: file_path)
+
+    results = capability.extract_many(
+        ["missing.pdf", "a.pdf"],
+        priority=lambda item: size_priority(item) if item == "missing.pdf" else 0,
+    )
+
+    assert isinstance(results[0].error, OSError)
+    assert results[1].ok
+
+
+def test_extract_as_completed_streams_results_lazily(capability):
+    consumed = []
+
+    def inputs():
+        for name in ["slow.pdf", "fast.pdf", 42, "last.pdf"]:
+            consumed.append(name)
+            yield name
+
+    def upload(file_path=None, file_stream=None, deadline=None):
+        time.sleep(0.1 if file_path == "slow.pdf" else 0.0)
+        return file_path
+
+    _uploads(capability, upload)
+
+    stream = capability.extract_as_completed(inputs(), max_in_flight=2)
+    first = next(stream)
+    assert consumed == ["slow.pdf", "fast.pdf"]
+    rest = list(stream)
+
+    assert first.input == "fast.pdf" and first.result["id"] == "fast.pdf"
+    assert [result.input for result in rest] == [42, "last.pdf", "slow.pdf"]
+    assert isinstance(rest[0].error, ValueError)
+
+
+def test_extract_as_completed_yields_unreadable_inputs(capability):
+    class UnmountedPath(os.PathLike):
+        def __fspath__(self):
+            raise OSError("share is not mounted")
+
+    _uploads(capability, lambda file_path=None, file_stream=None, deadline=None: file_path)
+    unmounted = UnmountedPath()
+
+    results = list(capability.extract_as_completed([unmounted, "a.pdf"]))
+
+    assert results[0].input is unmounted and isinstance(results[0].error, OSError)
+    assert results[1].ok
+
+
+def test_closing_extract_as_completed_cancels_in_flight(capability):
+    release = threading.Event()
+
+    def upload(file_path=None, file_stream=None, deadline=None):
+        if file_path == "blocked.pdf":
+            release.wait(5)
+        return file_path
+
+    _uploads(capability, upload)
+
+    stream = capability.extract_as_completed(["blocked.pdf", "a.pdf"], max_in_flight=2)
+    assert next(stream).input == "a.pdf"
+    stream.close()
+    release.set()
+    capability.close()
+
+    capability.service.start.assert_called_once_with(file_id="a.pdf", deadline=ANY)
+
+
+def test_extract_as_completed_rejects_invalid_window(capability):
+    with pytest.raises(ValueError):
+        capability.extract_as_completed(["a.pdf"], max_in_flight=0)
@@ -0,0 +1,208 @@
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from splore_sdk.async_sdk import AsyncAgentSDK
+from splore_sdk.core.cancellation import CancellationToken
+from splore_sdk.core.exceptions import CancelledError
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.decorators import async_poll_with_timeout, poll_with_timeout
+from splore_sdk.utils.job_journal import JobJournal
+from splore_sdk.utils.poll_scheduler import PollScheduler
+from splore_sdk.utils.poll_strategy import FixedPollStrategy
+from tests.test_async_sdk import FakeAsyncClient
+
+RUNNING = {"file": {"status": "RUNNING"}}
+SLOW = FixedPollStrategy(30)
+
+
+def cancel_later(token, delay=0.1):
+    threading.Timer(delay, token.cancel, ("shutting down",)).start()
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = PollScheduler(max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_token_runs_callbacks_once():
+    token = CancellationToken()
+    calls = []
+    token.add_callback(lambda: calls.append("first"))
+    remove = token.add_callback(lambda: calls.append("removed"))
+    remove()
+
+    token.cancel("stop")
+    token.cancel("again")
+    token.add_callback(lambda: calls.append("late"))
+
+    assert calls == ["first", "late"]
+    assert token.cancelled and token.reason == "stop"
+
+
+def test_token_check_reports_ids():
+    token = CancellationToken()
+    token.check("Extraction")
+    token.cancel()
+
+    with pytest.raises(CancelledError) as error:
+        token.check("Extraction", file_id="f1", extraction_id="e1")
+    assert (error.value.file_id, error.value.extraction_id) == ("f1", "e1")
+
+
+def test_wait_returns_early_on_cancel():
+    token = CancellationToken()
+    assert token.wait(0.01) is False
+
+    cancel_later(token)
+    started = time.monotonic()
+    assert token.wait(10) is True
+    assert time.monotonic() - started < 5
+
+
+def test_poll_decorator_wakes_on_cancel():
+    token = CancellationToken()
+    calls = []
+
+    @poll_with_timeout(condition=lambda r: False, max_timeout=60, strategy=SLOW, cancellation=token)
+    def poll():
+        calls.append(1)
+
+    cancel_later(token)
+    started = time.monotonic()
+    with pytest.raises(CancelledError, match="shutting down"):
+        poll()
+    assert time.monotonic() - started < 5
+    assert len(calls) == 1
+
+
+def test_async_poll_decorator_wakes_on_cancel():
+    token = CancellationToken()
+
+    @async_poll_with_timeout(
+        condition=lambda r: False, max_timeout=60, strategy=SLOW, cancellation=token
+    )
+    async def poll():
+        return None
+
+    async def run():
+        asyncio.get_event_loop().call_later(0.1, token.cancel)
+        await poll()
+
+    started = time.monotonic()
+    with pytest.raises(CancelledError):
+        asyncio.run(run())
+    assert time.monotonic() - started < 5
+
+
+def make_capability(scheduler, **options):
+    service = MagicMock()
+    service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    service.start.return_value = {"extractionId": "ext_1"}
+    service.start_extraction_by_extraction_id.return_value = {"version": 2}
+    service.extracted_response_by_extraction_id.return_value = RUNNING
+    uploader = MagicMock()
+    uploader.upload_file.return_value = "file_1"
+    capability = ExtractionCapability(
+        MagicMock(base_id="base_1"),
+        "agent_1",
+        uploader,
+        poll_scheduler=scheduler,
+        poll_strategy=SLOW,
+        **options,
+    )
+    capability.service = service
+    return capability
+
+
+def test_extract_raises_with_ids_on_cancel(scheduler):
+    capability = make_capability(scheduler)
+    token = CancellationToken()
+    capability.service.start.side_effect = lambda **kwargs: (
+        cancel_later(token) or {"extractionId": "ext_1"}
+    )
+
+    started = time.monotonic()
+    with pytest.raises(CancelledError) as error:
+        capability.extract(file_path="invoice.pdf", cancellation=token)
+
+    assert time.monotonic() - started < 5
+    assert (error.value.file_id, error.value.extraction_id) == ("file_1", "ext_1")
+    # the pending poll was dropped
+    deadline = time.monotonic() + 5
+    while scheduler.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert scheduler.pending() == 0
+
+
+def test_cancelled_token_stops_job_before_upload(scheduler):
+    capability = make_capability(scheduler)
+    token = CancellationToken()
+    token.cancel()
+
+    job = capability.submit_extraction(file_path="invoice.pdf", cancellation=token)
+
+    with pytest.raises(CancelledError):
+        job.result(timeout=5)
+    capability.close()
+    capability.file_uploader.upload_file.assert_not_called()
+
+
+def test_cancelled_job_stays_resumable(scheduler, tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    capability = make_capability(scheduler, job_journal=journal)
+    token = CancellationToken()
+    capability.service.start.side_effect = lambda **kwargs: (
+        cancel_later(token) or {"extractionId": "ext_1"}
+    )
+
+    job = capability.submit_extraction(file_path="invoice.pdf", cancellation=token)
+    with pytest.raises(CancelledError):
+        job.result(timeout=5)
+
+    [entry] = journal.entries("agent_1", "base_1", unfinished=True)
+    assert (entry.state, entry.extraction_id) == ("EXTRACTING", "ext_1")
+
+
+def test_retry_extraction_raises_with_ids_on_cancel(scheduler):
+    capability = make_capability(scheduler)
+    token = CancellationToken()
+    cancel_later(token)
+
+    with pytest.raises(CancelledError) as error:
+        capability.retry_extraction("ext_9", cancellation=token)
+
+    assert (error.value.extraction_id, error.value.version) == ("ext_9", 2)
+
+
+def test_async_extract_raises_with_ids_on_cancel():
+    client = FakeAsyncClient(
+        responses=[{"fileProcessingStatus": "INDEXED"}, {"extractionId": "ext_1"}]
+    )
+    token = CancellationToken()
+    with patch("splore_sdk.async_sdk.AsyncAPIClient", return_value=client), patch(
+        "splore_sdk.async_sdk.FileUploader"
+    ) as MockFileUploader:
+        uploader = MagicMock()
+
+        async def upload_file_async(**kwargs):
+            return "file_1"
+
+        uploader.upload_file_async = upload_file_async
+        MockFileUploader.return_value = uploader
+        agent = AsyncAgentSDK("key", "base", "agent_1")
+
+        async def run():
+            asyncio.get_event_loop().call_later(0.1, token.cancel)
+            await agent.extract(
+                file_path="invoice.pdf", poll_strategy=SLOW, cancellation=token
+            )
+
+        with pytest.raises(CancelledError) as error:
+            asyncio.run(run())
+
+    assert (error.value.file_id, error.value.extraction_id) == ("file_1", "ext_1")
@@ -0,0 +1,52 @@
+import pytest
+
+from splore_sdk.utils.chunk_size import AdaptiveChunkSize, UploadStats
+
+MB = 1024 * 1024
+
+
+def test_chunk_size_grows_at_most_twofold_on_fast_links():
+    sizer = AdaptiveChunkSize(5 * MB, min_size=MB, max_size=64 * MB)
+    # 5 MB in 0.05s: the round trip dominates
+    assert sizer.update(5 * MB, 0.05) == 10 * MB
+    assert sizer.update(10 * MB, 0.05) == 20 * MB
+
+
+def test_chunk_size_tracks_throughput_times_target():
+    sizer = AdaptiveChunkSize(8 * MB, min_size=MB, max_size=64 * MB, smoothing=1)
+    # 8 MB in 2.5s is 3.2 MB/s, a 2s chunk is 6.4 MB
+    assert sizer.update(8 * MB, 2.5) == int(6.4 * MB)
+
+
+def test_chunk_size_shrinks_on_slow_links_and_failures():
+    sizer = AdaptiveChunkSize(8 * MB, min_size=MB, max_size=64 * MB)
+    assert sizer.update(8 * MB, 60) == 4 * MB
+    assert sizer.on_failure() == 2 * MB
+    assert sizer.on_failure() == MB
+    assert sizer.on_failure() == MB
+
+
+def test_short_last_chunk_keeps_size():
+    sizer = AdaptiveChunkSize(8 * MB, min_size=MB, max_size=64 * MB)
+    assert sizer.update(100, 0.01) == 8 * MB
+
+
+def test_chunk_size_bounds_are_validated():
+    with pytest.raises(ValueError):
+        AdaptiveChunkSize(MB, min_size=2 * MB, max_size=MB)
+    assert AdaptiveChunkSize(128 * MB, min_size=MB, max_size=64 * MB).size == 64 * MB
+
+
+def test_upload_stats():
+    stats = UploadStats(total_bytes=300)
+    stats.record_chunk(100, 0.5)
+    stats.record_chunk(200, 1.5)
+    stats.record_failure()
+    stats.finish()
+
+    summary = stats.as_dict()
+    assert summary["bytes_uploaded"] == 300
+    assert summary["chunks"] == 2 and summary["failed_chunks"] == 1
+    assert summary["mean_chunk_seconds"] == 1.0
+    assert summary["last_chunk_size"] == 200
+    assert stats.throughput > 0
@@ -0,0 +1,186 @@
+import hashlib
+import hmac
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+from unittest.mock import MagicMock
+
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.completion_notifier import CompletionNotifier, WebhookReceiver
+from splore_sdk.utils.poll_scheduler import PollScheduler
+from splore_sdk.utils.poll_strategy import DelayedPollStrategy, FixedPollStrategy
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = PollScheduler(max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def receiver():
+    with WebhookReceiver(fallback_after=30) as receiver:
+        yield receiver
+
+
+def post(url, payload, headers=None):
+    body = json.dumps(payload).encode("utf-8")
+    request = urllib.request.Request(
+        url, data=body, headers=headers or {}, method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.status
+
+
+def test_notify_reaches_subscribers_until_unsubscribed():
+    notifier = CompletionNotifier()
+    events = []
+    unsubscribe = notifier.subscribe("file:f1", events.append)
+
+    notifier.notify("file:f1", {"n": 1})
+    notifier.notify("file:f2", {"n": 2})
+    unsubscribe()
+    notifier.notify("file:f1", {"n": 3})
+
+    assert events == [{"n": 1}]
+
+
+def test_recent_events_replay_to_late_subscribers():
+    notifier = CompletionNotifier(retention=0.05)
+    notifier.notify("file:f1", "indexed")
+    events = []
+
+    notifier.subscribe("file:f1", events.append)
+    time.sleep(0.1)
+    notifier.subscribe("file:f1", events.append)
+
+    assert events == ["indexed"]
+
+
+def test_failing_subscriber_does_not_stop_others():
+    notifier = CompletionNotifier()
+    events = []
+    notifier.subscribe("k", MagicMock(side_effect=ValueError("boom")))
+    notifier.subscribe("k", events.append)
+
+    notifier.notify("k", 1)
+
+    assert events == [1]
+
+
+def test_webhook_notifies_file_and_extraction(receiver):
+    events = []
+    receiver.subscribe("file:f1", events.append)
+    receiver.subscribe("extraction:e1", events.append)
+
+    assert post(receiver.url, {"fileId": "f1", "extractionId": "e1"}) == 204
+
+    assert events == [{"fileId": "f1", "extractionId": "e1"}] * 2
+
+
+def test_webhook_rejects_bad_requests(receiver):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(receiver.url.replace("/splore/callback", "/other"), {"fileId": "f1"})
+    assert error.value.code == 404
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(receiver.url, ["not", "an", "object"])
+    assert error.value.code == 400
+
+
+def test_webhook_checks_signature():
+    with WebhookReceiver(secret="s3cret") as receiver:
+        events = []
+        receiver.subscribe("file:f1", events.append)
+        payload = {"fileId": "f1"}
+        signature = hmac.new(
+            b"s3cret", json.dumps(payload).encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            post(receiver.url, payload, {receiver.SIGNATURE_HEADER: "sha256=bad"})
+        assert error.value.code == 401
+        post(receiver.url, payload, {receiver.SIGNATURE_HEADER: f"sha256={signature}"})
+
+    assert events == [payload]
+
+
+def test_poll_now_skips_the_wait(scheduler):
+    calls = []
+    future = scheduler.submit(
+        lambda: calls.append(1) or len(calls),
+        condition=lambda n: n == 2,
+        max_timeout=60,
+        strategy=FixedPollStrategy(30),
+    )
+    while not calls:
+        time.sleep(0.01)
+
+    assert scheduler.poll_now(future)
+    assert future.result(timeout=2) == 2
+    assert not scheduler.poll_now(future)
+    assert scheduler.pending() == 0
+
+
+def test_delayed_strategy_postpones_first_poll():
+    strategy = DelayedPollStrategy(FixedPollStrategy(2, jitter_fraction=0), 10)
+
+    assert strategy.first_delay() == 10
+    assert strategy.next_sleep(1, 10) == 2
+
+
+def _capability(scheduler, notifier):
+    service = MagicMock()
+    service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    service.start.return_value = {"extractionId": "ext_1"}
+    service.extracted_response_by_extraction_id.return_value = {
+        "file": {"status": "COMPLETED"}
+    }
+    uploader = MagicMock()
+    uploader.upload_file.return_value = "file_1"
+    capability = ExtractionCapability(
+        MagicMock(),
+        "agent_1",
+        uploader,
+        poll_scheduler=scheduler,
+        poll_strategy=FixedPollStrategy(0.01),
+        completion_notifier=notifier,
+    )
+    capability.service = service
+    return capability, service, uploader
+
+
+def test_callbacks_resolve_job_without_polling(scheduler, receiver):
+    capability, service, uploader = _capability(scheduler, receiver)
+
+    # a stand-in server calling back shortly after each step is accepted
+    def call_back_later(payload, value):
+        def respond(*args, **kwargs):
+            threading.Timer(0.05, post, (receiver.url, payload)).start()
+            return value
+
+        return respond
+
+    uploader.upload_file.side_effect = call_back_later({"fileId": "file_1"}, "file_1")
+    service.start.side_effect = call_back_later(
+        {"extractionId": "ext_1"}, {"extractionId": "ext_1"}
+    )
+
+    job = capability.submit_extraction(file_path="invoice.pdf")
+
+    assert job.result(timeout=5) == {"file": {"status": "COMPLETED"}}
+    assert service.processing_status.call_count == 1
+    assert service.extracted_response_by_extraction_id.call_count == 1
+
+
+def test_falls_back_to_polling_without_callbacks(scheduler):
+    notifier = CompletionNotifier(fallback_after=0.05)
+    capability, service, _ = _capability(scheduler, notifier)
+
+    job = capability.submit_extraction(file_path="invoice.pdf")
+
+    assert job.result(timeout=5) == {"file": {"status": "COMPLETED"}}
+    assert service.processing_status.call_count == 1
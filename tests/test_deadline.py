@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import patch
+
+from splore_sdk.core.deadline import Deadline, resolve_deadline
+from splore_sdk.core.exceptions import DeadlineExceededError
+
+
+def test_unbounded_deadline_never_expires():
+    deadline = Deadline()
+    assert deadline.remaining() is None
+    assert not deadline.expired()
+    assert deadline.clamp(30) == 30
+    assert deadline.clamp_timeout((10, 60)) == (10, 60)
+    deadline.check()
+
+
+def test_clamp_caps_to_remaining_time():
+    with patch("splore_sdk.core.deadline.time.monotonic", return_value=100.0):
+        deadline = Deadline(5)
+    with patch("splore_sdk.core.deadline.time.monotonic", return_value=102.0):
+        assert deadline.remaining() == 3.0
+        assert deadline.clamp(30) == 3.0
+        assert deadline.clamp(1) == 1
+        assert deadline.clamp(None) == 3.0
+        assert deadline.clamp_timeout((10, 60)) == (3.0, 3.0)
+
+
+def test_check_raises_once_expired():
+    with patch("splore_sdk.core.deadline.time.monotonic", return_value=100.0):
+        deadline = Deadline(5)
+    with patch("splore_sdk.core.deadline.time.monotonic", return_value=106.0):
+        assert deadline.expired()
+        with pytest.raises(DeadlineExceededError, match="file upload"):
+            deadline.check("file upload")
+
+
+def test_deadline_exceeded_is_a_timeout_error():
+    assert issubclass(DeadlineExceededError, TimeoutError)
+
+
+def test_negative_timeout_rejected():
+    with pytest.raises(ValueError):
+        Deadline(-1)
+
+
+def test_resolve_deadline():
+    deadline = Deadline(5)
+    assert resolve_deadline(deadline, None) is deadline
+    assert resolve_deadline(None, 30).timeout == 30
+    assert resolve_deadline(None, None).remaining() is None
+    with pytest.raises(ValueError):
+        resolve_deadline(deadline, 30)
@@ -0,0 +1,118 @@
+import hashlib
+import io
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.dedup_index import DedupIndex, content_sha256
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
+
+@pytest.fixture
+def index(tmp_path):
+    return DedupIndex(str(tmp_path / "dedup.db"))
+
+
+def test_index_is_keyed_by_hash_agent_and_base(index):
+    index.put("hash", "agent_1", "base_1", "file_1")
+
+    assert index.get("hash", "agent_1", "base_1") == "file_1"
+    assert index.get("hash", "agent_2", "base_1") is None
+    assert index.get("hash", "agent_1", "base_2") is None
+    index.remove("hash", "agent_1", "base_1")
+    assert index.get("hash", "agent_1", "base_1") is None
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    index = DedupIndex(str(tmp_path / "dedup.db"), ttl=60)
+    index.put("hash", "agent_1", "base_1", "file_1")
+
+    with patch("splore_sdk.utils.dedup_index.time.time", return_value=time.time() + 61):
+        assert index.get("hash", "agent_1", "base_1") is None
+    assert len(index) == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    index = DedupIndex(str(tmp_path / "dedup.db"), max_entries=2)
+    index.put("a", "agent_1", "base_1", "file_a")
+    time.sleep(0.01)
+    index.put("b", "agent_1", "base_1", "file_b")
+    time.sleep(0.01)
+    index.get("a", "agent_1", "base_1")
+    time.sleep(0.01)
+    index.put("c", "agent_1", "base_1", "file_c")
+
+    assert len(index) == 2
+    assert index.get("b", "agent_1", "base_1") is None
+    assert index.get("a", "agent_1", "base_1") == "file_a"
+
+
+def test_content_sha256_of_every_source(tmp_path):
+    payload = b"invoice" * 1000
+    digest = hashlib.sha256(payload).hexdigest()
+    path = tmp_path / "invoice.pdf"
+    path.write_bytes(payload)
+    stream = io.BytesIO(payload)
+    stream.read(10)
+
+    assert content_sha256(file_path=str(path)) == (digest, None)
+    assert content_sha256(file_stream=memoryview(payload)) == (digest, None)
+    assert content_sha256(file_stream=stream) == (digest, None)
+    assert stream.tell() == 0
+    unseekable_digest, spool = content_sha256(file_stream=_Unseekable(payload))
+    assert unseekable_digest == digest
+    assert spool.read() == payload
+    spool.close()
+
+
+@pytest.fixture
+def capability(index):
+    client = MagicMock(base_id="base_1")
+    capability = ExtractionCapability(client, "agent_1", MagicMock(), dedup_index=index)
+    capability.service = MagicMock()
+    capability.service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    capability.service.start.return_value = {"extractionId": "ext_1"}
+    capability.service.extracted_response_by_extraction_id.return_value = {
+        "file": {"status": "COMPLETED"}
+    }
+    capability.file_uploader.upload_file.return_value = "file_1"
+    yield capability
+    capability.close()
+
+
+def test_identical_content_is_uploaded_once(capability, index):
+    payload = b"same invoice"
+
+    capability.extract(file_stream=io.BytesIO(payload))
+    job = capability.submit_extraction(file_stream=payload)
+    job.result()
+
+    assert job.file_id == "file_1"
+    assert capability.file_uploader.upload_file.call_count == 1
+    digest = hashlib.sha256(payload).hexdigest()
+    assert index.get(digest, "agent_1", "base_1") == "file_1"
+
+
+def test_file_no_longer_indexed_is_uploaded_again(capability, index):
+    payload = b"same invoice"
+    index.put(hashlib.sha256(payload).hexdigest(), "agent_1", "base_1", "gone")
+    capability.service.processing_status.side_effect = lambda file_id, deadline=None: {
+        "fileProcessingStatus": "INDEXED" if file_id == "file_1" else "FAILED"
+    }
+
+    job = capability.submit_extraction(file_stream=payload)
+    job.result()
+
+    assert job.file_id == "file_1"
+    capability.file_uploader.upload_file.assert_called_once()
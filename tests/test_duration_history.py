@@ -0,0 +1,266 @@
+import io
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.core.exceptions import DeadlineExceededError
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.duration_history import DurationHistory, source_size
+from splore_sdk.utils.poll_scheduler import PollScheduler
+from splore_sdk.utils.poll_strategy import EtaPollStrategy, FixedPollStrategy
+
+FAST = FixedPollStrategy(0.01)
+
+
+@pytest.fixture
+def history(tmp_path):
+    return DurationHistory(str(tmp_path / "durations.db"), max_samples=5, min_samples=3)
+
+
+def test_estimate_needs_min_samples(history):
+    history.record("agent_1", DurationHistory.INDEXING, 1000, 10)
+    history.record("agent_1", DurationHistory.INDEXING, 1000, 30)
+    assert history.estimate("agent_1", DurationHistory.INDEXING, 1000) is None
+
+    history.record("agent_1", DurationHistory.INDEXING, 1000, 12)
+    assert history.estimate("agent_1", DurationHistory.INDEXING, 1000) == 12
+
+
+def test_estimate_is_per_agent_phase_and_size_bucket(history):
+    for seconds in (5, 6, 7):
+        history.record("agent_1", DurationHistory.EXTRACTION, 1000, seconds)
+
+    # 1000 and 1023 share a power of two bucket, 4096 does not
+    assert history.estimate("agent_1", DurationHistory.EXTRACTION, 1023) == 6
+    assert history.estimate("agent_1", DurationHistory.EXTRACTION, 4096) is None
+    assert history.estimate("agent_1", DurationHistory.INDEXING, 1000) is None
+    assert history.estimate("agent_2", DurationHistory.EXTRACTION, 1000) is None
+
+
+def test_only_recent_samples_are_kept(history):
+    for seconds in (100, 100, 100, 1, 1, 1, 1, 1):
+        history.record("agent_1", DurationHistory.INDEXING, 10, seconds)
+        time.sleep(0.001)
+
+    assert history.estimate("agent_1", DurationHistory.INDEXING, 10) == 1
+
+
+def test_history_survives_reopening(tmp_path):
+    path = str(tmp_path / "nested" / "durations.db")
+    first = DurationHistory(path, min_samples=1)
+    first.record("agent_1", DurationHistory.INDEXING, 10, 4)
+
+    assert DurationHistory(path, min_samples=1).estimate(
+        "agent_1", DurationHistory.INDEXING, 10
+    ) == 4
+
+
+def test_invalid_sample_counts(tmp_path):
+    with pytest.raises(ValueError):
+        DurationHistory(str(tmp_path / "d.db"), max_samples=2, min_samples=3)
+
+
+def test_source_size(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"x" * 42)
+    stream = io.BytesIO(b"abcdef")
+    stream.seek(2)
+    unseekable = MagicMock()
+    unseekable.seekable.return_value = False
+
+    assert source_size(file_path=str(path)) == 42
+    assert source_size(file_stream=b"abc") == 3
+    assert source_size(file_stream=stream) == 6
+    assert stream.tell() == 2
+    assert source_size(file_stream=unseekable) is None
+
+
+def test_eta_strategy_first_delay():
+    assert EtaPollStrategy(10).first_delay() == 0
+    assert EtaPollStrategy(10, first_poll_fraction=0.8).first_delay() == 8
+    with pytest.raises(ValueError):
+        EtaPollStrategy(10, first_poll_fraction=1.5)
+
+
+def test_scheduler_waits_first_delay():
+    scheduler = PollScheduler(max_workers=1)
+    strategy = FixedPollStrategy(0.01, jitter_fraction=0)
+    strategy.first_delay = lambda: 0.2
+    try:
+        started = time.monotonic()
+        future = scheduler.submit(lambda: True, max_timeout=5, strategy=strategy)
+        assert future.result(timeout=2) is True
+        assert time.monotonic() - started >= 0.2
+    finally:
+        scheduler.shutdown()
+
+
+def _capability(history, poll_strategy=None):
+    scheduler = PollScheduler(max_workers=1)
+    service = MagicMock()
+    service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    service.start.return_value = {"extractionId": "ext_1"}
+    service.extracted_response_by_extraction_id.return_value = {
+        "file": {"status": "COMPLETED"}
+    }
+    uploader = MagicMock()
+    uploader.upload_file.return_value = "file_1"
+    capability = ExtractionCapability(
+        MagicMock(),
+        "agent_1",
+        uploader,
+        poll_scheduler=scheduler,
+        poll_strategy=poll_strategy,
+        duration_history=history,
+    )
+    capability.service = service
+    strategies = []
+    original_submit = scheduler.submit
+
+    def recording_submit(poll, **kwargs):
+        strategies.append(kwargs["strategy"])
+        return original_submit(poll, **kwargs)
+
+    scheduler.submit = recording_submit
+    return capability, scheduler, strategies
+
+
+def test_capability_records_durations_and_polls_around_eta(history, tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"x" * 1000)
+    for seconds in (0.01, 0.02, 0.03):
+        history.record("agent_1", DurationHistory.EXTRACTION, 1000, seconds)
+    capability, scheduler, strategies = _capability(history)
+    try:
+        capability.extract(file_path=str(path))
+    finally:
+        scheduler.shutdown()
+
+    # no indexing durations yet: the default schedule; extraction is learned
+    assert strategies[0] is capability.poll_strategy
+    assert isinstance(strategies[1], EtaPollStrategy)
+    assert strategies[1].eta == 0.02
+    assert strategies[1].first_delay() == pytest.approx(0.016)
+    with history._connect() as connection:
+        counts = dict(
+            connection.execute(
+                "SELECT phase, COUNT(*) FROM durations GROUP BY phase"
+            ).fetchall()
+        )
+    assert counts == {DurationHistory.INDEXING: 1, DurationHistory.EXTRACTION: 4}
+
+
+def test_explicit_strategy_wins_over_history(history):
+    for seconds in (1, 1, 1):
+        history.record("agent_1", DurationHistory.INDEXING, 3, seconds)
+    explicit = FixedPollStrategy(0.01)
+    capability, scheduler, strategies = _capability(history)
+    try:
+        capability.extract(file_stream=b"abc", poll_strategy=explicit)
+    finally:
+        scheduler.shutdown()
+
+    assert strategies == [explicit, explicit]
+
+
+def test_job_reports_phase_durations(history):
+    capability, scheduler, _ = _capability(history)
+    try:
+        job = capability.submit_extraction(file_stream=b"abc", timeout=60)
+        job.result(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+    assert list(job.phase_durations) == ["upload", "indexing", "start", "extraction"]
+    assert all(seconds >= 0 for seconds in job.phase_durations.values())
+
+
+def test_indexing_poll_leaves_learned_extraction_time(history):
+    for seconds in (20, 20, 20):
+        history.record("agent_1", DurationHistory.EXTRACTION, 3, seconds)
+    capability, scheduler, _ = _capability(history)
+    timeouts = []
+    recording_submit = scheduler.submit
+
+    def submit(poll, **kwargs):
+        timeouts.append(kwargs["max_timeout"])
+        return recording_submit(poll, **kwargs)
+
+    scheduler.submit = submit
+    try:
+        capability.extract(file_stream=b"abc", timeout=100, poll_strategy=FAST)
+    finally:
+        scheduler.shutdown()
+
+    assert 79 < timeouts[0] <= 80
+    assert 99 < timeouts[1] <= 100
+
+
+def test_indexing_poll_leaves_extraction_time_without_history():
+    capability, scheduler, _ = _capability(None)
+    timeouts = []
+    recording_submit = scheduler.submit
+
+    def submit(poll, **kwargs):
+        timeouts.append(kwargs["max_timeout"])
+        return recording_submit(poll, **kwargs)
+
+    scheduler.submit = submit
+    try:
+        capability.extract(file_stream=b"abc", timeout=100, poll_strategy=FAST)
+    finally:
+        scheduler.shutdown()
+
+    assert 49 < timeouts[0] <= 50
+    assert 99 < timeouts[1] <= 100
+
+
+def test_retry_extraction_takes_a_timeout():
+    capability, scheduler, _ = _capability(None)
+    capability.service.start_extraction_by_extraction_id.return_value = {"version": 2}
+    try:
+        capability.retry_extraction("ext_1", timeout=30, poll_strategy=FAST)
+    finally:
+        scheduler.shutdown()
+
+    call = capability.service.start_extraction_by_extraction_id.call_args
+    assert call.kwargs["deadline"].timeout == 30
+    with pytest.raises(ValueError):
+        capability.retry_extraction("ext_1", deadline=Deadline(30), timeout=30)
+
+
+def test_job_is_dropped_when_learned_durations_exceed_budget(history):
+    for seconds in (30, 30, 30):
+        history.record("agent_1", DurationHistory.EXTRACTION, 3, seconds)
+    capability, scheduler, _ = _capability(history)
+    try:
+        with pytest.raises(DeadlineExceededError, match="dropping the extraction"):
+            capability.extract(file_stream=b"abc", timeout=10, poll_strategy=FAST)
+    finally:
+        scheduler.shutdown()
+
+    capability.service.processing_status.assert_not_called()
+    capability.service.start.assert_not_called()
+
+
+def test_extraction_is_not_started_without_time_for_it(history):
+    for seconds in (5, 5, 5):
+        history.record("agent_1", DurationHistory.EXTRACTION, 3, seconds)
+    capability, scheduler, _ = _capability(history)
+    deadline = Deadline(6)
+    capability.service.processing_status.side_effect = lambda **kwargs: (
+        setattr(deadline, "expires_at", time.monotonic() + 2)
+        or {"fileProcessingStatus": "INDEXED"}
+    )
+    try:
+        job = capability.submit_extraction(
+            file_stream=b"abc", deadline=deadline, poll_strategy=FAST
+        )
+        with pytest.raises(DeadlineExceededError):
+            job.result(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+    capability.service.start.assert_not_called()
+    assert list(job.phase_durations) == ["upload", "indexing"]
@@ -0,0 +1,139 @@
+import threading
+import time
+import pytest
+from concurrent.futures import CancelledError, wait
+from unittest.mock import MagicMock
+
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.core.exceptions import CancelledError as SDKCancelledError
+from splore_sdk.extractions.job import ExtractionJob, ExtractionState
+from splore_sdk.sdk import ExtractionCapability
+
+
+@pytest.fixture
+def capability():
+    service = MagicMock()
+    service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    service.start.return_value = {"extractionId": "ext_1"}
+    service.extracted_response_by_extraction_id.return_value = {
+        "file": {"status": "COMPLETED"}
+    }
+    uploader = MagicMock()
+    uploader.upload_file.return_value = "file_1"
+    capability = ExtractionCapability(MagicMock(), "agent_1", uploader)
+    capability.service = service
+    yield capability
+    capability.close()
+
+
+def _wait_for(predicate, timeout=5):
+    end = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < end, "condition not reached"
+        time.sleep(0.01)
+
+
+def test_submit_extraction_returns_before_upload_finishes(capability):
+    release = threading.Event()
+
+    def upload(**kwargs):
+        release.wait(5)
+        return "file_1"
+
+    capability.file_uploader.upload_file.side_effect = upload
+    finished = []
+
+    job = capability.submit_extraction(file_path="invoice.pdf")
+    job.add_done_callback(finished.append)
+
+    assert not job.done()
+    _wait_for(lambda: job.state == ExtractionState.UPLOADING)
+    release.set()
+
+    assert job.result(timeout=5) == {"file": {"status": "COMPLETED"}}
+    assert job.state == ExtractionState.COMPLETED
+    assert (job.file_id, job.extraction_id) == ("file_1", "ext_1")
+    assert finished == [job]
+    assert wait([job.future], timeout=0).done == {job.future}
+
+
+def test_extract_blocks_on_the_job(capability):
+    assert capability.extract(file_path="invoice.pdf") == {
+        "file": {"status": "COMPLETED"}
+    }
+    capability.service.start.assert_called_once()
+
+
+def test_job_fails_when_extraction_cannot_start(capability):
+    capability.service.start.return_value = None
+
+    job = capability.submit_extraction(file_path="invoice.pdf")
+
+    with pytest.raises(Exception, match="Extraction Failed"):
+        job.result(timeout=5)
+    assert job.state == ExtractionState.FAILED
+    assert job.file_id == "file_1" and job.extraction_id is None
+
+
+def test_cancel_while_indexing_stops_the_job(capability):
+    capability.service.processing_status.return_value = {
+        "fileProcessingStatus": "PROCESSING"
+    }
+
+    job = capability.submit_extraction(file_path="invoice.pdf")
+    _wait_for(lambda: job.state == ExtractionState.INDEXING)
+
+    assert job.cancel()
+    assert job.cancelled() and job.state == ExtractionState.CANCELLED
+    with pytest.raises(CancelledError):
+        job.result(timeout=1)
+    assert not job.cancel()
+    capability.service.start.assert_not_called()
+
+
+def test_submit_extraction_requires_input(capability):
+    with pytest.raises(ValueError):
+        capability.submit_extraction()
+
+
+def test_job_repr():
+    job = ExtractionJob(file_id="file_1")
+    assert repr(job) == "ExtractionJob(state=PENDING, file_id=file_1, extraction_id=None)"
+
+
+def test_close_fails_unfinished_jobs(capability):
+    capability.service.processing_status.return_value = {
+        "fileProcessingStatus": "PROCESSING"
+    }
+
+    job = capability.submit_extraction(file_path="invoice.pdf")
+    _wait_for(lambda: job.state == ExtractionState.INDEXING)
+    capability.close()
+
+    with pytest.raises(SDKCancelledError) as excinfo:
+        job.result(timeout=1)
+    assert excinfo.value.file_id == "file_1"
+    assert job.state == ExtractionState.CANCELLED
+    capability.service.start.assert_not_called()
+
+
+def test_stage_scheduled_after_close_fails_the_job(capability):
+    executor = MagicMock()
+    executor.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+
+    job = capability._submit("invoice.pdf", None, 1200, Deadline(), executor)
+
+    with pytest.raises(RuntimeError, match="after shutdown"):
+        job.result(timeout=1)
+    assert job.state == ExtractionState.FAILED
+
+
+def test_failing_an_aborted_job_keeps_the_abort():
+    job = ExtractionJob(file_id="file_1")
+    assert job._abort(SDKCancelledError("Extraction cancelled"))
+
+    job._set_exception(RuntimeError("late stage failure"))
+
+    with pytest.raises(SDKCancelledError):
+        job.result(timeout=1)
+    assert job.state == ExtractionState.CANCELLED
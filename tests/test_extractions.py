@@ -1,7 +1,7 @@
 from typing import Optional
 from io import StringIO
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 from splore_sdk.extractions.extractions_service import ExtractionService
 from splore_sdk.extractions.validations import StartExtractionInput
 from splore_sdk.core.compat import model_dump_or_dict
@@ -37,7 +37,11 @@ def test_start_extraction(extraction_service, mock_api_client):
         StartExtractionInput(agent_id="test_agent", file_id=file_id)
     )
     mock_api_client.request.assert_called_once_with(
-        method="POST", endpoint="api/rest/v2/extractions/start", json=payload
+        method="POST",
+        endpoint="api/rest/v2/extractions/start",
+        json=payload,
+        deadline=None,
+        idempotency_key=ANY,
     )
 
 
@@ -50,6 +54,7 @@ def test_processing_status(extraction_service, mock_api_client):
         method="GET",
         endpoint="api/rest/v2/extractions/status",
         params={"agentId": "test_agent", "fileId": file_id},
+        deadline=None,
     )
 
 
@@ -74,3 +79,25 @@ def test_all_extracted_response(extraction_service, mock_api_client):
         endpoint="api/rest/v2/extractions",
         params={"page": 0, "size": 10, "compact": True},
     )
+
+
+def test_start_extraction_sends_idempotency_key(extraction_service, mock_api_client):
+    extraction_service.start("12345", idempotency_key="key-1")
+    assert mock_api_client.request.call_args.kwargs["idempotency_key"] == "key-1"
+
+    extraction_service.start("12345")
+    generated_key = mock_api_client.request.call_args.kwargs["idempotency_key"]
+    assert generated_key and generated_key != "key-1"
+
+
+def test_start_extraction_by_extraction_id(extraction_service, mock_api_client):
+    mock_api_client.request.return_value = {"version": 2}
+    response = extraction_service.start_extraction_by_extraction_id("ext_1")
+    assert response == {"version": 2}
+    mock_api_client.request.assert_called_once_with(
+        method="POST",
+        endpoint="api/rest/v2/extractions/ext_1",
+        json={},
+        deadline=None,
+        idempotency_key=ANY,
+    )
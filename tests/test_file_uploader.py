@@ -1,12 +1,27 @@
+import asyncio
 import os
 import time
 import mimetypes
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
+from tusclient.client import TusClient
+from tusclient.exceptions import TusUploadFailed
 
-from splore_sdk.utils.file_uploader import FileUploader, ProgressUploader
+from splore_sdk.core.constants import DEFAULT_TIMEOUT
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.core.exceptions import DeadlineExceededError
+from splore_sdk.utils.file_uploader import (
+    BufferStream,
+    FileUploader,
+    ProgressUploader,
+    _ReadOnlyStream,
+)
+from splore_sdk.utils.upload_storage import SQLiteURLStorage
 
 
 def test_upload_file_raises_error_no_input():
@@ -56,24 +71,217 @@ def test_upload_file_with_file_stream_success(tmp_path):
         api_key="dummy_key", base_id="dummy_base", user_id="dummy_user"
     )
 
-    # Patch _write_stream_to_tmp to prevent actual file I/O.
-    with patch.object(
-        uploader, "_write_stream_to_tmp", return_value=None
-    ) as mock_write:
-        # Patch ProgressUploader to simulate the upload process.
-        with patch(
-            "splore_sdk.utils.file_uploader.ProgressUploader"
-        ) as MockProgressUploader:
-            mock_uploader = MagicMock()
-            # Set a dummy URL that will be used to extract the file ID.
-            mock_uploader.url = "https://dummy.upload.com/file_789+extra"
-            MockProgressUploader.return_value = mock_uploader
-
-            file_id = uploader.upload_file(file_stream=fake_stream)
-            assert file_id == "file_789"
-            # Ensure that the stream-to-temp writing was called.
-            mock_write.assert_called_once()
-            assert uploader._get_temp_files() == []
+    # Patch ProgressUploader to simulate the upload process.
+    with patch(
+        "splore_sdk.utils.file_uploader.ProgressUploader"
+    ) as MockProgressUploader:
+        mock_uploader = MagicMock()
+        # Set a dummy URL that will be used to extract the file ID.
+        mock_uploader.url = "https://dummy.upload.com/file_789+extra"
+        MockProgressUploader.return_value = mock_uploader
+
+        file_id = uploader.upload_file(file_stream=fake_stream)
+        assert file_id == "file_789"
+        # Seekable streams are handed to tus as they are, without a temp file.
+        kwargs = MockProgressUploader.call_args.kwargs
+        assert kwargs["file_stream"] is fake_stream
+        assert "file_path" not in kwargs
+        assert uploader._get_temp_files() == []
+        assert not fake_stream.closed
+
+
+def test_upload_stream_wraps_buffers_without_copying():
+    uploader = FileUploader(api_key="dummy_key", base_id="dummy_base")
+    payload = bytearray(b"0123456789")
+
+    stream, owned = uploader._upload_stream(memoryview(payload))
+
+    assert isinstance(stream, BufferStream) and owned
+    assert stream.seek(0, os.SEEK_END) == 10
+    stream.seek(4)
+    assert stream.read(3) == b"456"
+    # the stream is a view: changes to the buffer are visible, nothing was copied
+    payload[7] = ord("x")
+    assert stream.read() == b"x89"
+    assert stream.read(5) == b""
+
+
+def test_upload_stream_spools_non_seekable_streams():
+    uploader = FileUploader(api_key="dummy_key", base_id="dummy_base")
+
+    class Pipe(BytesIO):
+        def seekable(self):
+            return False
+
+    stream, owned = uploader._upload_stream(Pipe(b"piped content"))
+
+    assert owned and stream.seekable()
+    assert stream.read() == b"piped content"
+
+
+def test_read_only_streams_must_implement_size_and_read():
+    class Sized(_ReadOnlyStream):
+        def size(self):
+            return 0
+
+    with pytest.raises(TypeError, match="_read"):
+        Sized()
+
+
+def test_generate_default_metadata_for_nameless_stream():
+    uploader = FileUploader(api_key="dummy_key", base_id="dummy_base")
+    metadata = uploader.generate_default_metadata(file_stream=BufferStream(b"x"))
+    assert metadata["filename"].endswith("_file")
+
+
+class _TusHandler(BaseHTTPRequestHandler):
+    """Minimal tus server with the creation and concatenation extensions."""
+
+    protocol_version = "HTTP/1.1"
+    uploads = {}
+    finals = {}
+    extensions = "creation,concatenation"
+    fail_at = None
+    patch_delay = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Tus-Extension", self.extensions)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        with self.lock:
+            upload_id = f"file_{len(self.uploads) + len(self.finals) + 1}"
+            concat = self.headers.get("Upload-Concat", "")
+            if concat.startswith("final;"):
+                parts = [url.rsplit("/", 1)[-1] for url in concat[6:].split()]
+                self.finals[upload_id] = (
+                    b"".join(bytes(self.uploads[part]) for part in parts),
+                    self.headers.get("Upload-Metadata"),
+                )
+            else:
+                self.uploads[upload_id] = bytearray()
+        self.send_response(201)
+        self.send_header("Location", f"/files/{upload_id}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        upload = self.uploads.get(self.path.rsplit("/", 1)[-1])
+        self.send_response(404 if upload is None else 200)
+        if upload is not None:
+            self.send_header("Upload-Offset", str(len(upload)))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_PATCH(self):
+        upload_id = self.path.rsplit("/", 1)[-1]
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.patch_delay)
+        if self.fail_at is not None and int(self.headers["Upload-Offset"]) >= self.fail_at:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        with self.lock:
+            upload = self.uploads[upload_id]
+            assert int(self.headers["Upload-Offset"]) == len(upload)
+            upload.extend(body)
+            offset = len(upload)
+        self.send_response(204)
+        self.send_header("Upload-Offset", str(offset))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def tus_server():
+    _TusHandler.uploads, _TusHandler.finals = {}, {}
+    _TusHandler.extensions = "creation,concatenation"
+    _TusHandler.fail_at = None
+    _TusHandler.patch_delay = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TusHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/files"
+    server.shutdown()
+
+
+def _tus_uploader(url, **kwargs):
+    uploader = FileUploader(api_key="dummy_key", base_id="dummy_base", **kwargs)
+    uploader.tus_client = TusClient(url)
+    return uploader
+
+
+def test_upload_bytes_to_tus_server(tus_server):
+    uploader = _tus_uploader(tus_server)
+    payload = os.urandom(1024)
+    with patch("builtins.print"):
+        file_id = uploader.upload_file(
+            file_stream=payload, metadata={"filename": "scan.pdf"}
+        )
+
+    assert bytes(_TusHandler.uploads[file_id]) == payload
+
+
+def test_parallel_upload_concatenates_partial_uploads(tus_server, tmp_path):
+    payload = os.urandom(5500)
+    test_file = tmp_path / "scan.pdf"
+    test_file.write_bytes(payload)
+    uploader = _tus_uploader(tus_server, parallel_uploads=3, chunk_size=1000)
+
+    file_id = uploader.upload_file(file_path=str(test_file))
+
+    data, metadata = _TusHandler.finals[file_id]
+    assert data == payload
+    assert len(_TusHandler.uploads) == 3
+    assert "filename" in metadata
+    stats = uploader.last_upload_stats
+    assert stats.parts == 3 and stats.bytes_uploaded == 5500
+
+
+def test_parallel_upload_falls_back_without_concatenation(tus_server):
+    _TusHandler.extensions = "creation"
+    uploader = _tus_uploader(tus_server, chunk_size=1000)
+    payload = os.urandom(3000)
+
+    with patch("builtins.print"):
+        file_id = uploader.upload_file(file_stream=payload, parallel_uploads=3)
+
+    assert bytes(_TusHandler.uploads[file_id]) == payload
+    assert _TusHandler.finals == {}
+
+
+def test_adaptive_chunk_size_records_stats_and_learns_size(tus_server):
+    uploader = _tus_uploader(
+        tus_server,
+        chunk_size=1000,
+        adaptive_chunk_size=True,
+        min_chunk_size=1000,
+        max_chunk_size=8000,
+    )
+    payload = os.urandom(20000)
+
+    with patch("builtins.print"):
+        file_id = uploader.upload_file(file_stream=payload)
+
+    assert bytes(_TusHandler.uploads[file_id]) == payload
+    stats = uploader.last_upload_stats
+    assert stats.total_bytes == stats.bytes_uploaded == 20000
+    assert sum(stats.chunk_sizes) == 20000
+    # a local server answers far below the target duration, so chunks grow
+    assert stats.chunk_sizes[0] == 1000 and max(stats.chunk_sizes) == 8000
+    assert uploader.chunk_size == 8000
+
+
+def test_parallel_uploads_must_be_positive():
+    with pytest.raises(ValueError):
+        FileUploader(api_key="dummy_key", base_id="dummy_base", parallel_uploads=0)
 
 
 def test_generate_default_metadata_with_file_path(tmp_path):
@@ -122,3 +330,163 @@ def test_cleanup_temp_files(tmp_path):
     # After cleanup, the file should be removed and temp_files list cleared.
     assert not os.path.exists(temp_file_path)
     assert uploader._get_temp_files() == []
+
+
+def test_interrupted_upload_resumes_from_stored_offset(tus_server, tmp_path):
+    payload = os.urandom(5000)
+    test_file = tmp_path / "scan.pdf"
+    test_file.write_bytes(payload)
+    db_path = str(tmp_path / "uploads.db")
+    _TusHandler.fail_at = 2000
+
+    with patch("builtins.print"), pytest.raises(TusUploadFailed):
+        _tus_uploader(
+            tus_server, chunk_size=1000, url_storage=SQLiteURLStorage(db_path)
+        ).upload_file(file_path=str(test_file))
+
+    # a new process: fresh uploader, same storage file
+    _TusHandler.fail_at = None
+    storage = SQLiteURLStorage(db_path)
+    uploader = _tus_uploader(tus_server, chunk_size=1000, url_storage=storage)
+    with patch("builtins.print"):
+        file_id = uploader.upload_file(file_path=str(test_file))
+
+    assert list(_TusHandler.uploads) == [file_id]
+    assert bytes(_TusHandler.uploads[file_id]) == payload
+    assert uploader.last_upload_stats.bytes_uploaded == 3000
+    with open(test_file, "rb") as stream:
+        assert storage.get_item(uploader.fingerprinter.get_fingerprint(stream)) is None
+
+
+def test_resumable_stream_upload_restarts_when_stored_url_is_gone(tus_server, tmp_path):
+    payload = os.urandom(3000)
+    storage = SQLiteURLStorage(str(tmp_path / "uploads.db"))
+    uploader = _tus_uploader(tus_server, chunk_size=1000, url_storage=storage)
+    stream = BytesIO(payload)
+    storage.set_item(
+        uploader.fingerprinter.get_fingerprint(stream), tus_server + "/expired"
+    )
+
+    with patch("builtins.print"):
+        file_id = uploader.upload_file(file_stream=stream)
+
+    assert bytes(_TusHandler.uploads[file_id]) == payload
+    assert not stream.closed
+
+
+def test_async_upload_to_tus_server(tus_server):
+    payload = os.urandom(1024)
+    file_id = asyncio.run(
+        _tus_uploader(tus_server).upload_file_async(
+            file_stream=payload, metadata={"filename": "scan.pdf"}
+        )
+    )
+
+    assert bytes(_TusHandler.uploads[file_id]) == payload
+
+
+def test_async_upload_stops_at_the_deadline(tus_server):
+    _TusHandler.patch_delay = 2
+    started_at = time.monotonic()
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(
+            _tus_uploader(tus_server).upload_file_async(
+                file_stream=os.urandom(1024),
+                metadata={"filename": "scan.pdf"},
+                deadline=Deadline(0.3),
+            )
+        )
+    assert time.monotonic() - started_at < 1.5
+
+
+def test_upload_request_times_out_at_the_deadline(tus_server):
+    _TusHandler.patch_delay = 2
+    started_at = time.monotonic()
+
+    with patch("builtins.print"), pytest.raises(DeadlineExceededError):
+        _tus_uploader(tus_server).upload_file(
+            file_stream=os.urandom(1024),
+            metadata={"filename": "scan.pdf"},
+            deadline=Deadline(0.3),
+        )
+    assert time.monotonic() - started_at < 1.5
+
+
+def test_upload_requests_have_default_timeouts(tus_server):
+    with patch("builtins.print"), patch(
+        "splore_sdk.utils.file_uploader.requests.patch", wraps=requests.patch
+    ) as patch_request:
+        _tus_uploader(tus_server).upload_file(
+            file_stream=os.urandom(1024), metadata={"filename": "scan.pdf"}
+        )
+
+    assert patch_request.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+
+def test_resumable_upload_fingerprints_the_content_once(tus_server, tmp_path):
+    payload = os.urandom(3000)
+    storage = SQLiteURLStorage(str(tmp_path / "uploads.db"))
+    uploader = _tus_uploader(tus_server, chunk_size=1000, url_storage=storage)
+
+    with patch("builtins.print"), patch.object(
+        uploader.fingerprinter,
+        "get_fingerprint",
+        wraps=uploader.fingerprinter.get_fingerprint,
+    ) as get_fingerprint:
+        file_id = uploader.upload_file(file_stream=payload)
+
+    assert bytes(_TusHandler.uploads[file_id]) == payload
+    assert get_fingerprint.call_count == 1
+
+
+def test_async_upload_stores_its_url_off_the_loop(tus_server, tmp_path):
+    payload = os.urandom(3000)
+    storage = SQLiteURLStorage(str(tmp_path / "uploads.db"))
+    uploader = _tus_uploader(tus_server, chunk_size=1000, url_storage=storage)
+    storage_threads = []
+
+    def record_thread(*args):
+        storage_threads.append(threading.current_thread())
+
+    with patch.object(storage, "set_item", side_effect=record_thread), patch.object(
+        storage, "remove_item", side_effect=record_thread
+    ):
+        file_id = asyncio.run(
+            uploader.upload_file_async(
+                file_stream=payload, metadata={"filename": "scan.pdf"}
+            )
+        )
+
+    assert bytes(_TusHandler.uploads[file_id]) == payload
+    assert storage_threads
+    assert threading.main_thread() not in storage_threads
+
+
+def test_concatenation_requests_are_clamped_to_the_deadline(tus_server):
+    uploader = _tus_uploader(tus_server, chunk_size=1000)
+
+    with patch(
+        "splore_sdk.utils.file_uploader.requests.options", wraps=requests.options
+    ) as options_request, patch(
+        "splore_sdk.utils.file_uploader.requests.post", wraps=requests.post
+    ) as post_request:
+        uploader.upload_file(
+            file_stream=os.urandom(3000),
+            metadata={"filename": "scan.pdf"},
+            parallel_uploads=3,
+            deadline=Deadline(5),
+        )
+
+    concatenation = post_request.call_args_list[-1]
+    assert "final;" in concatenation.kwargs["headers"]["upload-concat"]
+    for call in (options_request.call_args, concatenation):
+        assert all(part <= 5 for part in call.kwargs["timeout"])
+
+
+def test_concatenation_check_stops_at_the_deadline(tus_server):
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+
+    with pytest.raises(DeadlineExceededError):
+        _tus_uploader(tus_server).supports_concatenation(deadline)
@@ -0,0 +1,144 @@
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from splore_sdk.extractions.job import ExtractionState
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.job_journal import JobJournal
+from splore_sdk.utils.poll_scheduler import PollScheduler
+from splore_sdk.utils.poll_strategy import FixedPollStrategy
+
+COMPLETED = {"file": {"status": "COMPLETED"}}
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return JobJournal(str(tmp_path / "jobs" / "journal.db"))
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = PollScheduler(max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def make_capability(scheduler, journal):
+    service = MagicMock()
+    service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    service.start.return_value = {"extractionId": "ext_new"}
+    service.extracted_response_by_extraction_id.return_value = COMPLETED
+    uploader = MagicMock()
+    uploader.upload_file.return_value = "file_new"
+    client = MagicMock(base_id="base_1")
+    capability = ExtractionCapability(
+        client,
+        "agent_1",
+        uploader,
+        poll_scheduler=scheduler,
+        poll_strategy=FixedPollStrategy(0.01),
+        job_journal=journal,
+    )
+    capability.service = service
+    return capability
+
+
+def final_entry(journal, job_id):
+    # the final state is recorded by a done callback, right after the result
+    deadline = time.monotonic() + 5
+    while not journal.get(job_id).finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return journal.get(job_id)
+
+
+def test_journal_records_transitions(journal):
+    job_id = journal.add("agent_1", "base_1", "doc.pdf")
+    journal.update(job_id, "INDEXING", file_id="file_1")
+    journal.update(job_id, "EXTRACTING", extraction_id="ext_1", version=2)
+
+    entry = journal.get(job_id)
+    assert entry.state == "EXTRACTING"
+    assert (entry.file_id, entry.extraction_id, entry.version) == ("file_1", "ext_1", 2)
+    assert entry.file_path.endswith("doc.pdf") and entry.file_path.startswith("/")
+    assert not entry.finished
+    with pytest.raises(ValueError):
+        journal.update(job_id, "FAILED", reason="boom")
+
+
+def test_entries_filter_unfinished_and_prune(journal):
+    done = journal.add("agent_1", "base_1", "a.pdf")
+    journal.update(done, "COMPLETED")
+    running = journal.add("agent_1", "base_1", "b.pdf")
+    journal.add("agent_2", "base_1", "c.pdf")
+
+    assert [e.job_id for e in journal.entries("agent_1", "base_1")] == [done, running]
+    assert [e.job_id for e in journal.entries("agent_1", "base_1", unfinished=True)] == [running]
+
+    journal.prune()
+    assert journal.get(done) is None
+    assert journal.get(running) is not None
+
+
+def test_extract_journals_the_job(scheduler, journal):
+    capability = make_capability(scheduler, journal)
+
+    job = capability.submit_extraction(file_path="doc.pdf")
+    assert job.result(timeout=5) == COMPLETED
+
+    entry = final_entry(journal, job.journal_id)
+    assert entry.state == ExtractionState.COMPLETED
+    assert (entry.file_id, entry.extraction_id) == ("file_new", "ext_new")
+    assert entry.error is None
+
+
+def test_failed_job_keeps_its_error(scheduler, journal):
+    capability = make_capability(scheduler, journal)
+    capability.service.start.side_effect = RuntimeError("start refused")
+
+    job = capability.submit_extraction(file_path="doc.pdf")
+    with pytest.raises(RuntimeError):
+        job.result(timeout=5)
+
+    entry = final_entry(journal, job.journal_id)
+    assert entry.state == ExtractionState.FAILED
+    assert entry.file_id == "file_new"
+    assert entry.error == "start refused"
+
+
+def test_resume_continues_from_the_recorded_stage(scheduler, journal):
+    extracting = journal.add("agent_1", "base_1", "a.pdf")
+    journal.update(extracting, "EXTRACTING", file_id="file_a", extraction_id="ext_a", version=3)
+    indexing = journal.add("agent_1", "base_1", "b.pdf")
+    journal.update(indexing, "INDEXING", file_id="file_b")
+    uploading = journal.add("agent_1", "base_1", "c.pdf")
+    journal.update(uploading, "UPLOADING")
+    stream = journal.add("agent_1", "base_1")
+    finished = journal.add("agent_1", "base_1", "d.pdf")
+    journal.update(finished, "COMPLETED")
+    capability = make_capability(scheduler, journal)
+
+    jobs = capability.resume()
+
+    assert [job.journal_id for job in jobs] == [extracting, indexing, uploading]
+    assert all(job.result(timeout=5) == COMPLETED for job in jobs)
+    service = capability.service
+    # only the file that never finished uploading is uploaded again
+    capability.file_uploader.upload_file.assert_called_once()
+    assert capability.file_uploader.upload_file.call_args[1]["file_path"].endswith("c.pdf")
+    started = sorted(call[1]["file_id"] for call in service.start.call_args_list)
+    assert started == ["file_b", "file_new"]
+    polled = {
+        (call[1]["extraction_id"], call[1]["version"])
+        for call in service.extracted_response_by_extraction_id.call_args_list
+    }
+    assert ("ext_a", 3) in polled
+    assert journal.get(stream).state == ExtractionState.FAILED
+    for job in jobs:
+        final_entry(journal, job.journal_id)
+    assert journal.entries("agent_1", "base_1", unfinished=True) == []
+
+
+def test_resume_needs_a_journal(scheduler):
+    capability = make_capability(scheduler, None)
+    with pytest.raises(ValueError):
+        capability.resume()
@@ -0,0 +1,173 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from splore_sdk.core.api_client import APIClient
+from splore_sdk.core.cancellation import CancellationToken
+from splore_sdk.core.exceptions import CancelledError
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.dedup_index import DedupIndex, content_sha256
+from splore_sdk.utils.poll_scheduler import PollScheduler
+from splore_sdk.utils.poll_strategy import FixedPollStrategy
+from splore_sdk.utils.result_cache import MemoryResultCache, cache_key
+
+FAST = FixedPollStrategy(0.01)
+
+
+class FakeAPI:
+    """Answers the extraction endpoints, recording the agent of every request."""
+
+    def __init__(self):
+        self.calls = []
+        self.failing_agent = None
+        self.indexed = True
+        self.lock = threading.Lock()
+
+    def request(self, client, method, endpoint, **kwargs):
+        with self.lock:
+            self.calls.append((client.agent_id, endpoint))
+        if endpoint.endswith("/status"):
+            return {"fileProcessingStatus": "INDEXED" if self.indexed else "PROCESSING"}
+        if endpoint.endswith("/start"):
+            agent_id = kwargs["json"]["agent_id"]
+            if agent_id == self.failing_agent:
+                raise RuntimeError(f"{agent_id} failed")
+            return {"extractionId": f"ext_{agent_id}"}
+        return {"file": {"status": "COMPLETED"}, "extraction": endpoint.rsplit("/", 1)[-1]}
+
+    def agents(self, suffix):
+        return [agent for agent, endpoint in self.calls if endpoint.endswith(suffix)]
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = PollScheduler(max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def api():
+    api = FakeAPI()
+    with patch.object(
+        APIClient, "request", lambda client, *args, **kwargs: api.request(client, *args, **kwargs)
+    ):
+        yield api
+
+
+def make_capability(scheduler, **options):
+    uploader = MagicMock()
+    uploader.upload_file.return_value = "file_1"
+    return ExtractionCapability(
+        APIClient(api_key="key", base_id="base_1"),
+        "header",
+        uploader,
+        poll_scheduler=scheduler,
+        poll_strategy=FAST,
+        **options,
+    )
+
+
+def test_uploads_and_indexes_once_for_all_agents(api, scheduler):
+    capability = make_capability(scheduler)
+    results = capability.extract_with_agents(
+        ["header", "line_items", "compliance"], file_path="invoice.pdf"
+    )
+
+    capability.file_uploader.upload_file.assert_called_once()
+    assert api.agents("/status") == ["header"]
+    assert sorted(api.agents("/start")) == ["compliance", "header", "line_items"]
+    assert {agent: result.result["extraction"] for agent, result in results.items()} == {
+        "header": "ext_header",
+        "line_items": "ext_line_items",
+        "compliance": "ext_compliance",
+    }
+    # the SDK's own agent is untouched by the other agents' requests
+    assert capability.client.agent_id == "header"
+
+
+def test_failing_agent_does_not_fail_the_others(api, scheduler):
+    api.failing_agent = "line_items"
+    capability = make_capability(scheduler)
+    results = capability.extract_with_agents(["header", "line_items"], file_path="a.pdf")
+
+    assert results["header"].ok
+    assert isinstance(results["line_items"].error, RuntimeError)
+
+
+def test_failed_upload_fails_every_agent(api, scheduler):
+    capability = make_capability(scheduler)
+    capability.file_uploader.upload_file.side_effect = IOError("upload failed")
+    results = capability.extract_with_agents(["header", "line_items"], file_path="a.pdf")
+
+    assert all(isinstance(result.error, IOError) for result in results.values())
+    assert api.agents("/start") == []
+
+
+def test_jobs_record_the_shared_file(api, scheduler):
+    capability = make_capability(scheduler)
+    jobs = capability.submit_to_agents(["header", "compliance"], file_stream=b"pdf")
+    for job in jobs.values():
+        job.result(timeout=5)
+
+    assert {job.file_id for job in jobs.values()} == {"file_1"}
+    assert all(
+        list(job.phase_durations) == ["indexing", "start", "extraction"]
+        for job in jobs.values()
+    )
+
+
+def test_reuses_deduplicated_upload(api, scheduler, tmp_path):
+    dedup_index = DedupIndex(str(tmp_path / "dedup.db"))
+    capability = make_capability(scheduler, dedup_index=dedup_index)
+    capability.extract_with_agents(["header", "compliance"], file_stream=b"pdf")
+    capability.extract_with_agents(["header", "compliance"], file_stream=b"pdf")
+
+    capability.file_uploader.upload_file.assert_called_once()
+
+
+def test_results_are_cached_by_content(api, scheduler):
+    cache = MemoryResultCache()
+    capability = make_capability(scheduler, result_cache=cache)
+    capability.extract_with_agents(["header", "compliance"], file_stream=b"pdf")
+
+    content_hash, _ = content_sha256(file_stream=b"pdf")
+    for agent_id in ("header", "compliance"):
+        assert cache.get(cache_key("content", agent_id, content_hash)) is not None
+    assert cache.get(cache_key("content", "header", None)) is None
+
+
+def test_cancelling_stops_the_shared_indexing_poll(api, scheduler):
+    api.indexed = False
+    capability = make_capability(scheduler)
+    token = CancellationToken()
+    threading.Timer(0.1, token.cancel).start()
+    results = capability.extract_with_agents(
+        ["header", "compliance"], file_path="a.pdf", cancellation=token
+    )
+
+    assert all(isinstance(result.error, CancelledError) for result in results.values())
+    deadline = time.monotonic() + 5
+    while scheduler.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert scheduler.pending() == 0
+
+
+def test_requires_agents_and_input(scheduler):
+    capability = make_capability(scheduler)
+    with pytest.raises(ValueError):
+        capability.submit_to_agents([], file_path="a.pdf")
+    with pytest.raises(ValueError):
+        capability.submit_to_agents(["header"])
+
+
+def test_close_fails_every_agent_job(api, scheduler):
+    api.indexed = False
+    capability = make_capability(scheduler)
+    jobs = capability.submit_to_agents(["header", "compliance"], file_path="a.pdf")
+    capability.close()
+
+    for job in jobs.values():
+        with pytest.raises(CancelledError):
+            job.result(timeout=5)
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from splore_sdk.core.api_client import APIClient
+from splore_sdk.extractions.async_extractions_service import AsyncExtractionService
+from splore_sdk.extractions.extractions_service import ExtractionService
+from splore_sdk.utils.pagination import is_last_page, iter_pages, page_items
+from tests.test_async_sdk import FakeAsyncClient
+
+
+def pages_of(total, size):
+    """Page fetcher over ``total`` numbered records, recording the pages asked for."""
+    requested = []
+
+    def fetch(page):
+        requested.append(page)
+        start = page * size
+        return {"content": list(range(start, min(start + size, total)))}
+
+    return fetch, requested
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_page_items_shapes():
+    assert page_items([1, 2]) == [1, 2]
+    assert page_items({"content": [1], "totalPages": 3}) == [1]
+    assert page_items({"data": {"items": [2]}}) == [2]
+    with pytest.raises(ValueError):
+        page_items({"status": "ok"})
+
+
+def test_is_last_page():
+    assert is_last_page({"content": [1]}, [1], size=2)
+    assert is_last_page({"content": [1, 2], "last": True}, [1, 2], size=2)
+    assert is_last_page({"content": [1, 2], "number": 4, "totalPages": 5}, [1, 2], size=2)
+    assert not is_last_page({"content": [1, 2], "number": 3, "totalPages": 5}, [1, 2], size=2)
+    assert not is_last_page([1, 2], [1, 2], size=2)
+    # the page's own metadata wins over its length
+    assert not is_last_page({"content": [1, 2], "number": 0, "totalPages": 5}, [1, 2], size=100)
+    assert not is_last_page({"content": [1], "last": False}, [1], size=2)
+
+
+def test_iter_extractions_reads_every_page():
+    client = MagicMock(spec=APIClient)
+    client.request.side_effect = lambda **kwargs: {
+        "content": [f"e{kwargs['params']['page']}"] * (2 if kwargs["params"]["page"] < 2 else 1)
+    }
+    service = ExtractionService(api_client=client, agent_id="agent_1")
+
+    extractions = service.iter_extractions(size=2, compact=False, prefetch=0)
+
+    assert list(extractions) == ["e0", "e0", "e1", "e1", "e2"]
+    assert [call.kwargs["params"] for call in client.request.call_args_list] == [
+        {"page": page, "size": 2, "compact": False} for page in range(3)
+    ]
+
+
+def test_prefetches_ahead_with_bounded_memory():
+    fetch, requested = pages_of(total=100, size=10)
+    pages = iter_pages(fetch, size=10, prefetch=3)
+
+    assert next(pages) == list(range(10))
+    # pages 1-3 are fetched while page 0 is processed, and no further
+    assert wait_for(lambda: len(requested) == 4)
+    time.sleep(0.05)
+    assert sorted(requested) == [0, 1, 2, 3]
+    pages.close()
+
+
+def test_stops_at_total_pages_without_extra_requests():
+    requested = []
+
+    def fetch(page):
+        requested.append(page)
+        return {"content": [page] * 5, "number": page, "totalPages": 3}
+
+    items = [item for page in iter_pages(fetch, size=5, prefetch=0) for item in page]
+
+    assert items == [0] * 5 + [1] * 5 + [2] * 5
+    assert requested == [0, 1, 2]
+
+
+def test_parallel_workers_fetch_a_page_range():
+    active, peak = [0], [0]
+    lock = threading.Lock()
+    fetch_records, _ = pages_of(total=60, size=10)
+
+    def fetch(page):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return fetch_records(page)
+
+    pages = list(iter_pages(fetch, size=10, start_page=1, end_page=5, prefetch=4, workers=4))
+
+    assert pages == [list(range(start, start + 10)) for start in (10, 20, 30, 40)]
+    assert peak[0] > 1
+
+
+def test_workers_fetch_ahead_without_prefetch():
+    fetch, requested = pages_of(total=100, size=10)
+    pages = iter_pages(fetch, size=10, prefetch=0, workers=3)
+
+    assert next(pages) == list(range(10))
+    assert wait_for(lambda: len(requested) == 4)
+    pages.close()
+
+
+def test_failed_page_raises_in_order():
+    def fetch(page):
+        if page == 1:
+            raise RuntimeError("page 1 failed")
+        return list(range(2))
+
+    pages = iter_pages(fetch, size=2, prefetch=2)
+    assert next(pages) == [0, 1]
+    with pytest.raises(RuntimeError, match="page 1"):
+        next(pages)
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        next(iter_pages(lambda page: [], size=0))
+    with pytest.raises(ValueError):
+        next(iter_pages(lambda page: [], size=1, prefetch=-1))
+
+
+def test_async_iter_extractions():
+    client = FakeAsyncClient(
+        responses=[{"content": ["a", "b"]}, {"content": ["c", "d"]}, {"content": ["e"]}]
+    )
+    service = AsyncExtractionService(client, agent_id="agent_1")
+
+    async def collect():
+        return [item async for item in service.iter_extractions(size=2, prefetch=0)]
+
+    assert asyncio.run(collect()) == ["a", "b", "c", "d", "e"]
+    assert [call["params"]["page"] for call in client.calls] == [0, 1, 2]
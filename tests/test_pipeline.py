@@ -0,0 +1,195 @@
+import os
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.poll_scheduler import PollScheduler
+from splore_sdk.utils.poll_strategy import FixedPollStrategy
+
+COMPLETED = {"file": {"status": "COMPLETED"}}
+
+
+@pytest.fixture
+def capability():
+    scheduler = PollScheduler(max_workers=2)
+    service = MagicMock()
+    service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    service.start.side_effect = lambda file_id, deadline: {"extractionId": f"ext_{file_id}"}
+    service.extracted_response_by_extraction_id.return_value = COMPLETED
+    uploader = MagicMock()
+    uploader.upload_file.side_effect = lambda file_path, **kwargs: f"id_{file_path}"
+    capability = ExtractionCapability(
+        MagicMock(),
+        "agent_1",
+        uploader,
+        poll_scheduler=scheduler,
+        poll_strategy=FixedPollStrategy(0.01),
+    )
+    capability.service = service
+    yield capability
+    scheduler.shutdown()
+
+
+def test_starts_do_not_wait_behind_uploads(capability):
+    first_started = threading.Event()
+
+    def upload(file_path, **kwargs):
+        # the second upload holds the only upload worker until file a is started
+        if file_path == "b.pdf":
+            assert first_started.wait(5)
+        return f"id_{file_path}"
+
+    def start(file_id, deadline):
+        if file_id == "id_a.pdf":
+            first_started.set()
+        return {"extractionId": f"ext_{file_id}"}
+
+    capability.file_uploader.upload_file.side_effect = upload
+    capability.service.start.side_effect = start
+
+    with capability.pipeline(upload_workers=1, start_workers=1) as pipeline:
+        jobs = [pipeline.submit(file_path=path) for path in ("a.pdf", "b.pdf")]
+        assert [job.result(timeout=5) for job in jobs] == [COMPLETED, COMPLETED]
+
+
+def test_uploads_continue_while_files_index(capability):
+    uploaded = []
+    capability.file_uploader.upload_file.side_effect = (
+        lambda file_path, **kwargs: uploaded.append(file_path) or f"id_{file_path}"
+    )
+    # nothing finishes indexing before every file is uploaded
+    capability.service.processing_status.side_effect = lambda file_id, deadline: {
+        "fileProcessingStatus": "INDEXED" if len(uploaded) == 3 else "PROCESSING"
+    }
+
+    with capability.pipeline(upload_workers=1) as pipeline:
+        results = list(pipeline.run(["a.pdf", "b.pdf", "c.pdf"]))
+
+    assert sorted(result.input for result in results) == ["a.pdf", "b.pdf", "c.pdf"]
+    assert all(result.ok for result in results)
+
+
+def test_submit_blocks_when_pipeline_is_full(capability):
+    finish = threading.Event()
+    capability.service.extracted_response_by_extraction_id.side_effect = (
+        lambda **kwargs: COMPLETED if finish.is_set() else {"file": {"status": "RUNNING"}}
+    )
+
+    with capability.pipeline(max_in_flight=2, upload_queue_size=0) as pipeline:
+        jobs = [pipeline.submit(file_path=path) for path in ("a.pdf", "b.pdf")]
+        third = []
+        producer = threading.Thread(
+            target=lambda: third.append(pipeline.submit(file_path="c.pdf"))
+        )
+        producer.start()
+        time.sleep(0.2)
+        assert producer.is_alive()
+        assert pipeline.in_flight() == 2
+
+        finish.set()
+        producer.join(5)
+        assert not producer.is_alive()
+        assert third[0].result(timeout=5) == COMPLETED
+        assert all(job.result(timeout=5) == COMPLETED for job in jobs)
+
+
+def test_run_reports_invalid_inputs_and_failures(capability):
+    def upload(file_path, **kwargs):
+        if file_path == "bad.pdf":
+            raise IOError("unreadable")
+        return f"id_{file_path}"
+
+    capability.file_uploader.upload_file.side_effect = upload
+
+    with capability.pipeline() as pipeline:
+        results = {str(result.input): result for result in pipeline.run(["a.pdf", "bad.pdf", 42])}
+
+    assert results["a.pdf"].result == COMPLETED
+    assert isinstance(results["bad.pdf"].error, IOError)
+    assert isinstance(results["42"].error, ValueError)
+
+
+def test_run_reports_unreadable_inputs(capability):
+    class UnmountedPath(os.PathLike):
+        def __fspath__(self):
+            raise OSError("share is not mounted")
+
+    with capability.pipeline() as pipeline:
+        results = list(pipeline.run([UnmountedPath(), "a.pdf"]))
+
+    assert sorted(type(result.error).__name__ for result in results) == ["NoneType", "OSError"]
+
+
+def test_closing_run_early_cancels_jobs(capability):
+    capability.service.extracted_response_by_extraction_id.side_effect = (
+        lambda extraction_id, **kwargs: COMPLETED
+        if extraction_id == "ext_id_a.pdf"
+        else {"file": {"status": "RUNNING"}}
+    )
+
+    with capability.pipeline(max_in_flight=2) as pipeline:
+        results = pipeline.run(["a.pdf", "b.pdf", "c.pdf", "d.pdf"])
+        assert next(results).input == "a.pdf"
+        while pipeline.in_flight() < 2:
+            time.sleep(0.01)
+        results.close()
+
+        deadline = time.monotonic() + 5
+        while pipeline.in_flight() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pipeline.in_flight() == 0
+    uploaded = [kwargs["file_path"] for _, kwargs in capability.file_uploader.upload_file.call_args_list]
+    assert "d.pdf" not in uploaded
+
+
+def test_invalid_pipeline_options(capability):
+    with pytest.raises(ValueError):
+        capability.pipeline(upload_workers=0)
+    with pytest.raises(ValueError):
+        capability.pipeline(upload_queue_size=-1)
+    with pytest.raises(ValueError):
+        capability.pipeline(poll_workers=0)
+
+
+def test_close_waits_for_files_in_flight(capability):
+    responses = iter([{"file": {"status": "RUNNING"}}] * 3)
+    capability.service.extracted_response_by_extraction_id.side_effect = (
+        lambda **kwargs: next(responses, COMPLETED)
+    )
+
+    pipeline = capability.pipeline()
+    job = pipeline.submit(file_path="a.pdf")
+    pipeline.close()
+
+    assert job.done() and job.result() == COMPLETED
+    with pytest.raises(RuntimeError):
+        pipeline.submit(file_path="b.pdf")
+
+
+def test_leaving_on_error_cancels_files_in_flight(capability):
+    capability.service.extracted_response_by_extraction_id.return_value = {
+        "file": {"status": "RUNNING"}
+    }
+
+    with pytest.raises(KeyError):
+        with capability.pipeline() as pipeline:
+            job = pipeline.submit(file_path="a.pdf")
+            raise KeyError("stop")
+
+    assert job.cancelled()
+    assert pipeline.in_flight() == 0
+
+
+def test_poll_workers_poll_on_the_pipeline_scheduler(capability):
+    capability.poll_scheduler = MagicMock()
+
+    with capability.pipeline(poll_workers=1) as pipeline:
+        scheduler = pipeline._poll_scheduler
+        assert pipeline.submit(file_path="a.pdf").result(timeout=5) == COMPLETED
+
+    capability.poll_scheduler.submit.assert_not_called()
+    assert scheduler.max_workers == 1 and scheduler.pending() == 0
+    with pytest.raises(RuntimeError):
+        scheduler.submit(lambda: None, condition=bool, max_timeout=1)
@@ -0,0 +1,191 @@
+import threading
+import time
+import pytest
+from concurrent.futures import CancelledError, wait
+from unittest.mock import MagicMock
+
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.poll_scheduler import PollScheduler
+from splore_sdk.utils.poll_strategy import FixedPollStrategy
+
+FAST = dict(min_poll_interval=0.01, max_poll_interval=0.02)
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = PollScheduler(max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_submit_resolves_when_condition_is_met(scheduler):
+    responses = iter(["PENDING", "PENDING", "INDEXED"])
+    poll = MagicMock(side_effect=lambda: next(responses))
+
+    future = scheduler.submit(
+        poll, condition=lambda r: r == "INDEXED", max_timeout=5, **FAST
+    )
+
+    assert future.result(timeout=5) == "INDEXED"
+    assert poll.call_count == 3
+    assert scheduler.pending() == 0
+
+
+def test_submit_times_out(scheduler):
+    future = scheduler.submit(
+        lambda: "PENDING", condition=lambda r: False, max_timeout=0.05, **FAST
+    )
+    with pytest.raises(TimeoutError):
+        future.result(timeout=5)
+
+
+def test_poll_exception_fails_future(scheduler):
+    def poll():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        scheduler.submit(poll, max_timeout=5, **FAST).result(timeout=5)
+
+
+def test_cancel_stops_polling(scheduler):
+    calls = []
+    future = scheduler.submit(
+        lambda: calls.append(1),
+        condition=lambda r: False,
+        max_timeout=5,
+        min_poll_interval=0.2,
+        max_poll_interval=0.2,
+    )
+    while not calls:
+        time.sleep(0.01)
+    assert future.cancel()
+    with pytest.raises(CancelledError):
+        future.result(timeout=1)
+
+
+def test_many_polls_share_one_scheduler_thread(scheduler):
+    counts = [0] * 200
+    threads = set()
+    lock = threading.Lock()
+
+    def make_poll(i):
+        def poll():
+            with lock:
+                threads.add(threading.current_thread().name)
+                counts[i] += 1
+                return counts[i]
+
+        return poll
+
+    futures = [
+        scheduler.submit(
+            make_poll(i), condition=lambda n: n >= 3, max_timeout=10, **FAST
+        )
+        for i in range(200)
+    ]
+    done, not_done = wait(futures, timeout=10)
+
+    assert not not_done
+    assert all(future.result() == 3 for future in futures)
+    # 200 pending polls are served by the scheduler's two poll workers
+    assert len(threads) <= 2
+
+
+def test_shutdown_cancels_pending_polls():
+    scheduler = PollScheduler()
+    future = scheduler.submit(
+        lambda: None,
+        condition=lambda r: False,
+        max_timeout=60,
+        min_poll_interval=30,
+        max_poll_interval=30,
+    )
+    scheduler.shutdown()
+    assert future.cancelled()
+    with pytest.raises(RuntimeError):
+        scheduler.submit(lambda: None)
+
+
+def test_shutdown_while_a_poll_is_handed_out_keeps_the_timer_thread():
+    scheduler = PollScheduler()
+    scheduler.submit(
+        lambda: None,
+        condition=lambda r: False,
+        max_timeout=60,
+        strategy=FixedPollStrategy(30),
+    )
+    executor_submit = scheduler._executor.submit
+    errors = []
+
+    def submit_during_shutdown(*args):
+        shutdown = threading.Thread(target=scheduler.shutdown, kwargs={"wait": False})
+        shutdown.start()
+        shutdown.join(0.1)
+        try:
+            return executor_submit(*args)
+        except RuntimeError as e:
+            errors.append(e)
+            raise
+
+    scheduler._executor.submit = submit_during_shutdown
+    timer = scheduler._thread
+    scheduler.submit(lambda: "done", max_timeout=60, strategy=FixedPollStrategy(0.01))
+    timer.join(5)
+
+    assert not timer.is_alive()
+    assert errors == []
+
+
+def test_extraction_capability_polls_through_scheduler(scheduler):
+    service = MagicMock()
+    service.processing_status.side_effect = [
+        {"fileProcessingStatus": "PROCESSING"},
+        {"fileProcessingStatus": "INDEXED"},
+    ]
+    service.start.return_value = {"extractionId": "ext_1"}
+    service.extracted_response_by_extraction_id.return_value = {
+        "file": {"status": "COMPLETED"}
+    }
+    uploader = MagicMock()
+    uploader.upload_file.return_value = "file_1"
+    capability = ExtractionCapability(
+        MagicMock(),
+        "agent_1",
+        uploader,
+        poll_scheduler=scheduler,
+        poll_strategy=FixedPollStrategy(0.01),
+    )
+    capability.service = service
+    original_submit = scheduler.submit
+    timeouts = []
+
+    def fast_submit(poll, **kwargs):
+        timeouts.append(kwargs["max_timeout"])
+        return original_submit(poll, **kwargs)
+
+    scheduler.submit = fast_submit
+
+    result = capability.extract(file_path="invoice.pdf")
+
+    assert result == {"file": {"status": "COMPLETED"}}
+    assert timeouts == [1200, 1200]
+    assert service.processing_status.call_count == 2
+
+
+def test_strategy_replaces_interval_schedule(scheduler):
+    calls = []
+
+    def poll():
+        calls.append(time.monotonic())
+        return len(calls)
+
+    future = scheduler.submit(
+        poll,
+        condition=lambda n: n == 3,
+        max_timeout=5,
+        min_poll_interval=30,
+        max_poll_interval=300,
+        strategy=FixedPollStrategy(0.01, jitter_fraction=0),
+    )
+
+    assert future.result(timeout=2) == 3
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from splore_sdk.utils.decorators import async_poll_with_timeout, poll_with_timeout
+from splore_sdk.utils.poll_strategy import (
+    EtaPollStrategy,
+    ExponentialPollStrategy,
+    FixedPollStrategy,
+    InterleavedPollStrategy,
+    PollStrategy,
+    interleave_intervals,
+)
+
+
+def test_interleaved_strategy_matches_legacy_schedule():
+    strategy = InterleavedPollStrategy(30, 300, 2, jitter_fraction=0)
+    intervals = interleave_intervals(30, 300, 2)
+
+    attempts = range(1, len(intervals) + 3)
+    assert [strategy.interval(attempt, 0) for attempt in attempts] == (
+        intervals + [intervals[-1]] * 2
+    )
+
+
+def test_exponential_strategy_starts_sub_second():
+    strategy = ExponentialPollStrategy(initial_interval=0.5, max_interval=30)
+
+    assert strategy.intervals == [0.5, 1, 2, 4, 8, 16, 30]
+    assert strategy.interval(100, 0) == 30
+
+
+def test_fixed_strategy_and_jitter_bounds():
+    strategy = FixedPollStrategy(10, jitter_fraction=0.1)
+
+    assert all(9 <= strategy.next_sleep(attempt, 0) <= 11 for attempt in range(1, 20))
+    with pytest.raises(ValueError):
+        FixedPollStrategy(0)
+
+
+def test_strategies_must_implement_interval():
+    with pytest.raises(TypeError):
+        PollStrategy()
+
+    class Constant(PollStrategy):
+        def interval(self, attempt, elapsed):
+            return 2
+
+    assert Constant(jitter_fraction=0).next_sleep(1, 0) == 2
+
+
+def test_eta_strategy_closes_in_then_backs_off():
+    strategy = EtaPollStrategy(eta=20, min_interval=0.5, max_interval=60)
+
+    assert strategy.interval(1, 0) == 10
+    assert strategy.interval(2, 10) == 5
+    assert strategy.interval(3, 19.8) == 0.5
+    assert strategy.interval(4, 21) == 1
+    assert strategy.interval(5, 24) == 4
+    assert strategy.interval(6, 500) == 60
+
+
+def test_decorator_builds_schedule_once():
+    with patch(
+        "splore_sdk.utils.decorators.poll_with_timeout.InterleavedPollStrategy"
+    ) as MockStrategy:
+        MockStrategy.return_value.first_delay.return_value = 0
+        MockStrategy.return_value.next_sleep.return_value = 0
+        results = iter([None, None, 1, None, 2])
+
+        @poll_with_timeout(max_timeout=5)
+        def poll():
+            return next(results)
+
+        assert poll() == 1
+        assert poll() == 2
+    MockStrategy.assert_called_once()
+
+
+def test_decorators_follow_strategy():
+    strategy = FixedPollStrategy(0.01, jitter_fraction=0)
+    results = iter([None, None, "done"])
+
+    @poll_with_timeout(max_timeout=5, min_poll_interval=30, strategy=strategy)
+    def poll():
+        return next(results)
+
+    assert poll() == "done"
+
+    async_results = iter([None, "done"])
+
+    @async_poll_with_timeout(max_timeout=5, min_poll_interval=30, strategy=strategy)
+    async def async_poll():
+        return next(async_results)
+
+    assert asyncio.run(async_poll()) == "done"
@@ -0,0 +1,97 @@
+import threading
+import time
+import pytest
+
+from splore_sdk.utils.priority_executor import PriorityExecutor
+
+
+def blocked_executor(**options):
+    """A one worker executor kept busy until the returned event is set."""
+    executor = PriorityExecutor(max_workers=1, **options)
+    release, started = threading.Event(), threading.Event()
+    executor.submit(lambda: started.set() or release.wait(5))
+    started.wait(5)
+    return executor, release
+
+
+def test_runs_lowest_priority_first():
+    executor, release = blocked_executor(aging_rate=0)
+    order = []
+    for priority in (5, 1, 3):
+        executor.submit_prioritized(priority, order.append, priority)
+    release.set()
+    executor.shutdown()
+
+    assert order == [1, 3, 5]
+
+
+def test_aging_lets_waiting_tasks_overtake_newer_small_ones():
+    executor, release = blocked_executor(aging_rate=100)
+    order = []
+    executor.submit_prioritized(10, order.append, "large")
+    time.sleep(0.2)  # the large task has aged by 20
+    executor.submit_prioritized(1, order.append, "small")
+    release.set()
+    executor.shutdown()
+
+    assert order == ["large", "small"]
+
+
+def test_plain_submit_skips_the_queue():
+    executor, release = blocked_executor()
+    order = []
+    executor.submit_prioritized(-100, order.append, "prioritized")
+    executor.submit(order.append, "plain")
+    release.set()
+    executor.shutdown()
+
+    assert order == ["plain", "prioritized"]
+
+
+def test_futures_carry_results_and_errors():
+    with PriorityExecutor(max_workers=2) as executor:
+        ok = executor.submit_prioritized(1, lambda: 42)
+        failed = executor.submit(lambda: 1 / 0)
+        assert ok.result(timeout=5) == 42
+        with pytest.raises(ZeroDivisionError):
+            failed.result(timeout=5)
+
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+def test_cancelled_tasks_are_skipped():
+    executor, release = blocked_executor()
+    ran = []
+    future = executor.submit_prioritized(1, ran.append, "cancelled")
+    assert executor.queued() == 1
+    assert future.cancel()
+    release.set()
+    executor.shutdown()
+
+    assert ran == []
+
+
+def test_bounds_workers():
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def task():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+
+    with PriorityExecutor(max_workers=3) as executor:
+        futures = [executor.submit_prioritized(i, task) for i in range(9)]
+    assert all(future.done() for future in futures)
+    assert peak[0] == 3
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        PriorityExecutor(max_workers=0)
+    with pytest.raises(ValueError):
+        PriorityExecutor(max_workers=1, aging_rate=-1)
@@ -0,0 +1,140 @@
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from splore_sdk.core.api_client import APIClient
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.core.exceptions import DeadlineExceededError
+from splore_sdk.core.rate_limiter import (
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+    EXTRACTION_START,
+    EXTRACTION_STATUS,
+    SEARCH,
+    AGENTS,
+    DEFAULT,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("splore_sdk.core.rate_limiter.time.monotonic", fake):
+        yield fake
+
+
+@pytest.mark.parametrize(
+    "method, endpoint, family",
+    [
+        ("GET", "api/rest/v2/extractions/status", EXTRACTION_STATUS),
+        ("GET", "api/rest/v2/extractions/ext_1", EXTRACTION_STATUS),
+        ("POST", "api/rest/v2/extractions/start", EXTRACTION_START),
+        ("POST", "api/rest/v2/extractions/ext_1", EXTRACTION_START),
+        ("POST", "api/rest/v2/extractions/files", DEFAULT),
+        ("POST", "api/rest/v2/search", SEARCH),
+        ("GET", "api/rest/v2/search/history", SEARCH),
+        ("DELETE", "api/rest/v2/agents/agent_1", AGENTS),
+        ("GET", "api/rest/v2/authenticate", DEFAULT),
+    ],
+)
+def test_family(method, endpoint, family):
+    assert RateLimiter.family(method, endpoint) == family
+
+
+def test_bucket_allows_burst_then_spaces_requests(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+    clock.now += 1.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_bucket_backs_off_on_throttle_and_recovers(clock):
+    bucket = TokenBucket(rate=4, burst=4, increase_fraction=0.25)
+    bucket.on_throttled(retry_after=2)
+    assert bucket.rate == 2
+    assert bucket.reserve() == pytest.approx(2.0)
+
+    for _ in range(2):
+        bucket.on_success()
+    assert bucket.rate == 4
+    bucket.on_success()
+    assert bucket.rate == 4
+
+
+def test_unconfigured_families_fall_back_to_default(clock):
+    limiter = RateLimiter({DEFAULT: RateLimit(1, 1), SEARCH: RateLimit(5, 5)})
+    assert limiter.bucket(AGENTS) is limiter.bucket(DEFAULT)
+    assert limiter.bucket(SEARCH) is not limiter.bucket(DEFAULT)
+    assert RateLimiter({SEARCH: RateLimit(5, 5)}).bucket(AGENTS) is None
+
+
+def test_acquire_refunds_when_wait_exceeds_deadline(clock):
+    limiter = RateLimiter({DEFAULT: RateLimit(rate=0.1, burst=1)})
+    assert limiter.acquire("GET", "api/rest/v2/authenticate") == 0.0
+
+    with pytest.raises(DeadlineExceededError):
+        limiter.acquire("GET", "api/rest/v2/authenticate", deadline=Deadline(1))
+    # the refused reservation did not consume a token
+    assert limiter.bucket(DEFAULT).tokens == pytest.approx(0.0)
+
+
+def test_shared_limiter_per_base_id():
+    first = RateLimiter.shared("base_shared_test", {DEFAULT: RateLimit(5, 5)})
+    second = RateLimiter.shared("base_shared_test")
+    other = RateLimiter.shared("base_other_test")
+    assert first is second
+    assert first is not other
+
+
+def test_api_clients_of_same_base_share_limiter():
+    limits = {DEFAULT: RateLimit(100, 100)}
+    first = APIClient(api_key="key", base_id="base_client_test", rate_limits=limits)
+    second = APIClient(api_key="key", base_id="base_client_test", rate_limits=limits)
+    assert first.rate_limiter is second.rate_limiter
+    assert APIClient(api_key="key", base_id="base_client_test").rate_limiter is None
+
+
+def test_api_client_reports_throttling_to_limiter():
+    limiter = MagicMock()
+    client = APIClient(api_key="key", base_id="base_1", rate_limiter=limiter)
+    response = MagicMock(status_code=429, headers={"Retry-After": "4"})
+    response.raise_for_status.side_effect = None
+    response.json.return_value = {}
+    session = MagicMock()
+    session.request.return_value = response
+    client.set_session(session)
+
+    client.request(method="GET", endpoint="api/rest/v2/extractions/status")
+
+    limiter.acquire.assert_called_once_with(
+        "GET", "api/rest/v2/extractions/status", None
+    )
+    limiter.on_response.assert_called_once_with(
+        "GET", "api/rest/v2/extractions/status", 429, 4.0
+    )
+
+
+def test_bucket_is_thread_safe(clock):
+    bucket = TokenBucket(rate=1, burst=100)
+
+    def drain():
+        for _ in range(25):
+            bucket.reserve()
+
+    threads = [threading.Thread(target=drain) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert bucket.tokens == pytest.approx(0.0)
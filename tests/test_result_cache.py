@@ -0,0 +1,162 @@
+import os
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from splore_sdk.core.deadline import Deadline
+from splore_sdk.extractions.extractions_service import ExtractionService
+from splore_sdk.sdk import ExtractionCapability
+from splore_sdk.utils.job_journal import JournalEntry
+from splore_sdk.utils.result_cache import (
+    DiskResultCache,
+    MemoryResultCache,
+    ResultCache,
+    cache_key,
+)
+
+COMPLETED = {"file": {"status": "COMPLETED"}, "data": "x" * 1000}
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryResultCache(max_bytes=2500)
+    cache.set("a", COMPLETED)
+    cache.set("b", COMPLETED)
+    cache.get("a")
+    cache.set("c", COMPLETED)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == COMPLETED and cache.get("c") == COMPLETED
+    assert cache.size <= 2500
+
+
+def test_memory_cache_returns_copies():
+    cache = MemoryResultCache()
+    cache.set("a", {"file": {"status": "COMPLETED"}})
+    cache.get("a")["file"]["status"] = "changed"
+
+    assert cache.get("a")["file"]["status"] == "COMPLETED"
+
+
+def test_disk_cache_is_compressed_and_shared(tmp_path):
+    DiskResultCache(str(tmp_path)).set("a", COMPLETED)
+
+    cache = DiskResultCache(str(tmp_path))
+    assert cache.get("a") == COMPLETED
+    assert 0 < cache.size < 1000
+    assert cache.get("missing") is None
+
+
+def test_disk_cache_evicts_least_recently_read(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+    for key in ("a", "b", "c"):
+        cache.set(key, COMPLETED)
+    now = os.path.getmtime(cache._path("c"))
+    os.utime(cache._path("a"), (now - 20, now - 20))
+    os.utime(cache._path("b"), (now - 10, now - 10))
+    cache.get("a")
+    cache.max_bytes = cache.size
+
+    cache.set("d", COMPLETED)
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+
+
+def test_disk_cache_drops_corrupted_files(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+    cache.set("a", COMPLETED)
+    with open(cache._path("a"), "wb") as file:
+        file.write(b"not gzip")
+
+    assert cache.get("a") is None
+    assert not os.path.exists(cache._path("a"))
+
+
+def test_result_cache_is_abstract():
+    with pytest.raises(TypeError):
+        ResultCache()
+
+
+@pytest.mark.parametrize("make_cache", [MemoryResultCache, DiskResultCache])
+def test_entries_expire_after_their_ttl(make_cache, tmp_path):
+    cache = make_cache() if make_cache is MemoryResultCache else make_cache(str(tmp_path))
+    cache.set("a", COMPLETED, ttl=60)
+    cache.set("b", COMPLETED)
+
+    with patch("splore_sdk.utils.result_cache.time.time", return_value=time.time() + 61):
+        assert cache.get("a") is None
+        assert cache.get("b") == COMPLETED
+    assert cache.get("a") is None
+    with pytest.raises(ValueError):
+        cache.set("c", COMPLETED, ttl=0)
+
+
+def test_service_caches_only_completed_responses():
+    client = MagicMock(agent_id="agent_1")
+    client.request.side_effect = [
+        {"file": {"status": "PROCESSING"}},
+        COMPLETED,
+        dict(COMPLETED, data="v2"),
+    ]
+    service = ExtractionService(client, "agent_1", result_cache=MemoryResultCache())
+
+    assert service.extracted_response_by_extraction_id("ext_1")["file"]["status"] == "PROCESSING"
+    assert service.extracted_response_by_extraction_id("ext_1") == COMPLETED
+    assert service.extracted_response_by_extraction_id("ext_1") == COMPLETED
+    assert service.extracted_response_by_extraction_id("ext_1", version=2)["data"] == "v2"
+    assert service.extracted_response_by_extraction_id("ext_1", version=2)["data"] == "v2"
+    assert client.request.call_count == 3
+
+
+@pytest.fixture
+def capability():
+    capability = ExtractionCapability(
+        MagicMock(base_id="base_1"),
+        "agent_1",
+        MagicMock(),
+        result_cache=MemoryResultCache(),
+    )
+    capability.service = MagicMock()
+    capability.service.processing_status.return_value = {"fileProcessingStatus": "INDEXED"}
+    capability.service.start.return_value = {"extractionId": "ext_1"}
+    capability.service.extracted_response_by_extraction_id.return_value = COMPLETED
+    capability.file_uploader.upload_file.return_value = "file_1"
+    yield capability
+    capability.close()
+
+
+def test_extract_reuses_cached_result_of_identical_content(capability):
+    assert capability.extract(file_stream=b"invoice") == COMPLETED
+    assert capability.extract(file_stream=b"invoice") == COMPLETED
+    assert capability.extract(file_stream=b"other invoice") == COMPLETED
+
+    assert capability.file_uploader.upload_file.call_count == 2
+    assert capability.service.start.call_count == 2
+
+
+def test_content_results_expire_after_result_cache_ttl(capability):
+    capability.result_cache_ttl = 60
+    capability.extract(file_stream=b"invoice")
+
+    with patch("splore_sdk.utils.result_cache.time.time", return_value=time.time() + 61):
+        capability.extract(file_stream=b"invoice")
+
+    assert capability.service.start.call_count == 2
+
+
+def test_result_cache_ttl_must_be_positive():
+    with pytest.raises(ValueError):
+        ExtractionCapability(MagicMock(), "agent_1", MagicMock(), result_cache_ttl=0)
+
+
+def test_resumed_jobs_do_not_cache_without_a_content_hash(capability):
+    entry = JournalEntry(
+        "job_1", "agent_1", "base_1", None, "EXTRACTING", "file_1", "ext_1", 1, None, 0.0
+    )
+    job = capability._submit(
+        None, None, 1200, Deadline(), capability._get_executor(), resume=entry
+    )
+
+    assert job.result(timeout=5) == COMPLETED
+    assert capability.result_cache.get(cache_key("content", "agent_1", None)) is None
+
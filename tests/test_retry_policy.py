@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import patch
+
+from splore_sdk.core.retry_policy import RetryPolicy
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(max_retries=3, backoff_factor=0.5, jitter_fraction=0)
+
+
+def test_client_errors_are_not_retried(policy):
+    for status in (400, 401, 403, 404, 422):
+        assert not policy.should_retry(1, "GET", status_code=status)
+
+
+def test_server_errors_are_retried_for_idempotent_methods(policy):
+    assert policy.should_retry(1, "GET", status_code=503)
+    assert policy.should_retry(1, "DELETE", status_code=500)
+    assert policy.should_retry(1, "GET", status_code=None)
+
+
+def test_post_requires_idempotency_key(policy):
+    assert not policy.should_retry(1, "POST", headers={}, status_code=502)
+    assert policy.should_retry(
+        1, "POST", headers={"Idempotency-Key": "abc"}, status_code=502
+    )
+
+
+def test_throttled_post_is_retried(policy):
+    assert policy.should_retry(1, "POST", headers={}, status_code=429)
+
+
+def test_retries_stop_after_max_retries(policy):
+    assert policy.should_retry(3, "GET", status_code=500)
+    assert not policy.should_retry(4, "GET", status_code=500)
+
+
+def test_backoff_is_exponential_and_capped(policy):
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3)] == [0.5, 1.0, 2.0]
+    assert policy.backoff(10) == policy.max_backoff
+
+
+def test_retry_after_seconds_overrides_backoff(policy):
+    assert policy.sleep_time(1, 429, {"Retry-After": "7"}) == 7.0
+    assert policy.sleep_time(1, 503, {"Retry-After": "1000"}) == policy.max_retry_after
+    # Retry-After is only meaningful on 429/503
+    assert policy.sleep_time(1, 500, {"Retry-After": "7"}) == 0.5
+
+
+def test_retry_after_http_date(policy):
+    with patch("splore_sdk.core.retry_policy.time.time", return_value=1_700_000_000):
+        seconds = policy.retry_after(429, {"Retry-After": "Tue, 14 Nov 2023 22:13:30 GMT"})
+    assert seconds == pytest.approx(10)
+
+
+def test_invalid_retry_after_falls_back_to_backoff(policy):
+    assert policy.sleep_time(2, 429, {"Retry-After": "soon"}) == 1.0
@@ -4,6 +4,7 @@ from unittest.mock import patch, MagicMock
 
 # Import from the SDK module so that our patch targets are effective.
 from splore_sdk.sdk import BaseSDK, SploreSDK, AgentSDK
+from splore_sdk.utils.poll_scheduler import PollScheduler
 
 # ----------------------
 # Fixtures to patch dependencies in the SDK module
@@ -158,6 +159,71 @@ class TestBaseSDK:
         # The client attribute should be the patched instance.
         assert sdk.client == mock_api_client
 
+    def test_close_closes_client(self, mock_api_client, mock_file_uploader):
+        sdk = BaseSDK("test_api_key", "base_1")
+        sdk.close()
+        mock_api_client.close.assert_called_once()
+
+    def test_context_manager_closes_client(self, mock_api_client, mock_file_uploader):
+        with BaseSDK("test_api_key", "base_1") as sdk:
+            assert sdk.client == mock_api_client
+        mock_api_client.close.assert_called_once()
+
+    def test_client_options_forwarded(self, mock_file_uploader):
+        with patch("splore_sdk.sdk.APIClient") as MockAPIClient:
+            BaseSDK("test_api_key", "base_1", pool_maxsize=32)
+            MockAPIClient.assert_called_once_with(
+                api_key="test_api_key", base_id="base_1", agent_id=None, pool_maxsize=32
+            )
+
+    def test_upload_options_forwarded_to_file_uploader(self):
+        with patch("splore_sdk.sdk.APIClient") as MockAPIClient, patch(
+            "splore_sdk.sdk.FileUploader"
+        ) as MockFileUploader:
+            BaseSDK("test_api_key", "base_1", parallel_uploads=4, pool_maxsize=32)
+            MockAPIClient.assert_called_once_with(
+                api_key="test_api_key", base_id="base_1", agent_id=None, pool_maxsize=32
+            )
+            MockFileUploader.assert_called_once_with(
+                api_key="test_api_key",
+                base_id="base_1",
+                user_id=None,
+                parallel_uploads=4,
+            )
+
+    def test_extraction_options_forwarded_to_capability(
+        self, mock_api_client, mock_file_uploader
+    ):
+        index = MagicMock()
+        with patch("splore_sdk.sdk.APIClient") as MockAPIClient:
+            agent = AgentSDK("test_api_key", "base_1", "agent_1", dedup_index=index)
+            MockAPIClient.assert_called_once_with(
+                api_key="test_api_key", base_id="base_1", agent_id="agent_1"
+            )
+        assert agent.extraction.dedup_index is index
+
+    def test_poll_options_forwarded_to_capability(
+        self, mock_api_client, mock_file_uploader
+    ):
+        scheduler = PollScheduler(max_workers=1)
+        agent = AgentSDK("test_api_key", "base_1", "agent_1", poll_scheduler=scheduler)
+        assert agent.extraction.poll_scheduler is scheduler
+
+        agent = AgentSDK("test_api_key", "base_1", "agent_1", poll_workers=8)
+        owned = agent.extraction.poll_scheduler
+        assert owned is not PollScheduler.shared() and owned.max_workers == 8
+        agent.close()
+        with pytest.raises(RuntimeError):
+            owned.submit(lambda: None)
+
+        assert AgentSDK("test_api_key", "base_1", "agent_1").extraction.poll_scheduler is (
+            PollScheduler.shared()
+        )
+        with pytest.raises(ValueError):
+            AgentSDK(
+                "test_api_key", "base_1", "agent_1", poll_scheduler=scheduler, poll_workers=8
+            )
+
 
 # ----------------------
 # Tests for SploreSDK
@@ -211,6 +277,19 @@ class TestSploreSDK:
             )
             assert agent_instance == dummy_agent
 
+    def test_init_agent_forwards_client_options(
+        self, mock_api_client, mock_file_uploader, mock_agent_service
+    ):
+        sdk = SploreSDK("test_api_key", "base_1", pool_maxsize=32)
+        with patch("splore_sdk.sdk.AgentSDK") as MockAgentSDK:
+            sdk.init_agent("agent_123")
+            MockAgentSDK.assert_called_once_with(
+                api_key="test_api_key",
+                base_id="base_1",
+                agent_id="agent_123",
+                pool_maxsize=32,
+            )
+
 
 # ----------------------
 # Tests for AgentSDK
@@ -264,7 +343,13 @@ class TestAgentSDK:
     ):
         result = agent_sdk_instance.extract(file_path="dummy.txt")
         mock_capabilities["extraction"].extract.assert_called_once_with(
-            file_path="dummy.txt", file_stream=None, max_poll_timeout=1200
+            file_path="dummy.txt",
+            file_stream=None,
+            max_poll_timeout=1200,
+            deadline=None,
+            poll_strategy=None,
+            cancellation=None,
+            timeout=None,
         )
         assert result == {"data": "extracted_content"}
 
@@ -274,7 +359,13 @@ class TestAgentSDK:
         fake_stream = MagicMock()
         result = agent_sdk_instance.extract(file_stream=fake_stream)
         mock_capabilities["extraction"].extract.assert_called_once_with(
-            file_path=None, file_stream=fake_stream, max_poll_timeout=1200
+            file_path=None,
+            file_stream=fake_stream,
+            max_poll_timeout=1200,
+            deadline=None,
+            poll_strategy=None,
+            cancellation=None,
+            timeout=None,
         )
         assert result == {"data": "extracted_content"}
 
@@ -0,0 +1,43 @@
+import os
+import time
+from io import BytesIO
+from unittest.mock import patch
+
+from splore_sdk.utils.upload_storage import SQLiteURLStorage, UploadFingerprint
+
+
+def test_storage_round_trip_across_instances(tmp_path):
+    path = str(tmp_path / "state" / "uploads.db")
+    SQLiteURLStorage(path).set_item("key", "https://tus/files/1")
+
+    storage = SQLiteURLStorage(path)
+    assert storage.get_item("key") == "https://tus/files/1"
+    storage.remove_item("key")
+    assert storage.get_item("key") is None
+
+
+def test_storing_none_removes_the_key(tmp_path):
+    storage = SQLiteURLStorage(str(tmp_path / "uploads.db"))
+    storage.set_item("key", "https://tus/files/1")
+    storage.set_item("key", None)
+    assert storage.get_item("key") is None
+
+
+def test_urls_older_than_max_age_are_ignored(tmp_path):
+    storage = SQLiteURLStorage(str(tmp_path / "uploads.db"), max_age=60)
+    storage.set_item("key", "https://tus/files/1")
+
+    with patch("splore_sdk.utils.upload_storage.time.time", return_value=time.time() + 61):
+        assert storage.get_item("key") is None
+    assert storage.get_item("key") is None
+
+
+def test_fingerprint_covers_whole_content_and_namespace():
+    head, tail = os.urandom(65536), os.urandom(65536)
+    first = BytesIO(head + b"a" * 100 + tail)
+    second = BytesIO(head + b"b" * 100 + tail)
+
+    fingerprint = UploadFingerprint("base_1").get_fingerprint(first)
+    assert fingerprint != UploadFingerprint("base_1").get_fingerprint(second)
+    assert fingerprint == UploadFingerprint("base_1").get_fingerprint(first)
+    assert fingerprint != UploadFingerprint("base_2").get_fingerprint(first)